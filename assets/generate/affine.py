@@ -0,0 +1,195 @@
+"""
+Batched Affine Transforms
+
+Packs the coordinates of many PathData objects into one NumPy buffer so a
+whole glyph set can be transformed with a single array operation.
+
+Matrices are 2x3 affine matrices in SVG order:
+
+    [[a, c, e],
+     [b, d, f]]
+
+mapping (x, y) to (a*x + c*y + e, b*x + d*y + f).
+"""
+
+import math
+from array import array
+from collections.abc import Mapping
+
+import numpy as np
+
+from assets.generate.pathdata import PathData
+
+# =============================================================================
+# MATRIX CONSTRUCTORS
+# =============================================================================
+
+
+def identity() -> np.ndarray:
+    """Identity affine matrix."""
+    return np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+
+
+def translation(tx: float, ty: float) -> np.ndarray:
+    """Affine matrix that translates by (tx, ty)."""
+    return np.array([[1.0, 0.0, tx], [0.0, 1.0, ty]])
+
+
+def scaling(sx: float, sy: float | None = None) -> np.ndarray:
+    """Affine matrix that scales about the origin (uniformly if sy is None)."""
+    return np.array([[sx, 0.0, 0.0], [0.0, sx if sy is None else sy, 0.0]])
+
+
+def rotation(degrees: float) -> np.ndarray:
+    """Affine matrix equivalent to SVG rotate(degrees) about the origin."""
+    rad = math.radians(degrees)
+    cos, sin = math.cos(rad), math.sin(rad)
+    return np.array([[cos, -sin, 0.0], [sin, cos, 0.0]])
+
+
+def skewing(x_degrees: float = 0.0, y_degrees: float = 0.0) -> np.ndarray:
+    """Affine matrix equivalent to SVG skewX(x_degrees) then skewY(y_degrees)."""
+    return compose(
+        np.array([[1.0, math.tan(math.radians(x_degrees)), 0.0], [0.0, 1.0, 0.0]]),
+        np.array([[1.0, 0.0, 0.0], [math.tan(math.radians(y_degrees)), 1.0, 0.0]]),
+    )
+
+
+def compose(*matrices: np.ndarray) -> np.ndarray:
+    """
+    Compose affine matrices, applying the first one first.
+
+    compose(scaling(2), translation(5, 5)) scales, then translates.
+    """
+    result = np.eye(3)
+    for matrix in matrices:
+        result = np.vstack([matrix, [0.0, 0.0, 1.0]]) @ result
+    return result[:2]
+
+
+def svg_coefficients(matrix: np.ndarray) -> tuple[float, ...]:
+    """The matrix as SVG matrix(a, b, c, d, e, f) coefficients."""
+    (a, c, e), (b, d, f) = matrix.tolist()
+    return (a, b, c, d, e, f)
+
+
+# =============================================================================
+# GEOMETRY BATCH
+# =============================================================================
+
+
+class GeometryBatch:
+    """
+    A named set of paths whose points share one (n, 2) float64 buffer.
+
+    Attributes:
+        names: Path names in buffer order
+        commands: Command bytes for each path
+        points: All points of all paths, shape (n, 2)
+        offsets: Point offsets; path i owns points[offsets[i]:offsets[i + 1]]
+    """
+
+    __slots__ = ("commands", "names", "offsets", "points")
+
+    def __init__(
+        self,
+        names: tuple[str, ...],
+        commands: tuple[bytes, ...],
+        points: np.ndarray,
+        offsets: np.ndarray,
+    ) -> None:
+        self.names = names
+        self.commands = commands
+        self.points = points
+        self.offsets = offsets
+
+    @classmethod
+    def from_paths(cls, paths: Mapping[str, PathData | str]) -> "GeometryBatch":
+        """Pack paths (parsed or as d strings) into a single buffer."""
+        parsed = [
+            p if isinstance(p, PathData) else PathData.parse(p) for p in paths.values()
+        ]
+        counts = [len(p.coords) // 2 for p in parsed]
+        offsets = np.zeros(len(parsed) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+
+        flat = array("d")
+        for p in parsed:
+            flat.extend(p.coords)
+        points = np.frombuffer(flat, dtype=np.float64).reshape(-1, 2).copy()
+
+        return cls(tuple(paths), tuple(p.commands for p in parsed), points, offsets)
+
+    @classmethod
+    def concat(cls, batches: "list[GeometryBatch]") -> "GeometryBatch":
+        """Join batches into one, keeping path order; names must not repeat."""
+        names = tuple(name for batch in batches for name in batch.names)
+        if len(set(names)) != len(names):
+            raise ValueError("Cannot concatenate batches with repeated path names")
+        counts = [np.diff(batch.offsets) for batch in batches]
+        offsets = np.zeros(len(names) + 1, dtype=np.intp)
+        np.cumsum(
+            np.concatenate([np.zeros(0, dtype=np.intp), *counts]), out=offsets[1:]
+        )
+        points = np.concatenate([np.empty((0, 2)), *(b.points for b in batches)])
+        commands = tuple(cmds for batch in batches for cmds in batch.commands)
+        return cls(names, commands, points, offsets)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def transformed(self, matrix: np.ndarray) -> "GeometryBatch":
+        """Apply a 2x3 affine matrix to every point in one vectorized operation."""
+        linear = matrix[:, :2]
+        points = self.points @ linear.T + matrix[:, 2]
+        return GeometryBatch(self.names, self.commands, points, self.offsets)
+
+    def path(self, index: int) -> PathData:
+        """Slice path `index` back out of the buffer."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        coords = array("d")
+        coords.frombytes(self.points[start:end].tobytes())
+        return PathData(self.commands[index], coords)
+
+    def to_paths(self) -> dict[str, PathData]:
+        """All paths by name."""
+        return {name: self.path(i) for i, name in enumerate(self.names)}
+
+    def translation_groups(self, tolerance: float) -> list[tuple[str, ...]]:
+        """
+        Names of paths that are the same shape at different positions.
+
+        Two paths match when they have the same commands and every point is
+        within tolerance of the other path's point at the same index, once
+        both are moved so that their first point is at the origin.
+
+        Returns:
+            Groups of two or more names, each in buffer order, ordered by
+            their first member
+        """
+        groups: list[list[int]] = []
+        for i, commands in enumerate(self.commands):
+            shape = self._relative_points(i)
+            for group in groups:
+                other = self._relative_points(group[0])
+                if (
+                    self.commands[group[0]] == commands
+                    and other.shape == shape.shape
+                    and np.allclose(other, shape, rtol=0.0, atol=tolerance)
+                ):
+                    group.append(i)
+                    break
+            else:
+                groups.append([i])
+        return [
+            tuple(self.names[i] for i in group) for group in groups if len(group) > 1
+        ]
+
+    def _relative_points(self, index: int) -> np.ndarray:
+        """Points of path `index` relative to its first point."""
+        points = self.points[self.offsets[index] : self.offsets[index + 1]]
+        return points - points[:1]
+
+    def to_d(self, precision: int | None = None) -> dict[str, str]:
+        """Serialized d attribute of every path by name (see PathData.to_d())."""
+        return {name: self.path(i).to_d(precision) for i, name in enumerate(self.names)}
@@ -0,0 +1,409 @@
+#!/usr/bin/env -S uv run
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "svgpathtools>=1.6",
+#     "pyyaml>=6.0",
+#     "numpy>=1.26",
+# ]
+# ///
+"""
+Logo Generator Benchmarks
+
+Times the generator's hot paths with warmup and repetitions, writes the
+results as a JSON baseline, and compares two result files against a
+regression threshold.
+
+Usage:
+    uv run assets/generate/benchmark.py run --output baseline.json
+    uv run assets/generate/benchmark.py run --compare baseline.json
+    uv run assets/generate/benchmark.py compare baseline.json current.json
+
+Benchmarks run with the transform cache emptied before every call so they
+measure the work itself, not cache lookups.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+if not __package__:
+    # Run as a script: make the project root importable for assets.generate.*
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from assets.generate import generate_logos as gl
+from assets.generate.pngopt import encode_optimized
+from assets.generate.raster import parse_svg_scene, render
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+BENCHMARK_SCHEMA = "generate-benchmark/v1"
+
+DEFAULT_WARMUP = 2
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 10.0  # percent
+
+# Each repetition loops until it has run for at least this long
+MIN_REPETITION_SECONDS = 0.05
+
+# Sub-brand names set from the glyph atlas by the layout_text benchmark
+SAMPLE_TEXTS = (
+    "agent",
+    "prompt",
+    "agent prompt",
+    "mentor",
+    "paragon",
+    "pronto",
+    "tempo",
+    "argon",
+    "parent",
+    "manager",
+)
+
+# Square sizes rendered from one parsed icon by the png_ladder benchmark
+PNG_SIZE_LADDER = (16, 32, 48, 64, 128, 180, 192, 256, 512, 1024)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Per-call timings of one benchmark, in seconds."""
+
+    median: float
+    min: float
+    mean: float
+    stdev: float
+    loops: int
+    repeat: int
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+
+def time_function(
+    func: Callable[[], object],
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = MIN_REPETITION_SECONDS,
+) -> BenchmarkResult:
+    """
+    Time func like timeit: calibrate a loop count, warm up, then repeat.
+
+    Args:
+        func: Zero-argument callable to time
+        warmup: Untimed calls before measuring
+        repeat: Timed repetitions
+        min_time: Minimum duration of one repetition, used to pick the loop count
+
+    Returns:
+        Per-call statistics over the repetitions
+    """
+    for _ in range(warmup):
+        func()
+
+    loops = 1
+    while True:
+        elapsed = _time_loops(func, loops)
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    per_call = [_time_loops(func, loops) / loops for _ in range(repeat)]
+    return BenchmarkResult(
+        median=statistics.median(per_call),
+        min=min(per_call),
+        mean=statistics.fmean(per_call),
+        stdev=statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        loops=loops,
+        repeat=repeat,
+    )
+
+
+def _time_loops(func: Callable[[], object], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - start
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+
+def uncached(func: Callable[[], object]) -> Callable[[], object]:
+    """Wrap func so every call starts from an empty transform cache."""
+
+    def call() -> object:
+        gl.TRANSFORM_CACHE.clear()
+        return func()
+
+    return call
+
+
+def collect_benchmarks(workdir: Path) -> dict[str, Callable[[], object]]:
+    """
+    All benchmarks by name.
+
+    Args:
+        workdir: Scratch directory for benchmarks that write files
+    """
+    benchmarks: dict[str, Callable[[], object]] = {}
+
+    # Same scale and offset as the tight layout, so every component is applied
+    for name, d in gl.wordmark_paths().items():
+        benchmarks[f"transform_path[{name}]"] = uncached(
+            lambda d=d: gl.transform_path(d, translate=(-6.4, -12.0), scale=1.25)
+        )
+
+    for variant in gl.WORDMARK_VARIANTS:
+        for tight in (False, True):
+            benchmarks[f"generate_wordmark[{gl.wordmark_filename(variant, tight)}]"] = (
+                uncached(lambda v=variant, t=tight: gl.generate_wordmark(v, tight=t))
+            )
+
+    # Setting strings reuses the parsed glyph outlines; nothing is parsed
+    atlas = gl.get_atlas()
+    benchmarks[f"layout_text[{len(SAMPLE_TEXTS)} names]"] = lambda: [
+        atlas.layout(text).to_d() for text in SAMPLE_TEXTS
+    ]
+
+    layout = gl.wordmark_layout(tight=False)
+    benchmarks["generate_adaptive_wordmark"] = lambda: gl.generate_adaptive_wordmark(
+        layout.viewbox_width,
+        layout.viewbox_height,
+        layout.corner_radius,
+        layout.paths,
+    )
+
+    # Batch theming: fill the compiled template once per palette
+    themes = [gl.wordmark_palette(v) for v in ("dark", "light", "white")] * 334
+    benchmarks[f"generate_themes[{len(themes)}]"] = lambda: sum(
+        map(len, gl.generate_themes(themes))
+    )
+
+    # Rasterize and encode the icon at every ladder size from one parse
+    icon = Path(gl.__file__).resolve().parents[1] / "icon" / "icon-rounded-tight.svg"
+    scene = parse_svg_scene(icon.read_text())
+    benchmarks[f"png_ladder[{len(PNG_SIZE_LADDER)} sizes]"] = lambda: [
+        gl.render_png(scene, size, size) for size in PNG_SIZE_LADDER
+    ]
+
+    # Lossless encoding search on one rendered favicon-sized icon
+    icon_pixels = render(scene, 192, 192)
+    benchmarks["png_optimize[192x192]"] = lambda: encode_optimized(icon_pixels)
+
+    # Deploy every wordmark into a scratch tree; after the first call this
+    # measures the incremental (all destinations up to date) case
+    assets_dir = workdir / "assets"
+    mappings = {"wordmark": []}
+    for variant in gl.WORDMARK_VARIANTS:
+        for tight in (False, True):
+            filename = gl.wordmark_filename(variant, tight)
+            source = assets_dir / "wordmark" / filename
+            source.parent.mkdir(parents=True, exist_ok=True)
+            source.write_text(gl.generate_wordmark(variant, tight=tight))
+            mappings["wordmark"].append(
+                {"source": filename, "dest": f"site/{filename}"}
+            )
+    benchmarks["deploy_assets"] = lambda: gl.deploy_assets(
+        mappings, assets_dir, workdir
+    )
+
+    # Whole generator in a fresh interpreter: imports, parsing, rendering,
+    # writing and deploying, with the disk transform cache disabled
+    script = Path(gl.__file__).resolve()
+    env = {**os.environ, gl.ENV_CACHE_DIR: ""}
+    run_dir = workdir / "main"
+    run_dir.mkdir()
+    benchmarks["main[cold]"] = lambda: subprocess.run(
+        [sys.executable, str(script), "--force"],
+        cwd=run_dir,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+    return benchmarks
+
+
+def run_benchmarks(
+    selected: str | None = None,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+) -> dict[str, BenchmarkResult]:
+    """
+    Run benchmarks, optionally only those whose name contains `selected`.
+
+    Returns:
+        Results by benchmark name
+    """
+    cache_dir = gl.TRANSFORM_CACHE.cache_dir
+    gl.TRANSFORM_CACHE.cache_dir = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            benchmarks = collect_benchmarks(Path(tmp))
+            results = {}
+            for name, func in benchmarks.items():
+                if selected and selected not in name:
+                    continue
+                results[name] = time_function(func, warmup=warmup, repeat=repeat)
+                print(f"  {name:<56} {format_seconds(results[name].median):>10}")
+            return results
+    finally:
+        gl.TRANSFORM_CACHE.cache_dir = cache_dir
+        gl.TRANSFORM_CACHE.clear()
+
+
+# =============================================================================
+# BASELINES
+# =============================================================================
+
+
+def save_results(results: dict[str, BenchmarkResult], path: Path) -> None:
+    """Write results as a JSON baseline."""
+    data = {
+        "schema": BENCHMARK_SCHEMA,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {name: asdict(result) for name, result in results.items()},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def load_results(path: Path) -> dict[str, BenchmarkResult]:
+    """
+    Read a JSON baseline written by save_results().
+
+    Raises:
+        ValueError: If the file is not a benchmark baseline
+    """
+    data = json.loads(path.read_text())
+    if data.get("schema") != BENCHMARK_SCHEMA:
+        raise ValueError(f"{path}: not a {BENCHMARK_SCHEMA} file")
+    return {
+        name: BenchmarkResult(**result) for name, result in data["benchmarks"].items()
+    }
+
+
+def compare_results(
+    baseline: dict[str, BenchmarkResult],
+    current: dict[str, BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> tuple[list[str], list[str]]:
+    """
+    Compare median per-call times of benchmarks present in both result sets.
+
+    Args:
+        baseline: Reference results
+        current: New results
+        threshold: Allowed slowdown in percent
+
+    Returns:
+        Report lines, and the names of benchmarks that regressed
+    """
+    lines = []
+    regressions = []
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name].median, current[name].median
+        change = (after - before) / before * 100 if before > 0 else 0.0
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        mark = "✗" if regressed else "✓"
+        lines.append(
+            f"  {mark} {name:<56} {format_seconds(before):>10} → "
+            f"{format_seconds(after):>10} {change:+7.1f}%"
+        )
+    for name in sorted(baseline.keys() - current.keys()):
+        lines.append(f"  · {name} (not in current results)")
+    for name in sorted(current.keys() - baseline.keys()):
+        lines.append(f"  · {name} (new, no baseline)")
+    return lines, regressions
+
+
+def format_seconds(seconds: float) -> str:
+    """Human-readable duration (ns, µs, ms or s)."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the logo generator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run benchmarks")
+    run.add_argument("-o", "--output", type=Path, help="write results to this file")
+    run.add_argument(
+        "--compare", type=Path, metavar="BASELINE", help="compare against BASELINE"
+    )
+    run.add_argument("-k", "--filter", help="only benchmarks whose name contains this")
+    run.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+
+    for command in (run, compare):
+        command.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            metavar="PERCENT",
+            help=f"fail if a median slows down by more than this "
+            f"(default: {DEFAULT_THRESHOLD:g})",
+        )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "run":
+        print("Running benchmarks (median per call)...")
+        current = run_benchmarks(args.filter, warmup=args.warmup, repeat=args.repeat)
+        if args.output:
+            save_results(current, args.output)
+            print(f"\n✓ Wrote {args.output}")
+        if not args.compare:
+            return 0
+        baseline_path = args.compare
+    else:
+        baseline_path = args.baseline
+        current = load_results(args.current)
+
+    lines, regressions = compare_results(
+        load_results(baseline_path), current, args.threshold
+    )
+    print(f"\nCompared with {baseline_path} (threshold {args.threshold:g}%):")
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n✗ {len(regressions)} benchmarks regressed")
+        return 1
+    print("\n✓ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
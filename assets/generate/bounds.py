@@ -0,0 +1,216 @@
+"""
+Exact Bounding Boxes
+
+Computes tight bounding boxes for every path of a GeometryBatch at once.
+A path's box spans its segment endpoints plus the interior extrema of its
+quadratic and cubic Bézier segments, found by solving the derivative of each
+curve per axis. Control points outside the curve do not count.
+
+Everything is vectorized across all glyphs; only the walk that pairs each
+segment with its start point runs in Python, once per geometry set.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from assets.generate.affine import GeometryBatch
+from assets.generate.pathdata import (
+    CMD_CLOSE,
+    CMD_CUBIC,
+    CMD_LINE,
+    CMD_MOVE,
+    CMD_QUAD,
+)
+
+# Roots this close to a segment's ends are covered by the endpoints already
+T_EPSILON = 1e-12
+
+
+@dataclass(frozen=True)
+class Bounds:
+    """Axis-aligned bounding box in SVG user units (y grows downward)."""
+
+    left: float
+    top: float
+    right: float
+    bottom: float
+
+    @property
+    def width(self) -> float:
+        return self.right - self.left
+
+    @property
+    def height(self) -> float:
+        return self.bottom - self.top
+
+    def union(self, other: "Bounds") -> "Bounds":
+        """Smallest box containing both boxes."""
+        return Bounds(
+            min(self.left, other.left),
+            min(self.top, other.top),
+            max(self.right, other.right),
+            max(self.bottom, other.bottom),
+        )
+
+
+def union_bounds(boxes: Sequence[Bounds]) -> Bounds:
+    """
+    Smallest box containing every box.
+
+    Raises:
+        ValueError: If boxes is empty
+    """
+    if not boxes:
+        raise ValueError("union_bounds() needs at least one box")
+    result = boxes[0]
+    for box in boxes[1:]:
+        result = result.union(box)
+    return result
+
+
+def batch_bounds(batch: GeometryBatch) -> dict[str, Bounds]:
+    """
+    Exact bounding box of every path in a batch.
+
+    Args:
+        batch: Packed paths (see assets.generate.affine)
+
+    Returns:
+        Bounds keyed by path name
+
+    Raises:
+        ValueError: If a path has no points
+    """
+    endpoints, quads, cubics = _segment_indices(batch)
+    points = batch.points
+    path_of_point = np.repeat(np.arange(len(batch)), np.diff(batch.offsets))
+
+    # Candidate extreme coordinates per axis, and the path each belongs to
+    values: list[list[np.ndarray]] = [[points[endpoints, 0]], [points[endpoints, 1]]]
+    owners: list[list[np.ndarray]] = [[path_of_point[endpoints]] for _ in range(2)]
+    for segments, extrema in ((quads, _quadratic_extrema), (cubics, _cubic_extrema)):
+        if not len(segments):
+            continue
+        for axis in (0, 1):
+            coords = points[segments, axis]  # (n, degree + 1)
+            rows, extreme = extrema(*coords.T)
+            values[axis].append(extreme)
+            owners[axis].append(path_of_point[segments[rows, -1]])
+
+    n = len(batch)
+    low = [np.full(n, np.inf), np.full(n, np.inf)]
+    high = [np.full(n, -np.inf), np.full(n, -np.inf)]
+    for axis in (0, 1):
+        axis_values = np.concatenate(values[axis])
+        axis_owners = np.concatenate(owners[axis])
+        np.minimum.at(low[axis], axis_owners, axis_values)
+        np.maximum.at(high[axis], axis_owners, axis_values)
+
+    empty = [name for i, name in enumerate(batch.names) if low[0][i] == np.inf]
+    if empty:
+        raise ValueError(f"Paths without points: {', '.join(empty)}")
+
+    return {
+        name: Bounds(
+            float(low[0][i]), float(low[1][i]), float(high[0][i]), float(high[1][i])
+        )
+        for i, name in enumerate(batch.names)
+    }
+
+
+# =============================================================================
+# SEGMENTS AND EXTREMA
+# =============================================================================
+
+
+def _segment_indices(
+    batch: GeometryBatch,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Point indices of segment endpoints, quadratic and cubic segments.
+
+    Returns:
+        endpoints: (k,) indices of on-curve points
+        quads: (q, 3) start, control and end point index of each quadratic
+        cubics: (c, 4) start, two controls and end point index of each cubic
+    """
+    endpoints: list[int] = []
+    quads: list[tuple[int, int, int]] = []
+    cubics: list[tuple[int, int, int, int]] = []
+
+    for i, commands in enumerate(batch.commands):
+        index = int(batch.offsets[i])
+        current = start = index
+        for command in commands:
+            if command == CMD_MOVE:
+                current = start = index
+                endpoints.append(index)
+                index += 1
+            elif command == CMD_LINE:
+                current = index
+                endpoints.append(index)
+                index += 1
+            elif command == CMD_QUAD:
+                quads.append((current, index, index + 1))
+                current = index + 1
+                endpoints.append(current)
+                index += 2
+            elif command == CMD_CUBIC:
+                cubics.append((current, index, index + 1, index + 2))
+                current = index + 2
+                endpoints.append(current)
+                index += 3
+            elif command == CMD_CLOSE:
+                current = start
+
+    return (
+        np.array(endpoints, dtype=np.intp),
+        np.array(quads, dtype=np.intp).reshape(-1, 3),
+        np.array(cubics, dtype=np.intp).reshape(-1, 4),
+    )
+
+
+def _interior(t: np.ndarray) -> np.ndarray:
+    return (t > T_EPSILON) & (t < 1 - T_EPSILON)
+
+
+def _quadratic_extrema(
+    p0: np.ndarray, p1: np.ndarray, p2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Interior extrema of quadratics along one axis: (segment rows, values)."""
+    denom = p0 - 2 * p1 + p2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (p0 - p1) / denom
+    rows = np.nonzero((denom != 0) & _interior(t))[0]
+    t = t[rows]
+    mt = 1 - t
+    return rows, mt * mt * p0[rows] + 2 * mt * t * p1[rows] + t * t * p2[rows]
+
+
+def _cubic_extrema(
+    p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Interior extrema of cubics along one axis: (segment rows, values)."""
+    # B'(t) / 3 = a t^2 + b t + c
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quadratic = a != 0
+        sqrt_disc = np.sqrt(b * b - 4 * a * c)  # NaN when there is no real root
+        t1 = np.where(quadratic, (-b + sqrt_disc) / (2 * a), -c / b)
+        t2 = np.where(quadratic, (-b - sqrt_disc) / (2 * a), np.nan)
+
+    t = np.stack([t1, t2], axis=1)  # (n, 2)
+    rows, cols = np.nonzero(_interior(t))
+    t = t[rows, cols]
+    mt = 1 - t
+    return rows, (
+        mt**3 * p0[rows]
+        + 3 * mt * mt * t * p1[rows]
+        + 3 * mt * t * t * p2[rows]
+        + t**3 * p3[rows]
+    )
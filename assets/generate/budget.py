@@ -0,0 +1,264 @@
+"""
+Asset Weight Budgets
+
+Measures every generated and deployed asset and compares it against the
+limits in asset-budgets.yaml:
+
+- bytes: size of the file as written
+- gzip_bytes: size after gzip at level 9, as deploy precompresses it
+- paths: number of <path> elements in an SVG (0 for other files)
+- segments: drawing commands of all those paths together, implicit
+  repetitions included (see count_segments()), a measure of how much a
+  renderer has to do
+
+Budgets are keyed by fnmatch patterns of paths relative to the project root
+("*" also matches "/"); every budget whose pattern matches an asset applies,
+so a broad pattern can set a ceiling that a narrower one tightens. Assets
+that no pattern matches are measured but not limited.
+"""
+
+import math
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import astuple, dataclass, fields
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+from assets.generate.deploy import gzip_compress
+from assets.generate.yamlcache import load_yaml
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+# Numbers each path command takes per segment; a command letter followed by
+# several groups repeats implicitly (after M, as lines)
+ARGS_PER_COMMAND = {
+    "M": 2,
+    "L": 2,
+    "H": 1,
+    "V": 1,
+    "C": 6,
+    "S": 4,
+    "Q": 4,
+    "T": 2,
+    "A": 7,
+    "Z": 0,
+}
+
+# A command letter or a number
+PATH_TOKEN = re.compile(r"[A-Za-z]|[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class AssetWeight:
+    """
+    How heavy one asset is.
+
+    Attributes:
+        bytes: File size
+        gzip_bytes: Size of its precompressed copy (see deploy.gzip_compress())
+        paths: <path> elements (SVG only)
+        segments: Drawing commands across those paths (SVG only)
+    """
+
+    bytes: int
+    gzip_bytes: int
+    paths: int
+    segments: int
+
+
+# Budget limits, in the order they are reported
+METRICS = tuple(field.name for field in fields(AssetWeight))
+
+
+def gzip_size(data: bytes) -> int:
+    """Size of data's precompressed copy, as deploy would write it."""
+    return len(gzip_compress(data))
+
+
+def count_segments(d: str) -> int:
+    """
+    Drawing commands in path data, counted without parsing the geometry.
+
+    Every command is accepted, including arcs and smooth curves that
+    PathData does not support. Each group of arguments counts as one
+    segment, except a moveto's first; letters of unknown commands count
+    once. Arc flags written without separators ("a1 1 0 015 5") read as
+    fewer numbers, so such arcs may be undercounted, never overcounted.
+    """
+    segments = 0
+    command, numbers = "", 0
+
+    def flush() -> int:
+        arity = ARGS_PER_COMMAND.get(command.upper())
+        if arity is None:
+            return 1 if command else 0
+        if arity == 0:
+            return 1
+        groups = max(1, math.ceil(numbers / arity))
+        return groups - 1 if command.upper() == "M" else groups
+
+    for token in PATH_TOKEN.findall(d):
+        if token.isalpha():
+            segments += flush()
+            command, numbers = token, 0
+        else:
+            numbers += 1
+    return segments + flush()
+
+
+def measure_asset(name: str, data: bytes) -> AssetWeight:
+    """
+    Measure one asset.
+
+    Args:
+        name: File name; only names ending in .svg are parsed for paths
+        data: File content
+
+    Raises:
+        ValueError: If an SVG is not well-formed
+    """
+    paths = segments = 0
+    if name.endswith(".svg"):
+        from xml.etree import ElementTree
+
+        try:
+            root = ElementTree.fromstring(data)
+        except ElementTree.ParseError as e:
+            raise ValueError(f"{name}: {e}") from None
+        for element in root.iter(f"{SVG_NAMESPACE}path"):
+            paths += 1
+            segments += count_segments(element.get("d", ""))
+    return AssetWeight(len(data), gzip_size(data), paths, segments)
+
+
+# =============================================================================
+# BUDGETS
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class AssetBudget:
+    """Limits for the assets matching a pattern; metrics left out are unlimited."""
+
+    pattern: str
+    limits: dict[str, int]
+
+    def matches(self, name: str) -> bool:
+        return fnmatchcase(name, self.pattern)
+
+
+@dataclass(frozen=True)
+class BudgetViolation:
+    """One metric of one asset over its limit."""
+
+    name: str
+    metric: str
+    value: int
+    limit: int
+    pattern: str
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.metric} {self.value:,} > {self.limit:,} "
+            f"(budget {self.pattern})"
+        )
+
+
+def parse_budgets(document: Any) -> list[AssetBudget]:
+    """
+    Validate a parsed asset-budgets.yaml.
+
+    Args:
+        document: Mapping of pattern to {metric: limit}; None for no budgets
+
+    Returns:
+        One AssetBudget per pattern, in file order
+
+    Raises:
+        ValueError: Listing every unknown metric and every limit that is not a
+            non-negative integer
+    """
+    if document is None:
+        return []
+
+    budgets = []
+    problems = []
+    if not isinstance(document, dict):
+        problems.append(f"expected a mapping of patterns to limits: {document!r}")
+        document = {}
+    for pattern, limits in document.items():
+        if not isinstance(limits, dict) or not limits:
+            problems.append(f"{pattern}: expected metric limits: {limits!r}")
+            continue
+        for metric, limit in limits.items():
+            if metric not in METRICS:
+                problems.append(
+                    f"{pattern}: unknown metric {metric!r} "
+                    f"(expected one of {', '.join(METRICS)})"
+                )
+            elif isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+                problems.append(f"{pattern}: {metric} must be an integer >= 0")
+        budgets.append(AssetBudget(str(pattern), dict(limits)))
+
+    if problems:
+        raise ValueError("Invalid asset budgets:\n  " + "\n  ".join(problems))
+    return budgets
+
+
+def load_budgets(path: Path, cache_dir: Path | None = None) -> list[AssetBudget]:
+    """
+    Read asset-budgets.yaml, reusing the cached parse while it is unchanged.
+
+    Raises:
+        ValueError: If the file is invalid (see parse_budgets())
+    """
+    return parse_budgets(load_yaml(path, cache_dir, validate=parse_budgets))
+
+
+def check_budgets(
+    weights: Mapping[str, AssetWeight], budgets: Iterable[AssetBudget]
+) -> list[BudgetViolation]:
+    """
+    Compare measured assets against every budget that matches them.
+
+    Args:
+        weights: Measurements keyed by path relative to the project root
+        budgets: Budgets to apply
+
+    Returns:
+        Every metric over a limit, by asset name, then budget order
+    """
+    budgets = list(budgets)
+    violations = []
+    for name in sorted(weights):
+        measured = dict(zip(METRICS, astuple(weights[name]), strict=True))
+        for budget in budgets:
+            if not budget.matches(name):
+                continue
+            for metric, limit in budget.limits.items():
+                if measured[metric] > limit:
+                    violations.append(
+                        BudgetViolation(
+                            name, metric, measured[metric], limit, budget.pattern
+                        )
+                    )
+    return violations
+
+
+def format_weight(name: str, weight: AssetWeight, over: bool = False) -> str:
+    """One report line for an asset, marked ✗ when it is over budget."""
+    mark = "✗" if over else "✓"
+    line = f"  {mark} {name}: {weight.bytes:,} bytes, {weight.gzip_bytes:,} gzip"
+    if weight.paths:
+        line += f", {weight.paths} paths, {weight.segments:,} segments"
+    return line
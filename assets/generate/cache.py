@@ -0,0 +1,214 @@
+"""
+Transform Cache
+
+Two-level memoization for transformed path data:
+
+1. A bounded in-process LRU
+2. An optional content-addressed directory shared across runs (and CI jobs),
+   evicting least recently used entries once it grows past a byte budget
+
+Keys are SHA-256 digests of the path data, the affine matrix and the output
+precision, so identical work is recognized no matter which caller asks.
+"""
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_DISK_BYTES = 16 * 1024 * 1024
+CACHE_FILE_SUFFIX = ".d"
+
+# Bump when the serialized output format changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+def transform_key(
+    d: str,
+    matrix: Iterable[float],
+    precision: int | None = None,
+) -> str:
+    """
+    Content hash identifying one path transform.
+
+    Args:
+        d: Source path d attribute
+        matrix: Affine matrix as (a, b, c, d, e, f) in SVG order
+        precision: Output decimal places, None for full precision
+
+    Returns:
+        Hex digest usable as a cache key and file name
+    """
+    coefficients = ",".join(repr(float(v)) for v in matrix)
+    payload = f"v{CACHE_FORMAT_VERSION}\0{d}\0{coefficients}\0{precision}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a TransformCache."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.disk_hits + self.misses
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+class TransformCache:
+    """
+    Bounded LRU of transform results, optionally backed by a cache directory.
+
+    Attributes:
+        max_entries: In-process LRU capacity
+        cache_dir: Directory for persistent entries, None for memory only
+        max_disk_bytes: Size budget for cache_dir before eviction
+        read_only: Read cache_dir without adding or touching entries
+        stats: Hit/miss counters since creation or the last reset
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Path | None = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        read_only: bool = False,
+    ) -> None:
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.read_only = read_only
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._disk_bytes: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None (counted as a miss)."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+        value = self._read_disk(key)
+        if value is not None:
+            self._remember(key, value)
+            self.stats.disk_hits += 1
+            return value
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store value in memory and, when configured, on disk."""
+        self._remember(key, value)
+        self._write_disk(key, value)
+
+    def clear(self) -> None:
+        """Drop in-process entries and reset counters (disk is left alone)."""
+        self._entries.clear()
+        self.stats = CacheStats()
+
+    # -------------------------------------------------------------------------
+    # In-process LRU
+    # -------------------------------------------------------------------------
+
+    def _remember(self, key: str, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    # Persistent store
+    # -------------------------------------------------------------------------
+
+    def _entry_path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _read_disk(self, key: str) -> str | None:
+        if self.cache_dir is None:
+            return None
+        path = self._entry_path(key)
+        try:
+            value = path.read_text()
+            # Refresh mtime so eviction keeps recently used entries
+            if not self.read_only:
+                os.utime(path)
+        except OSError:
+            return None
+        return value
+
+    def _write_disk(self, key: str, value: str) -> None:
+        if self.cache_dir is None or self.read_only:
+            return
+        path = self._entry_path(key)
+        if path.exists():
+            return
+        data = value.encode()
+        try:
+            # A read-only or unusable cache location only costs the disk write
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            return
+
+        if self._disk_bytes is None:
+            self._disk_bytes = self._scan_disk_bytes()
+        else:
+            self._disk_bytes += len(data)
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict()
+
+    def _scan_disk_bytes(self) -> int:
+        assert self.cache_dir is not None
+        return sum(
+            p.stat().st_size for p in self.cache_dir.glob(f"*/*{CACHE_FILE_SUFFIX}")
+        )
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the store is at 3/4 budget."""
+        assert self.cache_dir is not None
+        entries = []
+        for p in self.cache_dir.glob(f"*/*{CACHE_FILE_SUFFIX}"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_disk_bytes * 3 // 4
+        for _, size, p in entries:
+            if total <= target:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
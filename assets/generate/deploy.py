@@ -0,0 +1,505 @@
+"""
+Asset Deployment
+
+Copies generated assets to their live destinations as listed in
+asset-mappings.yaml. Deployment is incremental and atomic:
+
+1. Every mapping is validated before anything is written
+2. Destinations whose content already matches their source are left alone
+3. Changed files are copied with the cheapest mechanism the platform offers
+   (reflink, hard link when allowed, copy_file_range, plain copy) into a
+   temporary file that then replaces the destination in one rename, so readers
+   never see a partially written file
+4. Sources generated in the same run are still only staged in a WriteSet;
+   their copies are staged alongside them and committed together
+
+Deployed SVGs can also get a precompressed .gz sibling for hosts that serve
+those directly (see precompress_files()).
+"""
+
+import gzip
+import hashlib
+import os
+import secrets
+import shutil
+import struct
+import tempfile
+import zlib
+from collections.abc import Collection, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from assets.generate.yamlcache import load_yaml
+
+if TYPE_CHECKING:
+    from assets.generate.writeset import WriteSet
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+YAML_KEY_SOURCE = "source"
+YAML_KEY_DEST = "dest"
+
+# Linux ioctl that shares the source's extents with the destination (btrfs, XFS)
+FICLONE = 0x40049409
+
+# How a destination was brought up to date
+METHOD_UNCHANGED = "unchanged"
+METHOD_REFLINK = "reflink"
+METHOD_LINK = "link"
+METHOD_COPY_RANGE = "copy_file_range"
+METHOD_COPY = "copy"
+METHOD_WRITE = "write"  # staged in a WriteSet, written when it is committed
+METHOD_DROPPED = "dropped"  # precompressed copy not smaller; none is kept
+
+# Precompressed siblings: name suffix, the deployed files that get one, and
+# gzip's maximum level. Without a timestamp the same source always
+# compresses to the same bytes
+GZIP_SUFFIX = ".gz"
+PRECOMPRESS_SUFFIXES = (".svg",)
+GZIP_LEVEL = 9
+
+
+@dataclass(frozen=True)
+class DeployItem:
+    """One source file and the destination it is deployed to."""
+
+    source: Path
+    dest: Path
+
+
+@dataclass(frozen=True)
+class DeployResult:
+    """Outcome of deploying one item."""
+
+    dest: Path
+    method: str
+
+    @property
+    def changed(self) -> bool:
+        return self.method != METHOD_UNCHANGED
+
+
+@dataclass(frozen=True)
+class PrecompressResult:
+    """
+    Outcome of precompressing one deployed file.
+
+    Attributes:
+        path: Deployed file
+        method: METHOD_UNCHANGED, METHOD_WRITE or METHOD_DROPPED
+        data: New sibling content, for METHOD_WRITE
+    """
+
+    path: Path
+    method: str
+    data: bytes | None = None
+
+    @property
+    def sibling(self) -> Path:
+        return gzip_sibling(self.path)
+
+
+# =============================================================================
+# PLANNING AND VALIDATION
+# =============================================================================
+
+
+def plan_deploy(
+    mappings: dict[str, Any],
+    assets_dir: Path,
+    project_root: Path,
+) -> list[DeployItem]:
+    """
+    Resolve categorized mappings to source and destination paths.
+
+    Args:
+        mappings: Parsed YAML dict where each key is a category (favicon, wordmark)
+                  and each value is a list of {source, dest} mappings.
+                  Source is filename only; category implies source directory.
+        assets_dir: Root assets directory (source paths are assets_dir/category/filename)
+        project_root: Project root directory (dest paths are relative to this)
+
+    Returns:
+        One DeployItem per mapping, in file order
+
+    Raises:
+        ValueError: If a mapping is malformed or a destination is listed twice
+    """
+    plan = []
+    problems = []
+    seen: dict[Path, Path] = {}
+
+    for category, items in mappings.items():
+        for mapping in items or []:
+            if not isinstance(mapping, dict) or not (
+                mapping.get(YAML_KEY_SOURCE) and mapping.get(YAML_KEY_DEST)
+            ):
+                problems.append(f"{category}: expected source and dest: {mapping!r}")
+                continue
+            # Source path: assets_dir / category / filename
+            item = DeployItem(
+                source=assets_dir / category / mapping[YAML_KEY_SOURCE],
+                dest=project_root / mapping[YAML_KEY_DEST],
+            )
+            if item.dest in seen:
+                problems.append(
+                    f"{mapping[YAML_KEY_DEST]}: deployed from both "
+                    f"{seen[item.dest].name} and {item.source.name}"
+                )
+                continue
+            seen[item.dest] = item.source
+            plan.append(item)
+
+    if problems:
+        raise ValueError("Invalid asset mappings:\n  " + "\n  ".join(problems))
+    return plan
+
+
+def load_mappings(path: Path, cache_dir: Path | None = None) -> dict[str, Any]:
+    """
+    Read asset-mappings.yaml, reusing the cached, validated parse while the
+    file's content hash is unchanged.
+
+    Raises:
+        ValueError: If a mapping is malformed or a destination is listed twice
+    """
+    return load_yaml(path, cache_dir, validate=lambda m: plan_deploy(m, Path(), Path()))
+
+
+def check_sources(plan: Iterable[DeployItem], generated: Collection[Path] = ()) -> None:
+    """
+    Make sure every source exists or will be generated before deploying any.
+
+    Args:
+        plan: Items to deploy
+        generated: Sources that are built during this run
+
+    Raises:
+        FileNotFoundError: Listing every missing source
+    """
+    missing = [
+        str(item.source)
+        for item in plan
+        if item.source not in generated and not item.source.is_file()
+    ]
+    if missing:
+        raise FileNotFoundError(
+            "Asset sources not found:\n  " + "\n  ".join(sorted(set(missing)))
+        )
+
+
+# =============================================================================
+# DEPLOYMENT
+# =============================================================================
+
+
+def same_content(a: Path, b: Path) -> bool:
+    """Whether two files hold identical bytes (size first, then SHA-256)."""
+    try:
+        stat_a, stat_b = a.stat(), b.stat()
+    except OSError:
+        return False
+    if os.path.samestat(stat_a, stat_b):
+        return True
+    if stat_a.st_size != stat_b.st_size:
+        return False
+    return _file_digest(a) == _file_digest(b)
+
+
+def deploy_file(source: Path, dest: Path, link: bool = False) -> DeployResult:
+    """
+    Bring dest up to date with source, atomically.
+
+    Args:
+        source: File to deploy
+        dest: Destination path; parent directories are created
+        link: Allow hard-linking dest to source when both share a filesystem
+
+    Returns:
+        The destination and the method used (METHOD_UNCHANGED if skipped)
+    """
+    if same_content(source, dest):
+        return DeployResult(dest, METHOD_UNCHANGED)
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    if link:
+        tmp = dest.with_name(f".{dest.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            os.link(source, tmp)
+        except OSError:
+            pass  # cross-device or unsupported: fall through to a copy
+        else:
+            _replace(tmp, dest)
+            return DeployResult(dest, METHOD_LINK)
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp"
+    )
+    tmp = Path(tmp_name)
+    try:
+        with open(source, "rb") as fsrc, os.fdopen(fd, "wb") as fdst:
+            method = _copy_contents(fsrc, fdst)
+        # Same metadata as shutil.copy2
+        shutil.copystat(source, tmp)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _replace(tmp, dest)
+    return DeployResult(dest, method)
+
+
+def deploy_staged(
+    source: Path,
+    dest: Path,
+    writes: "WriteSet",
+    link: bool = False,
+) -> DeployResult:
+    """
+    Bring dest up to date with a source that is staged in writes.
+
+    The copy (or hard link) is staged as well, so it is committed together
+    with its source.
+
+    Args:
+        source: Staged file to deploy
+        dest: Destination path
+        writes: Write set holding source
+        link: Stage dest as a hard link to source where possible
+
+    Returns:
+        The destination and METHOD_UNCHANGED, METHOD_LINK or METHOD_WRITE
+
+    Raises:
+        KeyError: If source is not staged in writes
+    """
+    data = writes.get(source)
+    if data is None:
+        raise KeyError(f"Source is not staged: {source}")
+    try:
+        if dest.stat().st_size == len(data) and dest.read_bytes() == data:
+            return DeployResult(dest, METHOD_UNCHANGED)
+    except OSError:
+        pass  # missing destination
+    if link:
+        writes.link(dest, source)
+        return DeployResult(dest, METHOD_LINK)
+    writes.add(dest, data)
+    return DeployResult(dest, METHOD_WRITE)
+
+
+def find_orphans(
+    project_root: Path,
+    patterns: Iterable[str],
+    keep: Collection[Path],
+) -> list[Path]:
+    """
+    Files matching patterns that no mapping deploys to.
+
+    Args:
+        project_root: Directory patterns are relative to
+        patterns: Glob patterns of generated copies, e.g. "public/wordmark*.svg"
+        keep: Destinations that are still mapped
+    """
+    orphans = {
+        path
+        for pattern in patterns
+        for path in project_root.glob(pattern)
+        if path.is_file() and path not in keep
+    }
+    return sorted(orphans)
+
+
+def prune_orphans(
+    project_root: Path,
+    patterns: Iterable[str],
+    keep: Collection[Path],
+) -> list[Path]:
+    """Delete the files find_orphans() reports. Returns the removed paths."""
+    orphans = find_orphans(project_root, patterns, keep)
+    for path in orphans:
+        path.unlink(missing_ok=True)
+        gzip_sibling(path).unlink(missing_ok=True)
+    return orphans
+
+
+# =============================================================================
+# PRECOMPRESSION
+# =============================================================================
+
+
+def gzip_sibling(path: Path) -> Path:
+    """Where the precompressed copy of path goes: path with GZIP_SUFFIX added."""
+    return path.with_name(path.name + GZIP_SUFFIX)
+
+
+def gzip_compress(data: bytes) -> bytes:
+    """gzip data at GZIP_LEVEL without a timestamp, so the output is reproducible."""
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+# Header every gzip_compress() output starts with
+GZIP_HEADER = gzip_compress(b"")[:10]
+
+
+def compressed_from(compressed: bytes, data: bytes) -> bool:
+    """
+    Whether compressed is the gzip_compress() output for data.
+
+    The header, which fixes the settings, and the trailer, which holds the
+    CRC-32 and length of the uncompressed data, are compared first; a copy
+    that passes is decompressed, so a damaged body is caught too.
+    """
+    trailer = struct.pack("<II", zlib.crc32(data), len(data) & 0xFFFFFFFF)
+    if not (
+        len(compressed) >= len(GZIP_HEADER) + len(trailer)
+        and compressed.startswith(GZIP_HEADER)
+        and compressed.endswith(trailer)
+    ):
+        return False
+    try:
+        return gzip.decompress(compressed) == data
+    except (OSError, EOFError, zlib.error):
+        return False
+
+
+def precompress_file(path: Path) -> PrecompressResult:
+    """
+    Compress one deployed file, unless its sibling already matches it.
+
+    Returns:
+        METHOD_UNCHANGED if the sibling was compressed from this content,
+        METHOD_DROPPED if the compressed copy would not be smaller, else
+        METHOD_WRITE with the sibling's new content
+    """
+    data = path.read_bytes()
+    try:
+        if compressed_from(gzip_sibling(path).read_bytes(), data):
+            return PrecompressResult(path, METHOD_UNCHANGED)
+    except FileNotFoundError:
+        pass
+    compressed = gzip_compress(data)
+    if len(compressed) >= len(data):
+        return PrecompressResult(path, METHOD_DROPPED)
+    return PrecompressResult(path, METHOD_WRITE, compressed)
+
+
+def precompress_files(paths: Sequence[Path], jobs: int = 1) -> list[PrecompressResult]:
+    """
+    Compress deployed files into .gz siblings, without writing them.
+
+    zlib releases the GIL while it compresses, so files are compressed in a
+    thread pool rather than worker processes.
+
+    Args:
+        paths: Deployed files
+        jobs: Threads to use; 1 compresses in this thread
+
+    Returns:
+        One result per path, in the order given (see precompress_file())
+    """
+    if jobs <= 1 or len(paths) <= 1:
+        return [precompress_file(path) for path in paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return list(pool.map(precompress_file, paths))
+
+
+def apply_precompressed(
+    results: Iterable[PrecompressResult], writes: "WriteSet | None" = None
+) -> None:
+    """
+    Write new siblings and delete those of files that do not compress.
+
+    Args:
+        results: Output of precompress_files()
+        writes: Stage new siblings, and deletions, here instead of applying
+            them now
+    """
+    for result in results:
+        if result.method == METHOD_DROPPED:
+            if writes is None:
+                result.sibling.unlink(missing_ok=True)
+            else:
+                writes.remove(result.sibling)
+        elif result.data is not None:
+            if writes is None:
+                _write_atomic(result.sibling, result.data)
+            else:
+                writes.add(result.sibling, result.data)
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _file_digest(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def _write_atomic(dest: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(
+        dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _replace(Path(tmp_name), dest)
+
+
+def _replace(tmp: Path, dest: Path) -> None:
+    try:
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _copy_contents(fsrc, fdst) -> str:
+    """Copy an open source into an empty destination, cheapest method first."""
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return METHOD_REFLINK
+        except OSError:
+            pass
+
+    if hasattr(os, "copy_file_range"):
+        size = os.fstat(src_fd).st_size
+        copied = 0
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except OSError:
+            if copied:
+                raise
+        else:
+            if copied == size:
+                return METHOD_COPY_RANGE
+        # Nothing copied in kernel space; restart with a plain copy
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+
+    shutil.copyfileobj(fsrc, fdst)
+    return METHOD_COPY
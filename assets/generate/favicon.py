@@ -0,0 +1,109 @@
+"""
+Favicon Containers
+
+Packs rendered PNGs into the files browsers look for besides plain PNGs:
+
+- favicon.ico: an ICO directory holding one PNG-compressed image per size
+- The "icons" member of a web app manifest, listing PNGs by URL and size
+
+Both are byte-for-byte deterministic for the same inputs.
+"""
+
+import json
+import struct
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# ICO images are at most 256 pixels a side; a 0 in the directory means 256
+ICO_MAX_SIZE = 256
+
+# ICONDIR header (reserved, type 1 = icon, image count) and one entry per image
+# (width, height, palette size, reserved, color planes, bits per pixel, data
+# size, data offset)
+ICO_HEADER = struct.Struct("<HHH")
+ICO_ENTRY = struct.Struct("<BBBBHHII")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+# =============================================================================
+# ICO
+# =============================================================================
+
+
+def png_size(png: bytes) -> tuple[int, int]:
+    """
+    Width and height of a PNG, read from its IHDR chunk.
+
+    Raises:
+        ValueError: If png does not start with a PNG signature and IHDR chunk
+    """
+    if png[:8] != PNG_SIGNATURE or png[12:16] != b"IHDR":
+        raise ValueError("Not a PNG image")
+    width, height = struct.unpack(">II", png[16:24])
+    return width, height
+
+
+def pack_ico(pngs: Iterable[bytes]) -> bytes:
+    """
+    ICO file embedding PNG images as they are, in the given order.
+
+    Raises:
+        ValueError: If there are no images, or one is not a PNG of at most
+            256x256 pixels
+    """
+    pngs = list(pngs)
+    if not pngs:
+        raise ValueError("An ICO file needs at least one image")
+
+    entries = []
+    offset = ICO_HEADER.size + ICO_ENTRY.size * len(pngs)
+    for png in pngs:
+        width, height = png_size(png)
+        if not (0 < width <= ICO_MAX_SIZE and 0 < height <= ICO_MAX_SIZE):
+            raise ValueError(f"ICO images are at most 256x256, got {width}x{height}")
+        entries.append(
+            ICO_ENTRY.pack(
+                width % ICO_MAX_SIZE,
+                height % ICO_MAX_SIZE,
+                0,
+                0,
+                1,
+                32,
+                len(png),
+                offset,
+            )
+        )
+        offset += len(png)
+    return ICO_HEADER.pack(0, 1, len(pngs)) + b"".join(entries) + b"".join(pngs)
+
+
+# =============================================================================
+# WEB APP MANIFEST
+# =============================================================================
+
+
+def webmanifest_icons(entries: Iterable[Mapping[str, Any]], url_prefix: str) -> bytes:
+    """
+    Web app manifest fragment listing square PNG icons.
+
+    Args:
+        entries: Icons with "name" (file name) and "size" (pixels a side)
+        url_prefix: URL path the icons are served under, e.g. "/"
+
+    Returns:
+        UTF-8 JSON object with an "icons" member, newline-terminated
+    """
+    icons = [
+        {
+            "src": f"{url_prefix}{entry['name']}",
+            "sizes": f"{entry['size']}x{entry['size']}",
+            "type": "image/png",
+        }
+        for entry in entries
+    ]
+    return (json.dumps({"icons": icons}, indent=2) + "\n").encode()
@@ -4,6 +4,7 @@
 # dependencies = [
 #     "svgpathtools>=1.6",
 #     "pyyaml>=6.0",
+#     "numpy>=1.26",
 # ]
 # ///
 """
@@ -13,6 +14,13 @@ Generates all logo variants:
 - Wordmarks (dark, light, white, adaptive) in regular and tight versions
 - Icons (rounded, square, transparent, adaptive, white-bg) in regular and tight versions
 - Favicons (adaptive)
+- PNG exports of any of the above, rendered by the built-in rasterizer
+- A favicon bundle (ICO, PNG set, web manifest icons) from the icon geometry
+
+and losslessly optimizes every PNG it renders, as well as the docs images
+matched by PNG_OPTIMIZE. Every generated, deployed and optimized file is then
+weighed against the limits in asset-budgets.yaml (see budget.py); the run
+fails if any file is over budget.
 
 Usage:
     uv run assets/generate/generate_logos.py
@@ -21,12 +29,63 @@ Configuration:
     Edit the CONFIG section below to adjust padding, colors, etc.
 """
 
-import shutil
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any
-
-import yaml
-from svgpathtools import parse_path  # type: ignore[import-not-found]
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from assets.generate.affine import GeometryBatch
+    from assets.generate.bounds import Bounds
+    from assets.generate.budget import AssetBudget, AssetWeight, BudgetViolation
+    from assets.generate.glyphs import GlyphAtlas
+    from assets.generate.parallel import SharedGeometrySpec
+    from assets.generate.pngopt import OptimizeResult
+    from assets.generate.raster import Scene
+    from assets.generate.simplify import SimplifyStats
+    from assets.generate.templates import SvgTemplate
+    from assets.generate.writeset import WriteSet
+
+if not __package__:
+    # Run as a script: make the project root importable for assets.generate.*
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from assets.generate.cache import TransformCache, transform_key
+from assets.generate.deploy import (
+    GZIP_SUFFIX,
+    METHOD_DROPPED,
+    METHOD_UNCHANGED,
+    METHOD_WRITE,
+    PRECOMPRESS_SUFFIXES,
+    DeployItem,
+    DeployResult,
+    PrecompressResult,
+    apply_precompressed,
+    check_sources,
+    deploy_file,
+    deploy_staged,
+    gzip_compress,
+    gzip_sibling,
+    load_mappings,
+    plan_deploy,
+    precompress_files,
+    prune_orphans,
+)
+from assets.generate.graph import BuildGraph, BuildRun, Deps, UnknownTargetError
+from assets.generate.manifest import BuildManifest, git_blob_hash, inputs_hash
+from assets.generate.pathdata import (
+    PathData,
+    UnsupportedPathCommandError,
+)
+from assets.generate.profiling import StageProfiler
 
 # =============================================================================
 # CONFIG - Edit these values to adjust the output
@@ -75,14 +134,134 @@ CONFIG = {
         "cream": "#fef3c7",
         "dark_text": "#0c0a09",
     },
+    # Path data output
+    "svg": {
+        # Decimal places of wordmark coordinates; None keeps full precision
+        "precision": 2,
+        # Paths whose shapes match to within this distance once moved to the
+        # same position are drawn from one <defs> shape; None shares nothing.
+        # Off by default, so it saves no bytes: the wordmark has no exact
+        # repeats. The drawn "p2"/"t2" differ from "p"/"t" by 0.1-unit
+        # rounding, and any tolerance that folds them (just over 0.1) also
+        # folds the icon "ag" into the text "ag", a design change
+        "dedup_tolerance": None,
+        # Wordmark outlines may move by up to this many user units to drop
+        # and merge segments (see simplify.py); None keeps them exact
+        "simplify_tolerance": None,
+    },
+}
+
+# =============================================================================
+# CONSTANTS - Deployment
+# =============================================================================
+
+# Generated copies in deploy destinations; --prune removes those no mapping
+# covers (relative to the project root)
+PRUNE_PATTERNS = [
+    "mintlify/favicon*.svg",
+    "mintlify/logo/wordmark*.svg",
+    "public/wordmark*.svg",
+]
+
+# =============================================================================
+# CONSTANTS - Raster exports
+# =============================================================================
+
+# PNGs rendered by the built-in rasterizer (see raster.py): source SVG relative
+# to assets/ -> [width, height] of each export, written next to the source as
+# {stem}_{width}x{height}.png. Sources may be static or generated wordmarks.
+PNG_EXPORTS = {
+    "icon/icon-rounded-tight.svg": [[512, 512]],
 }
 
+# PNGs optimized in place after deploying (see pngopt.py): glob patterns
+# relative to the project root. Generated rasters are optimized as rendered
+PNG_OPTIMIZE = ["mintlify/images/*.png"]
+
+# Favicon bundle, written to assets/favicon/ (deployable via the favicon
+# category of asset-mappings.yaml). Every file is rendered from one parse of
+# source: a multi-size ICO, square PNGs, and the "icons" member of a web app
+# manifest listing the PNGs marked "manifest"
+FAVICON_DIR = "favicon"
+FAVICON_BUNDLE = {
+    "source": "icon/icon-rounded-tight.svg",
+    "ico": {"name": "favicon.ico", "sizes": [16, 32, 48]},
+    "png": [
+        {"name": "favicon-32x32.png", "size": 32},
+        {"name": "apple-touch-icon.png", "size": 180},
+        {"name": "icon-192.png", "size": 192, "manifest": True},
+        {"name": "icon-512.png", "size": 512, "manifest": True},
+    ],
+    "webmanifest": {"name": "site.webmanifest", "url_prefix": "/"},
+    # Renders up to max_size pixels use the source simplified to within
+    # tolerance viewBox units (see simplify.py), which they cannot resolve
+    "simplify": {"tolerance": 0.1, "max_size": 48},
+}
+
+# =============================================================================
+# CONSTANTS - Watch mode
+# =============================================================================
+
+# Module-level literals that --watch re-reads from this file and applies
+# without restarting; editing anything else restarts the watcher
+WATCHED_DATA = (
+    "CONFIG",
+    "ICON_PATHS",
+    "GLYPHS",
+    "WORDMARK_TEXT",
+    "GENERATOR_VERSION",
+    "PNG_EXPORTS",
+    "FAVICON_BUNDLE",
+)
+
+# =============================================================================
+# CONSTANTS - Incremental build
+# =============================================================================
+
+# Bump whenever a code change alters generated output, so that outputs recorded
+# in the build manifest are rebuilt even though CONFIG and path data are unchanged
+GENERATOR_VERSION = 7
+
+MANIFEST_FILE = "generate-lock.yaml"
+
+# Size and complexity limits of generated and deployed assets (see budget.py),
+# next to this script
+BUDGETS_FILE = "asset-budgets.yaml"
+
+WORDMARK_VARIANTS = ["dark", "light", "white", "adaptive"]
+
+# Fill roles of the fixed-color wordmarks (see wordmark_palette()); each is a
+# slot of the compiled wordmark template
+WORDMARK_ROLES = ("bg", "icon_ag", "prompt", "accent")
+
 # =============================================================================
-# CONSTANTS - YAML Keys
+# CONSTANTS - Transform cache
 # =============================================================================
 
-YAML_KEY_SOURCE = "source"
-YAML_KEY_DEST = "dest"
+# Persistent cache location, relative to the project root; override with the
+# LOGO_CACHE_DIR environment variable (an empty value disables it)
+CACHE_DIR = ".cache/generate-logos"
+ENV_CACHE_DIR = "LOGO_CACHE_DIR"
+
+# Advisory lock held while a run writes, relative to the project root; keeps
+# concurrent runs (e.g. parallel CI jobs) from interleaving their writes
+LOCK_FILE = ".cache/generate-logos.lock"
+
+# Shared by transform_path() and layout_paths(); main() attaches CACHE_DIR
+TRANSFORM_CACHE = TransformCache()
+
+# Content hashes of PNGs known to be optimal (see optimize_images()); main()
+# attaches CACHE_DIR/png
+PNG_CACHE = TransformCache()
+
+# Optimized renders, base64 encoded and keyed by render_key(); main() attaches
+# CACHE_DIR/render, which --check only reads
+RENDER_CACHE = TransformCache()
+
+# Per-stage timings and allocation peaks; enabled by --profile and --report
+PROFILER = StageProfiler()
+
+BUILD_REPORT_SCHEMA = "generate-report/v1"
 
 # =============================================================================
 # ICON AND TEXT PATH DATA
@@ -96,28 +275,231 @@ ICON_PATHS = {
     "icon_g": "M 42.2 26.8L 42.8 28.6Q 42.2 28.8 41.5 28.9Q 40.8 28.9 39.9 28.9Q 40.8 29.4 41.3 30.0Q 41.7 30.6 41.7 31.5Q 41.7 32.5 41.2 33.3Q 40.7 34.1 39.8 34.5Q 39.0 34.9 37.7 34.9Q 37.3 34.9 36.9 34.9Q 36.6 34.9 36.3 34.8Q 35.9 35.1 35.9 35.6Q 35.9 35.9 36.1 36.1Q 36.4 36.4 37.1 36.4H 38.9Q 40.0 36.4 40.8 36.8Q 41.6 37.1 42.1 37.8Q 42.6 38.4 42.6 39.2Q 42.6 40.7 41.3 41.6Q 40.0 42.4 37.5 42.4Q 35.8 42.4 34.8 42.0Q 33.8 41.6 33.4 41.0Q 33.0 40.3 33.0 39.2H 34.9Q 34.9 39.8 35.1 40.1Q 35.4 40.5 35.9 40.6Q 36.5 40.8 37.6 40.8Q 39.2 40.8 39.8 40.4Q 40.4 40.0 40.4 39.3Q 40.4 38.7 39.9 38.4Q 39.3 38.0 38.5 38.0H 36.7Q 35.3 38.0 34.6 37.5Q 34.0 36.9 34.0 36.1Q 34.0 35.0 35.1 34.3Q 34.2 33.8 33.7 33.1Q 33.3 32.4 33.3 31.4Q 33.3 30.4 33.9 29.6Q 34.4 28.7 35.4 28.3Q 36.3 27.8 37.6 27.8Q 38.8 27.9 39.6 27.7Q 40.4 27.6 41.0 27.3Q 41.6 27.1 42.2 26.8ZM 37.6 29.3Q 36.6 29.3 36.0 29.9Q 35.5 30.5 35.5 31.4Q 35.5 32.4 36.0 33.0Q 36.6 33.5 37.6 33.5Q 38.6 33.5 39.1 33.0Q 39.6 32.4 39.6 31.4Q 39.6 29.3 37.6 29.3Z",
 }
 
-# Text paths for "Outcome Engineering" (in regular coordinate space)
-TEXT_PATHS = {
-    "a": "M 77.5 35.8Q 77.5 36.4 77.6 36.6Q 77.8 36.9 78.2 37.0L 77.7 38.5Q 77.0 38.4 76.5 38.1Q 75.9 37.8 75.6 37.1Q 75.1 37.8 74.2 38.1Q 73.4 38.5 72.4 38.5Q 70.9 38.5 70.0 37.6Q 69.1 36.8 69.1 35.4Q 69.1 33.7 70.3 32.9Q 71.6 32.0 73.9 32.0H 75.3V 31.4Q 75.3 30.4 74.7 29.9Q 74.2 29.5 73.1 29.5Q 72.6 29.5 71.9 29.6Q 71.2 29.8 70.4 30.0L 69.9 28.5Q 70.8 28.2 71.7 28.0Q 72.6 27.8 73.4 27.8Q 75.4 27.8 76.5 28.7Q 77.5 29.6 77.5 31.2ZM 73.1 36.9Q 73.7 36.9 74.3 36.6Q 75.0 36.2 75.3 35.6V 33.4H 74.2Q 72.6 33.4 72.0 33.9Q 71.3 34.4 71.3 35.3Q 71.3 36.9 73.1 36.9Z",
-    "g": "M 89.8 26.8L 90.3 28.6Q 89.7 28.8 89.0 28.9Q 88.3 28.9 87.4 28.9Q 88.3 29.3 88.8 30.0Q 89.2 30.6 89.2 31.5Q 89.2 32.5 88.7 33.3Q 88.3 34.1 87.4 34.5Q 86.5 34.9 85.2 34.9Q 84.8 34.9 84.5 34.9Q 84.1 34.9 83.8 34.8Q 83.4 35.1 83.4 35.6Q 83.4 35.9 83.6 36.1Q 83.9 36.4 84.7 36.4H 86.4Q 87.5 36.4 88.3 36.7Q 89.2 37.1 89.6 37.7Q 90.1 38.4 90.1 39.2Q 90.1 40.7 88.8 41.5Q 87.5 42.4 85.0 42.4Q 83.3 42.4 82.3 42.0Q 81.3 41.7 80.9 41.0Q 80.5 40.3 80.5 39.2H 82.5Q 82.5 39.8 82.7 40.1Q 82.9 40.5 83.4 40.6Q 84.0 40.8 85.1 40.8Q 86.7 40.8 87.3 40.4Q 88.0 40.0 88.0 39.3Q 88.0 38.7 87.4 38.4Q 86.9 38.0 86.0 38.0H 84.2Q 82.8 38.0 82.1 37.5Q 81.5 36.9 81.5 36.1Q 81.5 35.0 82.6 34.3Q 81.7 33.8 81.3 33.1Q 80.9 32.4 80.9 31.4Q 80.9 30.4 81.4 29.6Q 81.9 28.7 82.9 28.3Q 83.8 27.8 85.1 27.8Q 86.3 27.9 87.1 27.7Q 87.9 27.6 88.5 27.3Q 89.2 27.1 89.8 26.8ZM 85.1 29.3Q 84.1 29.3 83.6 29.9Q 83.0 30.5 83.0 31.4Q 83.0 32.4 83.6 33.0Q 84.1 33.5 85.1 33.5Q 86.1 33.5 86.6 33.0Q 87.1 32.4 87.1 31.4Q 87.1 29.3 85.1 29.3Z",
-    "e": "M 94.5 33.9Q 94.6 35.4 95.4 36.1Q 96.2 36.8 97.3 36.8Q 98.0 36.8 98.7 36.6Q 99.3 36.4 100.0 35.9L 100.9 37.2Q 100.2 37.8 99.2 38.2Q 98.3 38.5 97.2 38.5Q 95.6 38.5 94.5 37.8Q 93.4 37.2 92.9 36.0Q 92.3 34.8 92.3 33.2Q 92.3 31.7 92.9 30.4Q 93.4 29.2 94.5 28.5Q 95.5 27.8 96.9 27.8Q 99.0 27.8 100.1 29.2Q 101.3 30.5 101.3 32.9Q 101.3 33.2 101.3 33.4Q 101.3 33.7 101.3 33.9ZM 97.0 29.4Q 95.9 29.4 95.3 30.1Q 94.6 30.9 94.5 32.4H 99.2Q 99.2 31.0 98.6 30.2Q 98.0 29.4 97.0 29.4Z",
-    "n": "M 104.3 38.2V 28.1H 106.1L 106.3 29.4Q 106.9 28.6 107.8 28.2Q 108.6 27.8 109.6 27.8Q 111.0 27.8 111.7 28.6Q 112.4 29.4 112.4 30.8V 38.2H 110.2V 31.9Q 110.2 30.6 110.0 30.0Q 109.7 29.5 108.8 29.5Q 108.1 29.5 107.4 29.9Q 106.8 30.4 106.4 31.0V 38.2Z",
-    "t": "M 124.3 37.7Q 123.7 38.1 122.9 38.3Q 122.1 38.5 121.3 38.5Q 119.5 38.5 118.6 37.6Q 117.7 36.7 117.7 35.2V 29.7H 115.4V 28.1H 117.7V 25.8L 119.8 25.6V 28.1H 123.3L 123.0 29.7H 119.8V 35.1Q 119.8 36.0 120.3 36.4Q 120.7 36.8 121.6 36.8Q 122.2 36.8 122.6 36.6Q 123.1 36.5 123.5 36.3Z",
-    "p": "M 132.3 27.8Q 133.6 27.8 134.4 28.5Q 135.2 29.1 135.6 30.3Q 135.9 31.5 135.9 33.2Q 135.9 34.7 135.5 35.9Q 135.1 37.1 134.2 37.8Q 133.3 38.5 132.0 38.5Q 130.4 38.5 129.5 37.4V 42.1L 127.3 42.4V 28.1H 129.2L 129.3 29.4Q 129.9 28.6 130.6 28.2Q 131.4 27.8 132.3 27.8ZM 131.7 29.5Q 130.9 29.5 130.4 29.9Q 129.8 30.4 129.5 30.9V 35.7Q 130.2 36.8 131.5 36.8Q 132.6 36.8 133.1 35.9Q 133.7 35.1 133.7 33.2Q 133.7 31.2 133.2 30.4Q 132.7 29.5 131.7 29.5Z",
-    "r": "M 138.9 38.2V 36.7H 140.4V 29.6H 138.9V 28.1H 142.1L 142.4 30.5Q 143.0 29.2 143.9 28.5Q 144.7 27.8 146.0 27.8Q 146.5 27.8 146.8 27.9Q 147.2 28.0 147.5 28.1L 147.2 31.8H 145.6V 29.8Q 144.6 29.8 143.8 30.6Q 143.0 31.5 142.6 32.9V 36.7H 144.6V 38.2Z",
-    "o": "M 154.4 27.8Q 156.6 27.8 157.8 29.3Q 159.0 30.7 159.0 33.2Q 159.0 34.8 158.4 36.0Q 157.9 37.2 156.9 37.8Q 155.9 38.5 154.4 38.5Q 152.2 38.5 151.0 37.1Q 149.8 35.6 149.8 33.2Q 149.8 31.6 150.4 30.4Q 150.9 29.2 151.9 28.5Q 152.9 27.8 154.4 27.8ZM 154.4 29.5Q 153.2 29.5 152.7 30.4Q 152.1 31.3 152.1 33.2Q 152.1 35.1 152.7 36.0Q 153.2 36.8 154.4 36.8Q 155.6 36.8 156.1 35.9Q 156.7 35.1 156.7 33.2Q 156.7 31.3 156.1 30.4Q 155.6 29.5 154.4 29.5Z",
-    "m": "M 168.9 27.8Q 169.4 27.8 169.9 28.1Q 170.4 28.3 170.6 29.0Q 170.9 29.6 170.9 30.7V 38.2H 169.0V 31.0Q 169.0 30.2 168.9 29.9Q 168.8 29.5 168.3 29.5Q 167.9 29.5 167.5 29.7Q 167.2 30.0 166.8 30.5V 38.2H 165.1V 31.0Q 165.1 30.2 164.9 29.9Q 164.8 29.5 164.4 29.5Q 164.0 29.5 163.6 29.7Q 163.3 30.0 162.9 30.5V 38.2H 161.0V 28.1H 162.6L 162.7 29.2Q 163.2 28.6 163.7 28.2Q 164.2 27.8 164.9 27.8Q 165.5 27.8 165.9 28.1Q 166.4 28.4 166.6 29.1Q 167.1 28.6 167.6 28.2Q 168.1 27.8 168.9 27.8Z",
-    "p2": "M 178.3 27.8Q 179.7 27.8 180.5 28.5Q 181.3 29.1 181.7 30.3Q 182.0 31.5 182.0 33.2Q 182.0 34.7 181.6 35.9Q 181.1 37.1 180.3 37.8Q 179.4 38.5 178.1 38.5Q 176.5 38.5 175.5 37.4V 42.1L 173.4 42.4V 28.1H 175.3L 175.4 29.4Q 176.0 28.6 176.7 28.2Q 177.5 27.8 178.3 27.8ZM 177.7 29.5Q 177.0 29.5 176.5 29.9Q 175.9 30.4 175.5 30.9V 35.7Q 176.3 36.8 177.5 36.8Q 178.6 36.8 179.2 35.9Q 179.8 35.1 179.8 33.2Q 179.8 31.2 179.3 30.4Q 178.8 29.5 177.7 29.5Z",
-    "t2": "M 193.4 37.7Q 192.8 38.1 192.0 38.3Q 191.3 38.5 190.4 38.5Q 188.7 38.5 187.7 37.6Q 186.8 36.7 186.8 35.2V 29.7H 184.6V 28.1H 186.8V 25.8L 189.0 25.6V 28.1H 192.4L 192.1 29.7H 189.0V 35.1Q 189.0 36.0 189.4 36.4Q 189.8 36.8 190.7 36.8Q 191.3 36.8 191.7 36.6Q 192.2 36.5 192.6 36.3Z",
+# Glyphs of the wordmark's monospaced face: outlines relative to the pen
+# position on the baseline (y grows downward), with advance widths
+GLYPHS = {
+    " ": {"advance": 11.55, "d": ""},
+    "a": {
+        "advance": 11.55,
+        "d": "M 9.6 -2.4Q 9.6 -1.8 9.7 -1.6Q 9.9 -1.3 10.3 -1.2L 9.8 0.3Q 9.1 0.2 8.6 -0.1Q 8 -0.4 7.7 -1.1Q 7.2 -0.4 6.3 -0.1Q 5.5 0.3 4.5 0.3Q 3 0.3 2.1 -0.6Q 1.2 -1.4 1.2 -2.8Q 1.2 -4.5 2.4 -5.3Q 3.7 -6.2 6 -6.2L 7.4 -6.2L 7.4 -6.8Q 7.4 -7.8 6.8 -8.3Q 6.3 -8.7 5.2 -8.7Q 4.7 -8.7 4 -8.6Q 3.3 -8.4 2.5 -8.2L 2 -9.7Q 2.9 -10 3.8 -10.2Q 4.7 -10.4 5.5 -10.4Q 7.5 -10.4 8.6 -9.5Q 9.6 -8.6 9.6 -7ZM 5.2 -1.3Q 5.8 -1.3 6.4 -1.6Q 7.1 -2 7.4 -2.6L 7.4 -4.8L 6.3 -4.8Q 4.7 -4.8 4.1 -4.3Q 3.4 -3.8 3.4 -2.9Q 3.4 -1.3 5.2 -1.3Z",
+    },
+    "g": {
+        "advance": 11.55,
+        "d": "M 10.35 -11.4L 10.85 -9.6Q 10.25 -9.4 9.55 -9.3Q 8.85 -9.3 7.95 -9.3Q 8.85 -8.9 9.35 -8.2Q 9.75 -7.6 9.75 -6.7Q 9.75 -5.7 9.25 -4.9Q 8.85 -4.1 7.95 -3.7Q 7.05 -3.3 5.75 -3.3Q 5.35 -3.3 5.05 -3.3Q 4.65 -3.3 4.35 -3.4Q 3.95 -3.1 3.95 -2.6Q 3.95 -2.3 4.15 -2.1Q 4.45 -1.8 5.25 -1.8L 6.95 -1.8Q 8.05 -1.8 8.85 -1.5Q 9.75 -1.1 10.15 -0.5Q 10.65 0.2 10.65 1Q 10.65 2.5 9.35 3.3Q 8.05 4.2 5.55 4.2Q 3.85 4.2 2.85 3.8Q 1.85 3.5 1.45 2.8Q 1.05 2.1 1.05 1L 3.05 1Q 3.05 1.6 3.25 1.9Q 3.45 2.3 3.95 2.4Q 4.55 2.6 5.65 2.6Q 7.25 2.6 7.85 2.2Q 8.55 1.8 8.55 1.1Q 8.55 0.5 7.95 0.2Q 7.45 -0.2 6.55 -0.2L 4.75 -0.2Q 3.35 -0.2 2.65 -0.7Q 2.05 -1.3 2.05 -2.1Q 2.05 -3.2 3.15 -3.9Q 2.25 -4.4 1.85 -5.1Q 1.45 -5.8 1.45 -6.8Q 1.45 -7.8 1.95 -8.6Q 2.45 -9.5 3.45 -9.9Q 4.35 -10.4 5.65 -10.4Q 6.85 -10.3 7.65 -10.5Q 8.45 -10.6 9.05 -10.9Q 9.75 -11.1 10.35 -11.4ZM 5.65 -8.9Q 4.65 -8.9 4.15 -8.3Q 3.55 -7.7 3.55 -6.8Q 3.55 -5.8 4.15 -5.2Q 4.65 -4.7 5.65 -4.7Q 6.65 -4.7 7.15 -5.2Q 7.65 -5.8 7.65 -6.8Q 7.65 -8.9 5.65 -8.9Z",
+    },
+    "e": {
+        "advance": 11.55,
+        "d": "M 3.5 -4.3Q 3.6 -2.8 4.4 -2.1Q 5.2 -1.4 6.3 -1.4Q 7 -1.4 7.7 -1.6Q 8.3 -1.8 9 -2.3L 9.9 -1Q 9.2 -0.4 8.2 0Q 7.3 0.3 6.2 0.3Q 4.6 0.3 3.5 -0.4Q 2.4 -1 1.9 -2.2Q 1.3 -3.4 1.3 -5Q 1.3 -6.5 1.9 -7.8Q 2.4 -9 3.5 -9.7Q 4.5 -10.4 5.9 -10.4Q 8 -10.4 9.1 -9Q 10.3 -7.7 10.3 -5.3Q 10.3 -5 10.3 -4.8Q 10.3 -4.5 10.3 -4.3ZM 6 -8.8Q 4.9 -8.8 4.3 -8.1Q 3.6 -7.3 3.5 -5.8L 8.2 -5.8Q 8.2 -7.2 7.6 -8Q 7 -8.8 6 -8.8Z",
+    },
+    "n": {
+        "advance": 11.55,
+        "d": "M 1.75 0L 1.75 -10.1L 3.55 -10.1L 3.75 -8.8Q 4.35 -9.6 5.25 -10Q 6.05 -10.4 7.05 -10.4Q 8.45 -10.4 9.15 -9.6Q 9.85 -8.8 9.85 -7.4L 9.85 0L 7.65 0L 7.65 -6.3Q 7.65 -7.6 7.45 -8.2Q 7.15 -8.7 6.25 -8.7Q 5.55 -8.7 4.85 -8.3Q 4.25 -7.8 3.85 -7.2L 3.85 0Z",
+    },
+    "t": {
+        "advance": 11.55,
+        "d": "M 10.2 -0.5Q 9.6 -0.1 8.8 0.1Q 8 0.3 7.2 0.3Q 5.4 0.3 4.5 -0.6Q 3.6 -1.5 3.6 -3L 3.6 -8.5L 1.3 -8.5L 1.3 -10.1L 3.6 -10.1L 3.6 -12.4L 5.7 -12.6L 5.7 -10.1L 9.2 -10.1L 8.9 -8.5L 5.7 -8.5L 5.7 -3.1Q 5.7 -2.2 6.2 -1.8Q 6.6 -1.4 7.5 -1.4Q 8.1 -1.4 8.5 -1.6Q 9 -1.7 9.4 -1.9Z",
+    },
+    "p": {
+        "advance": 11.55,
+        "d": "M 6.65 -10.4Q 7.95 -10.4 8.75 -9.7Q 9.55 -9.1 9.95 -7.9Q 10.25 -6.7 10.25 -5Q 10.25 -3.5 9.85 -2.3Q 9.45 -1.1 8.55 -0.4Q 7.65 0.3 6.35 0.3Q 4.75 0.3 3.85 -0.8L 3.85 3.9L 1.65 4.2L 1.65 -10.1L 3.55 -10.1L 3.65 -8.8Q 4.25 -9.6 4.95 -10Q 5.75 -10.4 6.65 -10.4ZM 6.05 -8.7Q 5.25 -8.7 4.75 -8.3Q 4.15 -7.8 3.85 -7.3L 3.85 -2.5Q 4.55 -1.4 5.85 -1.4Q 6.95 -1.4 7.45 -2.3Q 8.05 -3.1 8.05 -5Q 8.05 -7 7.55 -7.8Q 7.05 -8.7 6.05 -8.7Z",
+    },
+    "r": {
+        "advance": 11.55,
+        "d": "M 1.7 0L 1.7 -1.5L 3.2 -1.5L 3.2 -8.6L 1.7 -8.6L 1.7 -10.1L 4.9 -10.1L 5.2 -7.7Q 5.8 -9 6.7 -9.7Q 7.5 -10.4 8.8 -10.4Q 9.3 -10.4 9.6 -10.3Q 10 -10.2 10.3 -10.1L 10 -6.4L 8.4 -6.4L 8.4 -8.4Q 7.4 -8.4 6.6 -7.6Q 5.8 -6.7 5.4 -5.3L 5.4 -1.5L 7.4 -1.5L 7.4 0Z",
+    },
+    "o": {
+        "advance": 11.55,
+        "d": "M 5.65 -10.4Q 7.85 -10.4 9.05 -8.9Q 10.25 -7.5 10.25 -5Q 10.25 -3.4 9.65 -2.2Q 9.15 -1 8.15 -0.4Q 7.15 0.3 5.65 0.3Q 3.45 0.3 2.25 -1.1Q 1.05 -2.6 1.05 -5Q 1.05 -6.6 1.65 -7.8Q 2.15 -9 3.15 -9.7Q 4.15 -10.4 5.65 -10.4ZM 5.65 -8.7Q 4.45 -8.7 3.95 -7.8Q 3.35 -6.9 3.35 -5Q 3.35 -3.1 3.95 -2.2Q 4.45 -1.4 5.65 -1.4Q 6.85 -1.4 7.35 -2.3Q 7.95 -3.1 7.95 -5Q 7.95 -6.9 7.35 -7.8Q 6.85 -8.7 5.65 -8.7Z",
+    },
+    "m": {
+        "advance": 11.55,
+        "d": "M 8.6 -10.4Q 9.1 -10.4 9.6 -10.1Q 10.1 -9.9 10.3 -9.2Q 10.6 -8.6 10.6 -7.5L 10.6 0L 8.7 0L 8.7 -7.2Q 8.7 -8 8.6 -8.3Q 8.5 -8.7 8 -8.7Q 7.6 -8.7 7.2 -8.5Q 6.9 -8.2 6.5 -7.7L 6.5 0L 4.8 0L 4.8 -7.2Q 4.8 -8 4.6 -8.3Q 4.5 -8.7 4.1 -8.7Q 3.7 -8.7 3.3 -8.5Q 3 -8.2 2.6 -7.7L 2.6 0L 0.7 0L 0.7 -10.1L 2.3 -10.1L 2.4 -9Q 2.9 -9.6 3.4 -10Q 3.9 -10.4 4.6 -10.4Q 5.2 -10.4 5.6 -10.1Q 6.1 -9.8 6.3 -9.1Q 6.8 -9.6 7.3 -10Q 7.8 -10.4 8.6 -10.4Z",
+    },
 }
 
-# Content bounds (for calculating transforms)
-CONTENT_BOUNDS = {
-    "left_x": 10.4,
-    "right_x": 193.4,
-    "center_y": 32.0,
+# Wordmark text set from GLYPHS: "agent" in the accent color, then "prompt"
+WORDMARK_TEXT = {
+    "accent": "agent",
+    "text": "prompt",
+    "origin": [67.9, 38.2],  # pen position of the first glyph (regular layout)
+    # The lettering's second "p" and "t" are drawn 0.2 units left of the atlas
+    # glyphs; these outlines replace them (see GlyphAtlas.layout())
+    "variants": {
+        "p2": {
+            "advance": 11.55,
+            "d": "M 6.45 -10.4Q 7.85 -10.4 8.65 -9.7Q 9.45 -9.1 9.85 -7.9Q 10.15 -6.7 10.15 -5Q 10.15 -3.5 9.75 -2.3Q 9.25 -1.1 8.45 -0.4Q 7.55 0.3 6.25 0.3Q 4.65 0.3 3.65 -0.8L 3.65 3.9L 1.55 4.2L 1.55 -10.1L 3.45 -10.1L 3.55 -8.8Q 4.15 -9.6 4.85 -10Q 5.65 -10.4 6.45 -10.4ZM 5.85 -8.7Q 5.15 -8.7 4.65 -8.3Q 4.05 -7.8 3.65 -7.3L 3.65 -2.5Q 4.45 -1.4 5.65 -1.4Q 6.75 -1.4 7.35 -2.3Q 7.95 -3.1 7.95 -5Q 7.95 -7 7.45 -7.8Q 6.95 -8.7 5.85 -8.7Z",
+        },
+        "t2": {
+            "advance": 11.55,
+            "d": "M 10 -0.5Q 9.4 -0.1 8.6 0.1Q 7.9 0.3 7 0.3Q 5.3 0.3 4.3 -0.6Q 3.4 -1.5 3.4 -3L 3.4 -8.5L 1.2 -8.5L 1.2 -10.1L 3.4 -10.1L 3.4 -12.4L 5.6 -12.6L 5.6 -10.1L 9 -10.1L 8.7 -8.5L 5.6 -8.5L 5.6 -3.1Q 5.6 -2.2 6 -1.8Q 6.4 -1.4 7.3 -1.4Q 7.9 -1.4 8.3 -1.6Q 8.8 -1.7 9.2 -1.9Z",
+        },
+    },
 }
 
+# Glyph atlas parsed from GLYPHS (built on first use)
+_atlas: "GlyphAtlas | None" = None
+
+# Icon paths and the set wordmark text packed into one buffer (built on first use)
+_geometry: "GeometryBatch | None" = None
+
+# Regular-layout path data of every path in _geometry (built on first use)
+_paths: dict[str, str] | None = None
+
+# Node and byte reductions of simplified geometry, keyed by what was
+# simplified: "wordmark" or a raster source (filled as it is simplified)
+SIMPLIFY_STATS: "dict[str, SimplifyStats]" = {}
+
+# Exact bounds of every path in _geometry (computed on first use)
+_bounds: "dict[str, Bounds] | None" = None
+
+
+def get_atlas() -> "GlyphAtlas":
+    """Return the glyph atlas parsed from GLYPHS."""
+    global _atlas
+    if _atlas is None:
+        from assets.generate.glyphs import GlyphAtlas
+
+        with PROFILER.stage("parse"):
+            _atlas = GlyphAtlas.from_data(GLYPHS)
+    return _atlas
+
+
+def layout_text(text: str, origin: tuple[float, float] = (0.0, 0.0)) -> dict[str, str]:
+    """
+    Set any string in the wordmark face.
+
+    Args:
+        text: Characters to set; each must have an entry in GLYPHS
+        origin: Pen position of the first glyph, on the baseline
+
+    Returns:
+        Path data of every non-blank glyph, named as by GlyphAtlas.names()
+
+    Raises:
+        UnknownGlyphError: If text has characters GLYPHS lacks
+    """
+    return get_atlas().layout(text, origin).to_d()
+
+
+def wordmark_text_names() -> tuple[list[str], list[str]]:
+    """Path names of the accent glyphs and of the remaining WORDMARK_TEXT glyphs."""
+    atlas = get_atlas()
+    names = atlas.names(WORDMARK_TEXT["accent"] + WORDMARK_TEXT["text"])
+    split = len(atlas.names(WORDMARK_TEXT["accent"]))
+    return names[:split], names[split:]
+
+
+def get_geometry() -> "GeometryBatch":
+    """Return ICON_PATHS and the set WORDMARK_TEXT packed for batch transforms."""
+    global _geometry
+    if _geometry is None:
+        from assets.generate.affine import GeometryBatch
+        from assets.generate.glyphs import Glyph
+
+        atlas = get_atlas()
+        with PROFILER.stage("parse"):
+            icons = GeometryBatch.from_paths(ICON_PATHS)
+            variants = {
+                name: Glyph.from_data(entry)
+                for name, entry in WORDMARK_TEXT["variants"].items()
+            }
+        with PROFILER.stage("layout"):
+            text = atlas.layout(
+                WORDMARK_TEXT["accent"] + WORDMARK_TEXT["text"],
+                tuple(WORDMARK_TEXT["origin"]),
+                variants,
+            )
+        _geometry = GeometryBatch.concat([icons, text])
+        tolerance = CONFIG["svg"]["simplify_tolerance"]
+        if tolerance is not None:
+            from assets.generate.simplify import simplify_batch, simplify_stats
+
+            with PROFILER.stage("simplify"):
+                simplified = simplify_batch(_geometry, tolerance)
+            SIMPLIFY_STATS["wordmark"] = simplify_stats(
+                _geometry, simplified, CONFIG["svg"]["precision"]
+            )
+            _geometry = simplified
+    return _geometry
+
+
+def wordmark_paths() -> dict[str, str]:
+    """Path data of every icon path and text glyph in the regular layout."""
+    global _paths
+    if _paths is None:
+        geometry = get_geometry()
+        # Icon paths are kept as written unless simplification changed them
+        icon_paths = ICON_PATHS if CONFIG["svg"]["simplify_tolerance"] is None else {}
+        with PROFILER.stage("serialize"):
+            _paths = {
+                name: icon_paths.get(name) or geometry.path(i).to_d()
+                for i, name in enumerate(geometry.names)
+            }
+    return _paths
+
+
+def get_bounds() -> "dict[str, Bounds]":
+    """Exact bounding box of every path in get_geometry()."""
+    global _bounds
+    if _bounds is None:
+        from assets.generate.bounds import batch_bounds
+
+        geometry = get_geometry()
+        with PROFILER.stage("bounds"):
+            _bounds = batch_bounds(geometry)
+    return _bounds
+
+
+def content_bounds() -> "Bounds":
+    """Bounding box of the whole wordmark (icon and text)."""
+    from assets.generate.bounds import union_bounds
+
+    return union_bounds(list(get_bounds().values()))
+
+
+def layout_paths(matrix: "np.ndarray", precision: int | None = None) -> dict[str, str]:
+    """
+    Apply an affine matrix to every path of wordmark_paths().
+
+    Results come from TRANSFORM_CACHE where possible; on any miss the whole
+    geometry is transformed in one batch and the missing entries stored.
+
+    Args:
+        matrix: 2x3 affine matrix (see assets.generate.affine)
+        precision: Decimal places of the output, None for full precision
+
+    Returns:
+        Transformed path data keyed by path name
+    """
+    from assets.generate.affine import svg_coefficients
+
+    sources = wordmark_paths()
+    coefficients = svg_coefficients(matrix)
+    keys = {
+        name: transform_key(d, coefficients, precision) for name, d in sources.items()
+    }
+
+    paths: dict[str, str] = {}
+    missing: list[str] = []
+    for name, key in keys.items():
+        cached = TRANSFORM_CACHE.get(key)
+        if cached is None:
+            missing.append(name)
+        else:
+            paths[name] = cached
+
+    if missing:
+        geometry = get_geometry()
+        with PROFILER.stage("transform"):
+            batch = geometry.transformed(matrix)
+        with PROFILER.stage("serialize"):
+            transformed = batch.to_d(precision)
+        for name in missing:
+            TRANSFORM_CACHE.put(keys[name], transformed[name])
+            paths[name] = transformed[name]
+
+    return {name: paths[name] for name in sources}
+
 
 # =============================================================================
 # PATH TRANSFORMATION FUNCTIONS
@@ -128,20 +510,54 @@ def transform_path(
     d: str,
     translate: tuple[float, float] = (0.0, 0.0),
     scale: float = 1.0,
+    precision: int | None = None,
 ) -> str:
     """
-    Transform SVG path data using svgpathtools.
+    Transform SVG path data.
 
     Applies scale first, then translation (standard transform order).
+    Results are memoized in TRANSFORM_CACHE.
+
+    Paths in the M/L/H/V/Q/C/Z grammar go through the array-backed PathData;
+    anything else (arcs, smooth curves) falls back to svgpathtools, which
+    always writes full precision.
 
     Args:
         d: SVG path d attribute string
         translate: (x, y) offset to apply after scaling
         scale: Scale factor to apply before translation
+        precision: Decimal places of the output, written in the shortest form
+            (see PathData.to_d()); None for full precision
 
     Returns:
         Transformed path string
     """
+    key = transform_key(
+        d, (scale, 0.0, 0.0, scale, translate[0], translate[1]), precision
+    )
+    cached = TRANSFORM_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        path = PathData.parse(d)
+    except UnsupportedPathCommandError:
+        result = _transform_path_svgpathtools(d, translate, scale)
+    else:
+        result = path.transformed(scale, translate).to_d(precision)
+
+    TRANSFORM_CACHE.put(key, result)
+    return result
+
+
+def _transform_path_svgpathtools(
+    d: str,
+    translate: tuple[float, float],
+    scale: float,
+) -> str:
+    """Transform path data outside the PathData grammar using svgpathtools."""
+    from svgpathtools import parse_path  # type: ignore[import-not-found]
+
     path = parse_path(d)
 
     # Apply scale if not identity (use abs comparison for floats)
@@ -161,6 +577,50 @@ def make_path_element(d: str, fill: str, comment: str | None = None) -> str:
     return f'{comment_str}    <path d="{d}" fill="{fill}"/>'
 
 
+def make_layout_element(
+    layout: "WordmarkLayout",
+    name: str,
+    fill: str | None = None,
+    comment: str | None = None,
+) -> str:
+    """
+    Create the element drawing path `name` of a layout.
+
+    A <use> of its shared shape if it has one (see share_shapes()), else a
+    <path>. Without a fill, the element inherits one.
+    """
+    comment_str = f"    <!-- {comment} -->\n" if comment else ""
+    fill_attr = f' fill="{fill}"' if fill is not None else ""
+    if name not in layout.uses:
+        return f'{comment_str}    <path d="{layout.paths[name]}"{fill_attr}/>'
+    shape, x, y = layout.uses[name]
+    return (
+        f'{comment_str}    <use href="#{shape_id(shape)}" '
+        f'x="{format_coordinate(x)}" y="{format_coordinate(y)}"{fill_attr}/>'
+    )
+
+
+def make_defs(layout: "WordmarkLayout") -> str:
+    """<defs> block of the layout's shared shapes, or "" if there are none."""
+    if not layout.shapes:
+        return ""
+    shapes = "\n".join(
+        f'    <path id="{shape_id(shape)}" d="{d}"/>'
+        for shape, d in layout.shapes.items()
+    )
+    return f"  <defs>\n{shapes}\n  </defs>\n"
+
+
+def shape_id(shape: str) -> str:
+    """Element id of a shared wordmark shape."""
+    return f"wordmark-{shape}"
+
+
+def format_coordinate(value: float) -> str:
+    """Shortest decimal that reads back as value, without a trailing ".0"."""
+    return repr(value).removesuffix(".0")
+
+
 # =============================================================================
 # ASSET DEPLOYMENT FUNCTIONS
 # =============================================================================
@@ -170,39 +630,106 @@ def deploy_assets(
     mappings: dict[str, Any],
     assets_dir: Path,
     project_root: Path,
+    link: bool = False,
+    prune: bool = False,
+    precompress: bool = False,
 ) -> int:
     """
     Copy generated assets to destinations based on categorized mappings.
 
+    Every mapping is validated before anything is copied, and destinations that
+    already match their source are skipped.
+
     Args:
         mappings: Parsed YAML dict where each key is a category (favicon, wordmark)
                   and each value is a list of {source, dest} mappings.
                   Source is filename only; category implies source directory.
         assets_dir: Root assets directory (source paths are assets_dir/category/filename)
         project_root: Project root directory (dest paths are relative to this)
+        link: Allow hard links instead of copies where possible
+        prune: Delete unmapped copies matching PRUNE_PATTERNS
+        precompress: Also write a .gz sibling next to each deployed SVG (see
+            precompress_deployed())
 
     Returns:
         Number of files deployed
 
     Raises:
         FileNotFoundError: If source file doesn't exist
+        ValueError: If a mapping is malformed or a destination is listed twice
+    """
+    plan = plan_deploy(mappings, assets_dir, project_root)
+    check_sources(plan)
+    for item in plan:
+        deploy_file(item.source, item.dest, link=link)
+    if precompress:
+        precompress_deployed([item.dest for item in plan], jobs=os.cpu_count() or 1)
+    if prune:
+        prune_orphans(project_root, PRUNE_PATTERNS, {item.dest for item in plan})
+    return len(plan)
+
+
+def optimize_images(
+    project_root: Path,
+    patterns: Iterable[str],
+    writes: "WriteSet",
+    jobs: int = 1,
+) -> list["OptimizeResult"]:
     """
-    deployed = 0
+    Losslessly shrink the PNGs matching patterns, staging smaller versions.
 
-    for category, items in mappings.items():
-        for mapping in items:
-            # Source path: assets_dir / category / filename
-            source_file = assets_dir / category / mapping[YAML_KEY_SOURCE]
-            dest_file = project_root / mapping[YAML_KEY_DEST]
+    Files recorded in PNG_CACHE as optimal are skipped without decoding.
 
-            # Create destination directory if needed
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
+    Args:
+        project_root: Directory patterns are relative to
+        patterns: Glob patterns of PNG files (see PNG_OPTIMIZE)
+        writes: Write set that smaller files are staged in
+        jobs: Worker processes to use
+
+    Returns:
+        One result per matching file, sorted by path
+
+    Raises:
+        ValueError: If a matching file is not a valid PNG
+    """
+    from assets.generate.pngopt import optimize_files
+
+    paths = sorted(
+        {path for pattern in patterns for path in project_root.glob(pattern)}
+    )
+    with PROFILER.stage("optimize"):
+        results = optimize_files(paths, PNG_CACHE, jobs=jobs)
+    for result in results:
+        if result.changed:
+            writes.add(result.path, result.data)
+    return results
+
+
+def precompress_deployed(
+    paths: Iterable[Path],
+    writes: "WriteSet | None" = None,
+    jobs: int = 1,
+) -> list[PrecompressResult]:
+    """
+    Bring the .gz sibling of every deployed SVG up to date.
+
+    Siblings already compressed from their file's current content are left
+    alone; those of files that gzip does not shrink are deleted.
 
-            # Copy file with metadata preservation
-            shutil.copy2(source_file, dest_file)
-            deployed += 1
+    Args:
+        paths: Deployed files; those without a PRECOMPRESS_SUFFIXES suffix
+            are skipped
+        writes: Write set that new siblings are staged in; None writes them
+        jobs: Threads to compress in
 
-    return deployed
+    Returns:
+        One result per precompressed file
+    """
+    selected = [path for path in paths if path.suffix in PRECOMPRESS_SUFFIXES]
+    with PROFILER.stage("gzip"):
+        results = precompress_files(selected, jobs=jobs)
+    apply_precompressed(results, writes)
+    return results
 
 
 # =============================================================================
@@ -210,63 +737,154 @@ def deploy_assets(
 # =============================================================================
 
 
-def generate_wordmark(
-    variant: str,  # "dark", "light", "white", "adaptive"
-    tight: bool = False,
-) -> str:
+def wordmark_filename(variant: str, tight: bool) -> str:
+    """Output filename for a wordmark variant."""
+    return f"wordmark-{variant}-tight.svg" if tight else f"wordmark-{variant}.svg"
+
+
+def wordmark_inputs(variant: str, tight: bool) -> dict[str, Any]:
     """
-    Generate a wordmark SVG.
+    Everything generate_wordmark(variant, tight) depends on.
+
+    Hashed into the build manifest to decide whether an output is fresh.
+    """
+    layout = "tight" if tight else "regular"
+    return {
+        "generator": GENERATOR_VERSION,
+        "variant": variant,
+        "tight": tight,
+        "layout": CONFIG["wordmark"][layout],
+        "colors": CONFIG["colors"],
+        "icon": ICON_PATHS,
+        "glyphs": GLYPHS,
+        "text": WORDMARK_TEXT,
+        "svg": CONFIG["svg"],
+    }
+
+
+@dataclass(frozen=True)
+class WordmarkLayout:
+    """Laid-out wordmark geometry shared by every color variant."""
+
+    viewbox_width: int
+    viewbox_height: int
+    corner_radius: int
+    paths: dict[str, str]
+    # Shared shapes by name (see share_shapes()), first point at the origin
+    shapes: dict[str, str] = field(default_factory=dict)
+    # (shape, x, y) of every path drawn as a <use> of a shared shape
+    uses: dict[str, tuple[str, float, float]] = field(default_factory=dict)
+
+
+def share_shapes(
+    paths: Mapping[str, str],
+    tolerance: float | None,
+    precision: int | None = None,
+) -> tuple[dict[str, str], dict[str, tuple[str, float, float]]]:
+    """
+    Find laid-out paths that are the same shape at different positions.
+
+    Matches are found on the untransformed geometry (see
+    GeometryBatch.translation_groups()); the layout only translates paths,
+    which keeps them matching. Each group becomes one shape, named after its
+    first path and moved so its first point is at the origin, and every
+    member is drawn as that shape placed at its own first point.
 
     Args:
-        variant: Color variant ("dark", "light", "white", "adaptive")
-        tight: Whether to generate tight (scaled) version
+        paths: Laid-out path data keyed by wordmark_paths() name
+        tolerance: Largest point distance of matching shapes; None to share
+            nothing
+        precision: Decimal places of the shape path data
 
     Returns:
-        SVG content as string
+        Shape path data by shape name, and (shape, x, y) by path name
     """
-    colors = CONFIG["colors"]
+    shapes: dict[str, str] = {}
+    uses: dict[str, tuple[str, float, float]] = {}
+    if tolerance is None:
+        return shapes, uses
+
+    for group in get_geometry().translation_groups(tolerance):
+        shape = group[0]
+        first = PathData.parse(paths[shape])
+        x, y = first.coords[0], first.coords[1]
+        shapes[shape] = first.transformed(1.0, (-x, -y)).to_d(precision)
+        for name in group:
+            start = PathData.parse(paths[name]).coords
+            uses[name] = (shape, start[0], start[1])
+    return shapes, uses
+
+
+def wordmark_layout(tight: bool = False) -> WordmarkLayout:
+    """
+    Compute the viewBox and path data of the regular or tight wordmark.
+
+    Args:
+        tight: Whether to compute the tight (translated) layout
+
+    Returns:
+        Layout shared by all color variants
+    """
+    from assets.generate.affine import identity, translation
+
     wordmark_config = CONFIG["wordmark"]
+    precision = CONFIG["svg"]["precision"]
 
-    if tight:
-        # Content bounds from the original paths
-        content_left = CONTENT_BOUNDS["left_x"]
-        content_right = CONTENT_BOUNDS["right_x"]
-        content_width = content_right - content_left
-        # Content height (from path data, letters go roughly from y=14 to y=50)
-        content_top = 14
-        content_bottom = 50
-        content_height = content_bottom - content_top
-
-        h_padding = wordmark_config["tight"]["horizontal_padding"]
-        v_padding = wordmark_config["tight"]["vertical_padding"]
-        corner_radius = wordmark_config["tight"]["corner_radius"]
-
-        # Calculate viewbox dimensions
-        viewbox_width = round(content_width + 2 * h_padding)
-        viewbox_height = round(content_height + 2 * v_padding)
-
-        # Calculate offset to translate content to new position
-        offset_x = h_padding - content_left
-        offset_y = v_padding - content_top
-
-        def transform(path: str) -> str:
-            return transform_path(path, translate=(offset_x, offset_y))
-    else:
+    tolerance = CONFIG["svg"]["dedup_tolerance"]
+
+    if not tight:
         # Regular version: use original dimensions, no transformation
-        corner_radius = wordmark_config["regular"]["corner_radius"]
-        viewbox_width = wordmark_config["regular"]["viewbox_width"]
-        viewbox_height = wordmark_config["regular"]["viewbox_height"]
+        paths = (
+            dict(wordmark_paths())
+            if precision is None
+            else layout_paths(identity(), precision)
+        )
+        shapes, uses = share_shapes(paths, tolerance, precision)
+        return WordmarkLayout(
+            viewbox_width=wordmark_config["regular"]["viewbox_width"],
+            viewbox_height=wordmark_config["regular"]["viewbox_height"],
+            corner_radius=wordmark_config["regular"]["corner_radius"],
+            paths=paths,
+            shapes=shapes,
+            uses=uses,
+        )
 
-        def transform(path: str) -> str:
-            return path  # No transformation needed
+    # Exact extent of the icon and text, from the path data itself
+    bounds = content_bounds()
 
-    # Build SVG based on variant
-    if variant == "adaptive":
-        return generate_adaptive_wordmark(
-            viewbox_width, viewbox_height, corner_radius, transform
-        )
+    h_padding = wordmark_config["tight"]["horizontal_padding"]
+    v_padding = wordmark_config["tight"]["vertical_padding"]
+
+    # Calculate offset to translate content to new position
+    offset_x = h_padding - bounds.left
+    offset_y = v_padding - bounds.top
+
+    # Transform every glyph in one batched operation
+    paths = layout_paths(translation(offset_x, offset_y), precision)
+    shapes, uses = share_shapes(paths, tolerance, precision)
+
+    return WordmarkLayout(
+        viewbox_width=round(bounds.width + 2 * h_padding),
+        viewbox_height=round(bounds.height + 2 * v_padding),
+        corner_radius=wordmark_config["tight"]["corner_radius"],
+        paths=paths,
+        shapes=shapes,
+        uses=uses,
+    )
+
+
+def wordmark_palette(variant: str) -> dict[str, str]:
+    """
+    Fill colors of a fixed-color wordmark variant.
+
+    Args:
+        variant: Color variant ("dark", "light", "white")
+
+    Returns:
+        Colors for the "bg", "icon_ag", "prompt" and "accent" roles
+    """
+    colors = CONFIG["colors"]
 
-    # Determine colors based on variant
     if variant == "dark":
         bg_color = colors["dark_bg"]
         icon_ag_color = colors["cream"]
@@ -282,160 +900,1509 @@ def generate_wordmark(
     else:
         raise ValueError(f"Unknown variant: {variant}")
 
+    return {
+        "bg": bg_color,
+        "icon_ag": icon_ag_color,
+        "prompt": prompt_color,
+        "accent": colors["amber"],
+    }
+
+
+def generate_wordmark(
+    variant: str,  # "dark", "light", "white", "adaptive"
+    tight: bool = False,
+) -> str:
+    """
+    Generate a wordmark SVG.
+
+    Args:
+        variant: Color variant ("dark", "light", "white", "adaptive")
+        tight: Whether to generate tight (scaled) version
+
+    Returns:
+        SVG content as string
+    """
+    return render_wordmark(variant, wordmark_layout(tight))
+
+
+def render_wordmark(
+    variant: str,
+    layout: WordmarkLayout,
+    palette: dict[str, str] | None = None,
+) -> str:
+    """
+    Render a wordmark SVG from a precomputed layout.
+
+    Args:
+        variant: Color variant ("dark", "light", "white", "adaptive")
+        layout: Result of wordmark_layout()
+        palette: Result of wordmark_palette(variant); computed if omitted
+
+    Returns:
+        SVG content as string
+    """
+    # Build SVG based on variant
+    if variant == "adaptive":
+        return render_themed_wordmark(
+            layout, wordmark_palette("dark"), wordmark_palette("light")
+        )
+
+    if palette is None:
+        palette = wordmark_palette(variant)
+    return render_palette_wordmark(layout, palette)
+
+
+def render_palette_wordmark(layout: WordmarkLayout, palette: Mapping[str, str]) -> str:
+    """
+    Render a fixed-color wordmark SVG in the given colors.
+
+    Args:
+        layout: Result of wordmark_layout()
+        palette: A color for every WORDMARK_ROLES role
+
+    Returns:
+        SVG content as string
+    """
+    viewbox_width = layout.viewbox_width
+    viewbox_height = layout.viewbox_height
+    corner_radius = layout.corner_radius
+
+    bg_color = palette["bg"]
+    icon_ag_color = palette["icon_ag"]
+    prompt_color = palette["prompt"]
+    accent_color = palette["accent"]
+
     # Build path elements
-    paths = []
+    elements = []
 
     # Icon
-    paths.append(
-        make_path_element(
-            transform(ICON_PATHS["left_bracket"]), colors["amber"], "Left bracket"
-        )
-    )
-    paths.append(
-        make_path_element(transform(ICON_PATHS["icon_a"]), icon_ag_color, "Icon 'a'")
-    )
-    paths.append(
-        make_path_element(transform(ICON_PATHS["icon_g"]), icon_ag_color, "Icon 'g'")
+    elements.append(
+        make_layout_element(layout, "left_bracket", accent_color, "Left bracket")
     )
-    paths.append(
-        make_path_element(
-            transform(ICON_PATHS["right_bracket"]), colors["amber"], "Right bracket"
-        )
+    elements.append(make_layout_element(layout, "icon_a", icon_ag_color, "Icon 'a'"))
+    elements.append(make_layout_element(layout, "icon_g", icon_ag_color, "Icon 'g'"))
+    elements.append(
+        make_layout_element(layout, "right_bracket", accent_color, "Right bracket")
     )
 
+    accent_names, text_names = wordmark_text_names()
+
     # Text "agent" (amber)
-    for letter in ["a", "g", "e", "n", "t"]:
-        paths.append(make_path_element(transform(TEXT_PATHS[letter]), colors["amber"]))
+    for letter in accent_names:
+        elements.append(make_layout_element(layout, letter, accent_color))
 
     # Text "prompt" (off-white or dark)
-    for letter in ["p", "r", "o", "m", "p2", "t2"]:
-        paths.append(make_path_element(transform(TEXT_PATHS[letter]), prompt_color))
+    for letter in text_names:
+        elements.append(make_layout_element(layout, letter, prompt_color))
 
     svg = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {viewbox_width} {viewbox_height}">
-  <rect width="{viewbox_width}" height="{viewbox_height}" rx="{corner_radius}" fill="{bg_color}"/>
+{make_defs(layout)}  <rect width="{viewbox_width}" height="{viewbox_height}" rx="{corner_radius}" fill="{bg_color}"/>
   <g>
-{chr(10).join(paths)}
+{chr(10).join(elements)}
   </g>
 </svg>'''
 
     return svg
 
 
+def compile_wordmark_template(layout: WordmarkLayout) -> "SvgTemplate":
+    """
+    Compile a layout into a fixed-color wordmark template.
+
+    The geometry is rendered once; each WORDMARK_ROLES role becomes a fill
+    slot, so every color variant or theme is one substitution away.
+    """
+    from assets.generate.templates import SvgTemplate
+
+    with PROFILER.stage("compile"):
+        return SvgTemplate.compile(
+            lambda palette: render_palette_wordmark(layout, palette), WORDMARK_ROLES
+        )
+
+
+def generate_themes(
+    themes: Iterable[Mapping[str, str]],
+    tight: bool = False,
+) -> Iterator[str]:
+    """
+    Render the wordmark once per color theme.
+
+    The layout is compiled into a template before the first theme, after
+    which each theme costs one string substitution. Themes are consumed and
+    SVGs yielded one at a time, so memory stays bounded however many themes
+    are streamed in (e.g. from iter_yaml_documents()).
+
+    Args:
+        themes: Palettes with a color for every WORDMARK_ROLES role; other
+            keys (such as a theme name) are ignored
+        tight: Whether to use the tight layout
+
+    Yields:
+        SVG content for each theme, in order
+
+    Raises:
+        KeyError: If a theme lacks a role
+    """
+    template = compile_wordmark_template(wordmark_layout(tight))
+    for theme in themes:
+        yield template.fill(theme)
+
+
 def generate_adaptive_wordmark(
     viewbox_width: int,
     viewbox_height: int,
     corner_radius: int,
-    transform,
+    paths: dict[str, str],
 ) -> str:
-    """Generate adaptive wordmark that responds to system color scheme."""
-    colors = CONFIG["colors"]
+    """
+    Generate adaptive wordmark that responds to system color scheme.
 
-    # Icon brackets (always amber)
-    bracket_left = make_path_element(
-        transform(ICON_PATHS["left_bracket"]), colors["amber"]
+    The dark variant's colors by default, the light variant's under
+    prefers-color-scheme: dark, so the logo always contrasts with the page.
+
+    Args:
+        viewbox_width: Width of the SVG viewBox
+        viewbox_height: Height of the SVG viewBox
+        corner_radius: Background corner radius
+        paths: Laid-out path data for every wordmark_paths() key
+    """
+    svg_config = CONFIG["svg"]
+    shapes, uses = share_shapes(
+        paths, svg_config["dedup_tolerance"], svg_config["precision"]
     )
-    bracket_right = make_path_element(
-        transform(ICON_PATHS["right_bracket"]), colors["amber"]
+    layout = WordmarkLayout(
+        viewbox_width, viewbox_height, corner_radius, paths, shapes, uses
+    )
+    return render_themed_wordmark(
+        layout, wordmark_palette("dark"), wordmark_palette("light")
     )
 
-    # Icon "ag" - light version (cream, for dark bg)
-    icon_ag_light = [
-        make_path_element(transform(ICON_PATHS["icon_a"]), colors["cream"]),
-        make_path_element(transform(ICON_PATHS["icon_g"]), colors["cream"]),
-    ]
-
-    # Icon "ag" - dark version (dark text, for light bg)
-    icon_ag_dark = [
-        make_path_element(transform(ICON_PATHS["icon_a"]), colors["dark_text"]),
-        make_path_element(transform(ICON_PATHS["icon_g"]), colors["dark_text"]),
-    ]
 
-    # Text "agent" (always amber)
-    agent_paths = []
-    for letter in ["a", "g", "e", "n", "t"]:
-        agent_paths.append(
-            make_path_element(transform(TEXT_PATHS[letter]), colors["amber"])
-        )
+def render_themed_wordmark(
+    layout: WordmarkLayout,
+    palette: Mapping[str, str],
+    dark_scheme_palette: Mapping[str, str] | None = None,
+) -> str:
+    """
+    Render a single-layer wordmark SVG whose fills are set by CSS.
 
-    # Text "prompt" - light version (for dark bg)
-    prompt_light = []
-    for letter in ["p", "r", "o", "m", "p2", "t2"]:
-        prompt_light.append(
-            make_path_element(transform(TEXT_PATHS[letter]), colors["light_bg"])
-        )
+    Every glyph is emitted once, inside a group per WORDMARK_ROLES role. Each
+    role is filled from a --wordmark-<role> custom property (e.g.
+    --wordmark-icon-ag), falling back to the palette color, so a page that
+    inlines the SVG can apply any theme, including the fixed-color ones, to
+    this one file.
 
-    # Text "prompt" - dark version (for light bg)
-    prompt_dark = []
-    for letter in ["p", "r", "o", "m", "p2", "t2"]:
-        prompt_dark.append(
-            make_path_element(transform(TEXT_PATHS[letter]), colors["dark_text"])
-        )
+    Args:
+        layout: Result of wordmark_layout()
+        palette: Default color of every role
+        dark_scheme_palette: Colors under prefers-color-scheme: dark; only
+            roles whose color differs from palette get a rule
 
-    svg = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {viewbox_width} {viewbox_height}">
+    Returns:
+        SVG content as string
+    """
+    accent_names, text_names = wordmark_text_names()
+    role_paths = {
+        "accent": ["left_bracket", "right_bracket", *accent_names],
+        "icon_ag": ["icon_a", "icon_g"],
+        "prompt": text_names,
+    }
+
+    def fill_rule(role: str, color: str) -> str:
+        name = role.replace("_", "-")
+        return f".{name} {{ fill: var(--wordmark-{name}, {color}); }}"
+
+    rules = [f"    {fill_rule(role, palette[role])}" for role in WORDMARK_ROLES]
+    if dark_scheme_palette is not None:
+        dark_rules = [
+            f"      {fill_rule(role, dark_scheme_palette[role])}"
+            for role in WORDMARK_ROLES
+            if dark_scheme_palette[role] != palette[role]
+        ]
+        if dark_rules:
+            rules += [
+                "    @media (prefers-color-scheme: dark) {",
+                *dark_rules,
+                "    }",
+            ]
+
+    groups = []
+    for role, names in role_paths.items():
+        elements = "\n".join(make_layout_element(layout, name) for name in names)
+        groups.append(f'  <g class="{role.replace("_", "-")}">\n{elements}\n  </g>')
+
+    svg = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {layout.viewbox_width} {layout.viewbox_height}">
   <style>
-    .bg-dark {{ opacity: 1; }}
-    .bg-light {{ opacity: 0; }}
-    .text-light {{ opacity: 1; }}
-    .text-dark {{ opacity: 0; }}
-    @media (prefers-color-scheme: dark) {{
-      .bg-dark {{ opacity: 0; }}
-      .bg-light {{ opacity: 1; }}
-      .text-light {{ opacity: 0; }}
-      .text-dark {{ opacity: 1; }}
-    }}
+{chr(10).join(rules)}
   </style>
+{make_defs(layout)}  <rect class="bg" width="{layout.viewbox_width}" height="{layout.viewbox_height}" rx="{layout.corner_radius}"/>
+{chr(10).join(groups)}
+</svg>'''
 
-  <!-- Backgrounds -->
-  <rect class="bg-dark" width="{viewbox_width}" height="{viewbox_height}" rx="{corner_radius}" fill="{colors["dark_bg"]}"/>
-  <rect class="bg-light" width="{viewbox_width}" height="{viewbox_height}" rx="{corner_radius}" fill="{colors["light_bg"]}"/>
+    return svg
 
-  <!-- Brackets (always amber) -->
-{bracket_left}
-{bracket_right}
 
-  <!-- Icon "ag" - light mode (for dark bg) -->
-  <g class="text-light">
-{chr(10).join(icon_ag_light)}
-  </g>
+# =============================================================================
+# BUILD GRAPH
+# =============================================================================
 
-  <!-- Icon "ag" - dark mode (for light bg) -->
-  <g class="text-dark">
-{chr(10).join(icon_ag_dark)}
-  </g>
 
-  <!-- "agent" (always amber) -->
-  <g>
-{chr(10).join(agent_paths)}
-  </g>
+@dataclass(frozen=True)
+class OutputStatus:
+    """Result of a generated-output node."""
 
-  <!-- "prompt" - light mode -->
-  <g class="text-light">
-{chr(10).join(prompt_light)}
-  </g>
+    path: Path
+    rebuilt: bool
 
-  <!-- "prompt" - dark mode -->
-  <g class="text-dark">
-{chr(10).join(prompt_dark)}
-  </g>
-</svg>'''
 
-    return svg
+def add_wordmark_nodes(graph: BuildGraph) -> list[str]:
+    """
+    Add the in-memory rendering nodes of every wordmark to graph.
 
+    Node names:
+        layout:{regular,tight}        WordmarkLayout shared by all variants
+        template:{regular,tight}      Compiled template of the fixed-color variants
+        palette:{variant}             Fill colors of a fixed-color variant
+        svg:{filename}                Rendered wordmark SVG text
 
-# =============================================================================
-# MAIN
-# =============================================================================
+    Returns:
+        The svg:{filename} node names, in WORDMARK_VARIANTS order
+    """
+    graph.add("layout:regular", lambda deps: wordmark_layout(tight=False))
+    graph.add("layout:tight", lambda deps: wordmark_layout(tight=True))
+    for layout in ("regular", "tight"):
+        graph.add(
+            f"template:{layout}",
+            lambda deps: compile_wordmark_template(*deps.values()),
+            [f"layout:{layout}"],
+        )
 
+    svg_nodes = []
+    for variant in WORDMARK_VARIANTS:
+        palette_node = f"palette:{variant}"
+        if variant != "adaptive":
+            graph.add(palette_node, lambda deps, v=variant: wordmark_palette(v))
+
+        for tight in (False, True):
+            layout_name = "tight" if tight else "regular"
+            svg_node = f"svg:{wordmark_filename(variant, tight)}"
+
+            if variant == "adaptive":
+
+                def build_svg(deps: Deps) -> str:
+                    with PROFILER.stage("assemble"):
+                        return render_wordmark("adaptive", *deps.values())
+
+                graph.add(svg_node, build_svg, [f"layout:{layout_name}"])
+            else:
+
+                def build_svg(deps: Deps) -> str:
+                    template, palette = deps.values()
+                    with PROFILER.stage("assemble"):
+                        return template.fill(palette)
+
+                graph.add(
+                    svg_node, build_svg, [f"template:{layout_name}", palette_node]
+                )
+            svg_nodes.append(svg_node)
+
+    return svg_nodes
+
+
+def png_export_name(source: str, width: int, height: int) -> str:
+    """Path of a PNG export relative to assets/, e.g. icon/icon_512x512.png."""
+    path = Path(source)
+    return path.with_name(f"{path.stem}_{width}x{height}.png").as_posix()
+
+
+@dataclass(frozen=True)
+class RasterOutput:
+    """A file rendered from a source SVG, before it is written."""
+
+    node: str  # Graph node holding the file content (bytes)
+    source: str  # source:{source} node the content is rendered from
+    params: Any  # JSON-serializable settings, hashed with the source
+
+
+def raster_inputs(svg: str, params: Any) -> dict[str, Any]:
+    """Everything a RasterOutput depends on (see wordmark_inputs())."""
+    return {
+        "generator": GENERATOR_VERSION,
+        "source": git_blob_hash(svg.encode()),
+        "params": params,
+    }
+
+
+def render_key(svg: str, render_node: str) -> str:
+    """RENDER_CACHE key of a render node (see add_render_node()) of svg."""
+    return inputs_hash(
+        {
+            "generator": GENERATOR_VERSION,
+            "source": git_blob_hash(svg.encode()),
+            "node": render_node,
+        }
+    )
+
+
+def render_png(
+    scene: "Scene", width: int, height: int, optimize: bool = False
+) -> bytes:
+    """
+    Rasterize a parsed SVG and encode it as PNG.
+
+    Args:
+        scene: Parsed SVG
+        width: Width in pixels
+        height: Height in pixels
+        optimize: Search for the smallest encoding (see pngopt.py) instead of
+            encoding once
+    """
+    from assets.generate.raster import render
+
+    with PROFILER.stage("rasterize"):
+        pixels = render(scene, width, height)
+    if optimize:
+        from assets.generate.pngopt import encode_optimized
+
+        with PROFILER.stage("optimize"):
+            return encode_optimized(pixels)
+
+    from assets.generate.png import encode_png
+
+    with PROFILER.stage("encode"):
+        return encode_png(pixels)
+
+
+def add_render_node(
+    graph: BuildGraph,
+    source: str,
+    width: int,
+    height: int,
+    assets_dir: Path,
+    simplify: float | None = None,
+) -> str:
+    """
+    Add a node rendering source as a PNG of the given size, if not present.
+
+    The source is read and parsed once per graph, however many sizes are
+    rendered from it; sources that are generated wordmarks are read from
+    their svg:{filename} node, so add_wordmark_nodes() must have run first.
+
+    Node names:
+        source:{source}               SVG text
+        scene:{source}                Parsed SVG
+        scene:{source}~{tolerance}    Parsed SVG, simplified (see simplify.py)
+        render:{source}@{w}x{h}       Optimized PNG
+        render:{source}@{w}x{h}~{tolerance}
+                                      Optimized PNG of the simplified scene
+
+    Renders are looked up in RENDER_CACHE first, so a source that has not
+    changed is neither parsed nor rendered again.
+
+    Args:
+        simplify: Tolerance, in viewBox units, to simplify the scene to
+            before rendering; None renders it as parsed
+
+    Returns:
+        The render node name
+
+    Raises:
+        FileNotFoundError: If source is neither present nor generated
+    """
+    suffix = "" if simplify is None else f"~{simplify}"
+    render_node = f"render:{source}@{width}x{height}{suffix}"
+    if render_node in graph:
+        return render_node
+
+    source_node = f"source:{source}"
+    scene_node = f"scene:{source}"
+    if source_node not in graph:
+        svg_node = f"svg:{Path(source).name}"
+        source_path = assets_dir / source
+        if Path(source).parent.name == "wordmark" and svg_node in graph:
+            graph.add(source_node, lambda deps, n=svg_node: deps[n], [svg_node])
+        elif source_path.is_file():
+            graph.add(source_node, lambda deps, p=source_path: p.read_text())
+        else:
+            raise FileNotFoundError(f"Raster source not found: {source_path}")
+
+        def parse_scene(deps: Deps) -> "Scene":
+            from assets.generate.raster import parse_svg_scene
+
+            with PROFILER.stage("parse"):
+                return parse_svg_scene(*deps.values())
+
+        graph.add(scene_node, parse_scene, [source_node])
+
+    if simplify is not None and f"{scene_node}{suffix}" not in graph:
+
+        def simplify_scene(deps: Deps) -> "Scene":
+            from assets.generate.raster import Scene
+            from assets.generate.simplify import simplify_batch, simplify_stats
+
+            (scene,) = deps.values()
+            with PROFILER.stage("simplify"):
+                geometry = simplify_batch(scene.geometry, simplify)
+            SIMPLIFY_STATS[f"{source}{suffix}"] = simplify_stats(
+                scene.geometry, geometry, CONFIG["svg"]["precision"]
+            )
+            return Scene(scene.viewbox, geometry, scene.fills)
+
+        graph.add(f"{scene_node}{suffix}", simplify_scene, [scene_node])
+
+    def render(deps: Deps) -> bytes:
+        key = render_key(deps[source_node], render_node)
+        cached = RENDER_CACHE.get(key)
+        if cached is not None:
+            return base64.b64decode(cached)
+        scene = deps[f"{scene_node}{suffix}"]
+        data = render_png(scene, width, height, optimize=True)
+        RENDER_CACHE.put(key, base64.b64encode(data).decode())
+        return data
+
+    graph.add(render_node, render, [source_node, f"{scene_node}{suffix}"])
+    return render_node
+
+
+def add_png_nodes(
+    graph: BuildGraph,
+    exports: Mapping[str, list[list[int]]],
+    assets_dir: Path,
+) -> dict[str, RasterOutput]:
+    """
+    Add the rendering nodes of PNG exports to graph (see add_render_node()).
+
+    Args:
+        graph: Graph to extend
+        exports: Sizes to export per source (see PNG_EXPORTS)
+        assets_dir: Root assets directory
+
+    Returns:
+        Each export keyed by its path relative to assets_dir
+
+    Raises:
+        FileNotFoundError: If a source is neither present nor generated
+    """
+    outputs = {}
+    for source, sizes in exports.items():
+        for width, height in sizes:
+            node = add_render_node(graph, source, width, height, assets_dir)
+            outputs[png_export_name(source, width, height)] = RasterOutput(
+                node, f"source:{source}", [width, height]
+            )
+    return outputs
+
+
+def add_favicon_nodes(
+    graph: BuildGraph,
+    bundle: Mapping[str, Any],
+    assets_dir: Path,
+) -> dict[str, RasterOutput]:
+    """
+    Add the nodes of the favicon bundle to graph (see FAVICON_BUNDLE).
+
+    Every image comes from one parse of the bundle's source, and sizes shared
+    by the ICO and the PNGs (or by PNG_EXPORTS) are rendered once.
+
+    Node names, besides those of add_render_node():
+        ico:{name}                    ICO packed from the rendered PNGs
+        webmanifest:{name}            Web app manifest icons fragment
+
+    Returns:
+        Each bundle file keyed by its path relative to assets_dir
+
+    Raises:
+        FileNotFoundError: If the source is neither present nor generated
+    """
+    from assets.generate.favicon import pack_ico, webmanifest_icons
+
+    source = bundle["source"]
+    source_node = f"source:{source}"
+    outputs = {}
+    simplify = bundle.get("simplify")
+
+    def tolerance(size: int) -> float | None:
+        if simplify is None or size > simplify["max_size"]:
+            return None
+        return simplify["tolerance"]
+
+    def render_node(size: int) -> str:
+        return add_render_node(
+            graph, source, size, size, assets_dir, simplify=tolerance(size)
+        )
+
+    for entry in bundle["png"]:
+        outputs[f"{FAVICON_DIR}/{entry['name']}"] = RasterOutput(
+            render_node(entry["size"]),
+            source_node,
+            {**entry, "simplify": tolerance(entry["size"])},
+        )
+
+    ico = bundle["ico"]
+    ico_node = f"ico:{ico['name']}"
+
+    def build_ico(deps: Deps) -> bytes:
+        with PROFILER.stage("encode"):
+            return pack_ico(deps.values())
+
+    graph.add(ico_node, build_ico, [render_node(size) for size in ico["sizes"]])
+    outputs[f"{FAVICON_DIR}/{ico['name']}"] = RasterOutput(
+        ico_node,
+        source_node,
+        {**ico, "simplify": [tolerance(size) for size in ico["sizes"]]},
+    )
+
+    manifest = bundle["webmanifest"]
+    manifest_node = f"webmanifest:{manifest['name']}"
+    icons = [entry for entry in bundle["png"] if entry.get("manifest")]
+    graph.add(
+        manifest_node,
+        lambda deps: webmanifest_icons(icons, manifest["url_prefix"]),
+    )
+    outputs[f"{FAVICON_DIR}/{manifest['name']}"] = RasterOutput(
+        manifest_node, source_node, {**manifest, "icons": icons}
+    )
+    return outputs
+
+
+def add_raster_nodes(
+    graph: BuildGraph,
+    assets_dir: Path,
+    png_exports: Mapping[str, list[list[int]]] | None,
+    favicon_bundle: Mapping[str, Any] | None,
+) -> dict[str, RasterOutput]:
+    """PNG exports and favicon bundle files, by path relative to assets_dir."""
+    outputs = add_png_nodes(graph, png_exports or {}, assets_dir)
+    if favicon_bundle:
+        outputs.update(add_favicon_nodes(graph, favicon_bundle, assets_dir))
+    return outputs
+
+
+def build_asset_graph(
+    mappings: dict[str, Any],
+    assets_dir: Path,
+    project_root: Path,
+    manifest: BuildManifest,
+    writes: "WriteSet",
+    force: bool = False,
+    link: bool = False,
+    png_exports: Mapping[str, list[list[int]]] | None = None,
+    favicon_bundle: Mapping[str, Any] | None = None,
+) -> BuildGraph:
+    """
+    Build graph of every generated and deployed asset.
+
+    Node names, besides those of add_wordmark_nodes() and add_raster_nodes():
+        assets/wordmark/{filename}    Generated file (skipped when fresh)
+        assets/{raster output}        PNG export or favicon bundle file (ditto)
+        {dest}                        Deployed copy (skipped when identical)
+
+    Generated and deployed files are named by their path relative to the
+    project root, so they can be passed to --only as-is.
+
+    Generated files, and deployed copies of them, are staged in writes; the
+    caller commits them once the run is complete. Deploys of files already on
+    disk are written directly (see deploy_file()).
+
+    Args:
+        mappings: Parsed asset-mappings.yaml
+        assets_dir: Root assets directory
+        project_root: Directory deploy destinations are relative to
+        manifest: Build manifest used to skip fresh outputs
+        writes: Write set that generated files are staged in
+        force: Regenerate outputs even if the manifest says they are fresh
+        link: Allow deploy nodes to hard-link instead of copy
+        png_exports: PNGs to render (see PNG_EXPORTS); none by default
+        favicon_bundle: Favicon files to build (see FAVICON_BUNDLE); none by
+            default
+
+    Raises:
+        FileNotFoundError: If a mapped or raster source is neither present nor
+            generated
+        ValueError: If a mapping is malformed or a destination is listed twice
+    """
+    graph = BuildGraph()
+    wordmark_dir = assets_dir / "wordmark"
+    source_root = assets_dir.parent
+
+    for svg_node in add_wordmark_nodes(graph):
+        output_path = wordmark_dir / svg_node.removeprefix("svg:")
+        target = next(
+            (variant, tight)
+            for variant in WORDMARK_VARIANTS
+            for tight in (False, True)
+            if wordmark_filename(variant, tight) == output_path.name
+        )
+
+        def build_output(
+            deps: Deps,
+            target: tuple[str, bool] = target,
+            svg_node: str = svg_node,
+            output_path: Path = output_path,
+        ) -> OutputStatus:
+            output = output_path.relative_to(assets_dir).as_posix()
+            inputs = inputs_hash(wordmark_inputs(*target))
+            with PROFILER.stage("freshness"):
+                fresh = not force and manifest.is_fresh(output, inputs)
+            if fresh:
+                return OutputStatus(output_path, rebuilt=False)
+            data = deps[svg_node].encode()
+            with PROFILER.stage("write"):
+                writes.add(output_path, data)
+                manifest.record(output, inputs, data)
+            return OutputStatus(output_path, rebuilt=True)
+
+        graph.add(
+            output_path.relative_to(source_root).as_posix(),
+            build_output,
+            [svg_node],
+        )
+
+    raster_outputs = add_raster_nodes(graph, assets_dir, png_exports, favicon_bundle)
+    for output, raster in raster_outputs.items():
+
+        def build_raster(
+            deps: Deps, output: str = output, raster: RasterOutput = raster
+        ) -> OutputStatus:
+            output_path = assets_dir / output
+            inputs = inputs_hash(raster_inputs(deps[raster.source], raster.params))
+            with PROFILER.stage("freshness"):
+                fresh = not force and manifest.is_fresh(output, inputs)
+            if fresh:
+                if raster.node.startswith("render:"):
+                    # Seed the cache from disk, so --check need not render
+                    key = render_key(deps[raster.source], raster.node)
+                    if RENDER_CACHE.get(key) is None:
+                        data = base64.b64encode(output_path.read_bytes())
+                        RENDER_CACHE.put(key, data.decode())
+                return OutputStatus(output_path, rebuilt=False)
+            data = deps[raster.node]
+            with PROFILER.stage("write"):
+                writes.add(output_path, data)
+                manifest.record(output, inputs, data)
+            return OutputStatus(output_path, rebuilt=True)
+
+        graph.add(
+            (assets_dir / output).relative_to(source_root).as_posix(),
+            build_raster,
+            [raster.source, raster.node],
+        )
+
+    generated = {source_root / name for name in graph.nodes if is_file_node(name)}
+    plan = plan_deploy(mappings, assets_dir, project_root)
+    # Fail before anything is built if a source will not be there to deploy
+    check_sources(plan, generated)
+
+    for item in plan:
+        source_node = item.source.relative_to(source_root).as_posix()
+        # Generated sources are built first; static ones are copied as-is
+        source_deps = [source_node] if source_node in graph else []
+
+        def build_deploy(deps: Deps, item: DeployItem = item) -> DeployResult:
+            deps.resolve()  # bring a generated source up to date first
+            with PROFILER.stage("deploy"):
+                if item.source in writes:  # rebuilt in this run, not on disk yet
+                    return deploy_staged(item.source, item.dest, writes, link=link)
+                return deploy_file(item.source, item.dest, link=link)
+
+        graph.add(
+            item.dest.relative_to(project_root).as_posix(), build_deploy, source_deps
+        )
+
+    return graph
+
+
+def render_outputs(
+    assets_dir: Path,
+    png_exports: Mapping[str, list[list[int]]] | None = None,
+    favicon_bundle: Mapping[str, Any] | None = None,
+    manifest: BuildManifest | None = None,
+) -> dict[Path, bytes]:
+    """
+    Build every wordmark and raster output in memory, keyed by its path.
+
+    Nothing is written; only static raster sources under assets_dir are read,
+    plus raster outputs that manifest says are fresh.
+
+    Args:
+        manifest: Build manifest; a raster output whose source and settings
+            still match its entry, and whose file is unchanged on disk, is
+            taken from disk instead of being rendered and optimized again
+
+    Raises:
+        FileNotFoundError: If a raster source is neither present nor generated
+    """
+    graph = BuildGraph()
+    svg_nodes = add_wordmark_nodes(graph)
+    raster_outputs = add_raster_nodes(graph, assets_dir, png_exports, favicon_bundle)
+    run = graph.run(svg_nodes)
+
+    wordmark_dir = assets_dir / "wordmark"
+    outputs = {
+        wordmark_dir / name.removeprefix("svg:"): run.values[name].encode()
+        for name in svg_nodes
+    }
+    for output, raster in raster_outputs.items():
+        output_path = assets_dir / output
+        if manifest is not None:
+            inputs = inputs_hash(raster_inputs(run.get(raster.source), raster.params))
+            with PROFILER.stage("freshness"):
+                fresh = manifest.is_fresh(output, inputs)
+            if fresh:
+                outputs[output_path] = output_path.read_bytes()
+                continue
+        outputs[output_path] = run.get(raster.node)
+    return outputs
+
+
+def render_assets(
+    mappings: dict[str, Any] | None = None,
+    png_exports: Mapping[str, list[list[int]]] | None = None,
+    favicon_bundle: Mapping[str, Any] | None = None,
+    assets_dir: Path | None = None,
+) -> dict[str, bytes]:
+    """
+    Render every generated asset in memory, without writing files.
+
+    Wordmarks, PNG exports and favicon bundle files are all included; the
+    only files read are static raster sources. The persistent transform
+    cache is bypassed for the duration of the call.
+
+    Args:
+        mappings: Parsed asset-mappings.yaml; when given, destinations whose
+            source is generated are included too (static sources are not)
+        png_exports: PNG exports to render; PNG_EXPORTS by default, {} for none
+        favicon_bundle: Favicon files to render; FAVICON_BUNDLE by default,
+            {} for none
+        assets_dir: Where raster sources are read from; by default the
+            assets/ directory this script is in
+
+    Returns:
+        File content keyed by POSIX path relative to the project root, e.g.
+        "assets/wordmark/wordmark-dark.svg", "assets/favicon/favicon.ico"
+        and "public/wordmark-dark.svg"
+
+    Raises:
+        FileNotFoundError: If a raster source is neither present nor generated
+    """
+    if assets_dir is None:
+        assets_dir = Path(__file__).resolve().parents[1]
+    cache_dir = TRANSFORM_CACHE.cache_dir
+    TRANSFORM_CACHE.cache_dir = None
+    try:
+        outputs = render_outputs(
+            assets_dir,
+            PNG_EXPORTS if png_exports is None else png_exports,
+            FAVICON_BUNDLE if favicon_bundle is None else favicon_bundle,
+        )
+    finally:
+        TRANSFORM_CACHE.cache_dir = cache_dir
+
+    root = Path("assets")
+    files = {
+        (root / path.relative_to(assets_dir)).as_posix(): data
+        for path, data in outputs.items()
+    }
+    for item in plan_deploy(mappings or {}, root, Path()):
+        data = files.get(item.source.as_posix())
+        if data is not None:
+            files[item.dest.as_posix()] = data
+    return files
+
+
+def is_file_node(name: str) -> bool:
+    """Whether a graph node is a file (generated or deployed), not an intermediate."""
+    return ":" not in name
+
+
+def resolve_targets(
+    graph: BuildGraph,
+    targets: list[str],
+    project_root: Path,
+) -> list[str]:
+    """
+    Map --only arguments to graph node names.
+
+    Accepts node names as listed by build_asset_graph(), optionally prefixed
+    with "./", or absolute paths inside project_root.
+
+    Raises:
+        UnknownTargetError: If a target does not name a graph node
+    """
+    resolved = []
+    for target in targets:
+        path = Path(target)
+        if path.is_absolute():
+            try:
+                path = path.resolve().relative_to(project_root.resolve())
+            except ValueError:
+                raise UnknownTargetError(target) from None
+        name = path.as_posix()
+        if name not in graph:
+            raise UnknownTargetError(target)
+        resolved.append(name)
+    return resolved
+
+
+# =============================================================================
+# CHECK MODE
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class AssetDrift:
+    """A checked file whose working tree content differs from the expected."""
+
+    path: Path
+    expected_blob: str
+    actual_blob: str | None  # None if the file is missing
+
+
+def expected_assets(
+    mappings: dict[str, Any],
+    assets_dir: Path,
+    project_root: Path,
+    png_exports: Mapping[str, list[list[int]]] | None = None,
+    favicon_bundle: Mapping[str, Any] | None = None,
+    manifest: BuildManifest | None = None,
+) -> dict[Path, bytes]:
+    """
+    Content of every generated and deployed file as it would be built now.
+
+    Everything is generated in memory and nothing is written; given a
+    manifest, fresh raster outputs are read instead (see render_outputs()).
+    Deploys of static sources read the source. Precompressed siblings are
+    included where one exists.
+
+    Raises:
+        FileNotFoundError: If a mapped source is neither present nor generated
+        ValueError: If a mapping is malformed or a destination is listed twice
+    """
+    expected = render_outputs(assets_dir, png_exports, favicon_bundle, manifest)
+    for item in plan_deploy(mappings, assets_dir, project_root):
+        source = expected.get(item.source)
+        if source is None:
+            source = item.source.read_bytes()
+        expected[item.dest] = source
+        # Precompression is optional, but a sibling that exists must match
+        sibling = gzip_sibling(item.dest)
+        if item.dest.suffix in PRECOMPRESS_SUFFIXES and sibling.exists():
+            compressed = gzip_compress(source)
+            if len(compressed) < len(source):
+                expected[sibling] = compressed
+    return expected
+
+
+def find_drift(expected: Mapping[Path, bytes]) -> list[AssetDrift]:
+    """Files whose working tree content differs from expected, by Git blob hash."""
+    drift = []
+    for path, data in expected.items():
+        blob = git_blob_hash(data)
+        try:
+            actual = git_blob_hash(path.read_bytes())
+        except FileNotFoundError:
+            actual = None
+        if actual != blob:
+            drift.append(AssetDrift(path, blob, actual))
+    return drift
+
+
+def check_assets(
+    mappings: dict[str, Any],
+    assets_dir: Path,
+    project_root: Path,
+    png_exports: Mapping[str, list[list[int]]] | None = None,
+    favicon_bundle: Mapping[str, Any] | None = None,
+) -> tuple[int, list[AssetDrift]]:
+    """
+    Compare generated and deployed files against what would be built now.
+
+    Everything is generated in memory and compared by Git blob hash. Nothing
+    is written, and the build manifest is not consulted.
+
+    Args:
+        mappings: Parsed asset-mappings.yaml
+        assets_dir: Root assets directory
+        project_root: Directory deploy destinations are relative to
+        png_exports: PNG exports to check too (see PNG_EXPORTS)
+        favicon_bundle: Favicon files to check too (see FAVICON_BUNDLE)
+
+    Returns:
+        Number of files checked, and the files that drifted
+
+    Raises:
+        FileNotFoundError: If a mapped source is neither present nor generated
+        ValueError: If a mapping is malformed or a destination is listed twice
+    """
+    expected = expected_assets(
+        mappings, assets_dir, project_root, png_exports, favicon_bundle
+    )
+    return len(expected), find_drift(expected)
+
+
+def display_path(path: Path, root: Path) -> Path:
+    """path relative to root when it is inside it, else as given."""
+    return path.relative_to(root) if path.is_relative_to(root) else path
+
+
+def format_drift(drift: list[AssetDrift], root: Path) -> list[str]:
+    """One summary line per drifted file, like `git status --short`."""
+    lines = []
+    for d in drift:
+        name = display_path(d.path, root)
+        if d.actual_blob is None:
+            lines.append(f"  D {name} (expected {d.expected_blob[:7]})")
+        else:
+            lines.append(
+                f"  M {name} ({d.actual_blob[:7]}, expected {d.expected_blob[:7]})"
+            )
+    return lines
+
+
+# =============================================================================
+# ASSET BUDGETS
+# =============================================================================
+
+
+def produced_files(run: BuildRun) -> dict[str, Path]:
+    """Generated and deployed files of a run, keyed by node name."""
+    files = {}
+    for name in run.evaluated:
+        value = run.values[name]
+        if isinstance(value, OutputStatus):
+            files[name] = value.path
+        elif isinstance(value, DeployResult):
+            files[name] = value.dest
+    return files
+
+
+def measure_assets(files: Mapping[str, bytes]) -> "dict[str, AssetWeight]":
+    """
+    Weigh each file (see budget.measure_asset()), keyed as given.
+
+    Raises:
+        ValueError: If an SVG cannot be parsed
+    """
+    from assets.generate.budget import measure_asset
+
+    with PROFILER.stage("budget"):
+        return {name: measure_asset(name, data) for name, data in files.items()}
+
+
+def report_budgets(
+    weights: "Mapping[str, AssetWeight]", budgets: "Iterable[AssetBudget]"
+) -> "list[BudgetViolation]":
+    """Print the weight of every asset and each limit it exceeds; return those."""
+    from assets.generate.budget import check_budgets, format_weight
+
+    violations = check_budgets(weights, budgets)
+    over = {violation.name for violation in violations}
+    for name in sorted(weights):
+        print(format_weight(name, weights[name], over=name in over))
+    if violations:
+        print(f"✗ Over budget ({len(violations)} limits exceeded):")
+        print("\n".join(f"  {violation}" for violation in violations))
+        print(f"Shrink the assets or raise their limits in {BUDGETS_FILE}")
+    else:
+        print(f"✓ {len(weights)} assets within budget")
+    return violations
+
+
+# =============================================================================
+# WATCH MODE
+# =============================================================================
+
+
+def read_module_data(source: str) -> tuple[dict[str, Any], str]:
+    """
+    Extract the WATCHED_DATA literals from generator source code.
+
+    Args:
+        source: Source text of this module
+
+    Returns:
+        The literal values by name, and a dump of the remaining code. Two
+        sources with equal dumps differ only in their data.
+
+    Raises:
+        SyntaxError: If source does not parse
+        ValueError: If a watched value is not a plain literal
+    """
+    import ast
+
+    tree = ast.parse(source)
+    data = {}
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id in WATCHED_DATA
+        ):
+            data[node.targets[0].id] = ast.literal_eval(node.value)
+            node.value = ast.Constant(None)
+    return data, ast.dump(tree)
+
+
+def apply_module_data(data: dict[str, Any]) -> list[str]:
+    """Replace changed WATCHED_DATA globals. Returns the names that changed."""
+    global _atlas, _bounds, _geometry, _paths
+    module = globals()
+    changed = [name for name, value in data.items() if module[name] != value]
+    simplify_tolerance = CONFIG["svg"]["simplify_tolerance"]
+    for name in changed:
+        module[name] = data[name]
+    if {"ICON_PATHS", "GLYPHS", "WORDMARK_TEXT"} & set(changed) or (
+        CONFIG["svg"]["simplify_tolerance"] != simplify_tolerance
+    ):
+        _atlas = _geometry = _paths = _bounds = None  # re-parsed on next use
+        SIMPLIFY_STATS.pop("wordmark", None)
+    return changed
+
+
+def report_lock_wait() -> None:
+    """Tell the user why the run is stalled (another run holds LOCK_FILE)."""
+    print("  Waiting for another generator run to finish...")
+
+
+def watch(
+    args: argparse.Namespace,
+    mappings_file: Path,
+    assets_dir: Path,
+    project_root: Path,
+    manifest: BuildManifest,
+) -> int:
+    """
+    --watch: rebuild whenever this module's data or the mappings change.
+
+    Edits to WATCHED_DATA are applied in-process, keeping parsed geometry and
+    the transform cache warm; the build manifest then limits the rebuild to
+    outputs whose inputs changed. Any other code change restarts the process.
+    """
+    from assets.generate.watch import debounced_changes, make_watcher
+    from assets.generate.writeset import FileLock, WriteSet
+
+    module_file = Path(__file__).resolve()
+    mappings_file = mappings_file.resolve()
+    _, code = read_module_data(module_file.read_text())
+    yaml_cache_dir = TRANSFORM_CACHE.cache_dir
+
+    watcher = make_watcher([module_file, mappings_file])
+    print()
+    print(
+        f"Watching {module_file.name} and {mappings_file.name} ({watcher.kind}), "
+        "Ctrl-C to stop..."
+    )
+    try:
+        for changed in debounced_changes(watcher):
+            start = time.perf_counter()
+            try:
+                if module_file in changed:
+                    data, new_code = read_module_data(module_file.read_text())
+                    if new_code != code:
+                        print("  Generator code changed, restarting...")
+                        watcher.close()
+                        os.execv(sys.executable, [sys.executable, *sys.argv])
+                    apply_module_data(data)
+                mappings = load_mappings(mappings_file, yaml_cache_dir)
+                writes = WriteSet()
+                graph = build_asset_graph(
+                    mappings,
+                    assets_dir,
+                    project_root,
+                    manifest,
+                    writes,
+                    link=args.link,
+                    png_exports=PNG_EXPORTS,
+                    favicon_bundle=FAVICON_BUNDLE,
+                )
+                targets = (
+                    resolve_targets(graph, args.only, project_root)
+                    if args.only
+                    else [name for name in graph.nodes if is_file_node(name)]
+                )
+                with FileLock(assets_dir.parent / LOCK_FILE, on_wait=report_lock_wait):
+                    run = graph.run(targets)
+                    manifest.save(writes)
+                    writes.commit()
+                    if args.precompress:
+                        dests = [
+                            run.values[name].dest
+                            for name in run.evaluated
+                            if isinstance(run.values[name], DeployResult)
+                        ]
+                        precompress_deployed(dests, writes, jobs=os.cpu_count() or 1)
+                        writes.commit()
+            except (SyntaxError, ValueError, FileNotFoundError, KeyError) as e:
+                print(f"  ✗ {type(e).__name__}: {e}")
+                continue
+
+            results = [run.values[name] for name in run.evaluated]
+            rebuilt = [r for r in results if isinstance(r, OutputStatus) and r.rebuilt]
+            deployed = [r for r in results if isinstance(r, DeployResult) and r.changed]
+            for status in rebuilt:
+                print(f"  ✓ {status.path.name}")
+            for result in deployed:
+                print(f"  ✓ {result.dest.relative_to(project_root)} (deployed)")
+            elapsed = (time.perf_counter() - start) * 1e3
+            print(
+                f"  Rebuilt {len(rebuilt)}, deployed {len(deployed)} "
+                f"in {elapsed:.1f} ms"
+            )
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+    return 0
+
+
+# =============================================================================
+# PROFILING AND BUILD REPORT
+# =============================================================================
+
+
+def format_profile(profiler: StageProfiler) -> list[str]:
+    """One line per stage: calls, self time and allocation peak."""
+    lines = []
+    for name, stats in profiler.stages.items():
+        lines.append(
+            f"  {name:<10} {stats.calls:>4}x {stats.seconds * 1e3:9.2f} ms "
+            f"{stats.peak_bytes / 1024:9.1f} KiB"
+        )
+    staged = sum(stats.seconds for stats in profiler.stages.values())
+    lines.append(
+        f"  {'total':<10} {'':>5} {profiler.total_seconds * 1e3:9.2f} ms "
+        f"({(profiler.total_seconds - staged) * 1e3:.2f} ms outside stages)"
+    )
+    return lines
+
+
+def build_report(
+    run: BuildRun,
+    profiler: StageProfiler,
+    weights: "Mapping[str, AssetWeight] | None" = None,
+    violations: "Iterable[BudgetViolation]" = (),
+) -> dict[str, Any]:
+    """
+    Machine-readable summary of a build for CI dashboards.
+
+    Args:
+        run: Finished graph run
+        profiler: Profiler that was enabled during the run
+        weights: Measured assets (see measure_assets()), added to their files
+        violations: Budget limits the assets exceed
+
+    Returns:
+        JSON-serializable report: stage timings, transform cache counters,
+        budget violations and, for each generated or deployed file, its size,
+        status and build time, and its weight when measured
+    """
+    weights = weights or {}
+    files = []
+    for name in run.evaluated:
+        value = run.values[name]
+        if isinstance(value, OutputStatus):
+            path, kind = value.path, "generated"
+            status = "rebuilt" if value.rebuilt else "fresh"
+        elif isinstance(value, DeployResult):
+            path, kind, status = value.dest, "deployed", value.method
+        else:
+            continue
+        entry = {
+            "path": name,
+            "kind": kind,
+            "status": status,
+            "bytes": path.stat().st_size,
+            "seconds": run.seconds[name],
+        }
+        if name in weights:
+            entry.update(asdict(weights[name]))
+        files.append(entry)
+
+    return {
+        "schema": BUILD_REPORT_SCHEMA,
+        "generator_version": GENERATOR_VERSION,
+        "total_seconds": profiler.total_seconds,
+        "stages": {
+            name: {
+                "calls": stats.calls,
+                "seconds": stats.seconds,
+                "peak_bytes": stats.peak_bytes,
+            }
+            for name, stats in profiler.stages.items()
+        },
+        "transform_cache": asdict(TRANSFORM_CACHE.stats),
+        "simplify": {name: asdict(stats) for name, stats in SIMPLIFY_STATS.items()},
+        "budget_violations": [asdict(violation) for violation in violations],
+        "files": files,
+    }
+
+
+def _init_worker(spec: "SharedGeometrySpec", cache_dir: Path | None) -> None:
+    """Process pool initializer: adopt the parent's geometry from shared memory."""
+    from assets.generate.parallel import attach_geometry
+
+    global _geometry
+    _geometry = attach_geometry(spec)
+    TRANSFORM_CACHE.cache_dir = cache_dir
+
+
+def _build_wordmark(target: tuple[str, bool]) -> str:
+    """Process pool task: generate one (variant, tight) wordmark."""
+    variant, tight = target
+    return generate_wordmark(variant, tight=tight)
+
+
+def build_wordmarks(targets: list[tuple[str, bool]], jobs: int = 1) -> list[str]:
+    """
+    Generate wordmarks for (variant, tight) targets, in target order.
+
+    Args:
+        targets: (variant, tight) pairs to generate
+        jobs: Worker processes to use; 1 generates in this process
+
+    Returns:
+        SVG content for each target, in the order given
+    """
+    if jobs <= 1 or len(targets) <= 1:
+        return [_build_wordmark(target) for target in targets]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from assets.generate.parallel import SharedGeometry
+
+    workers = min(jobs, len(targets))
+    with (
+        SharedGeometry(get_geometry()) as spec,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(spec, TRANSFORM_CACHE.cache_dir),
+        ) as pool,
+    ):
+        return list(pool.map(_build_wordmark, targets))
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate and deploy logo assets.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate every output even if the build manifest says it is fresh",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="TARGET",
+        help="build only TARGET (a generated or deployed path relative to the "
+        "project root) and what it needs; may be repeated",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="generate outputs in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="hard-link deployed files to their sources where possible",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="also write a deterministic .gz next to each deployed SVG, for "
+        "hosts that serve precompressed files",
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="delete generated copies in deploy destinations that no mapping "
+        "covers (see PRUNE_PATTERNS)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print wall time and allocation peak for each build stage",
+    )
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        metavar="FILE",
+        help="write cProfile statistics for the whole run to FILE",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="FILE",
+        help="write a JSON build report (stages, outputs, bytes, cache) to FILE",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="write nothing; exit 1 if any generated or deployed file differs "
+        "from what would be built now, or would be over budget",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="after building, keep running and rebuild affected assets whenever "
+        "this script's CONFIG or asset-mappings.yaml changes",
+    )
+    args = parser.parse_args(argv)
+    if args.watch and args.check:
+        parser.error("--watch and --check cannot be combined")
+    return args
+
+
+def run_check(
+    mappings: dict[str, Any],
+    assets_dir: Path,
+    project_root: Path,
+    budgets: "Iterable[AssetBudget]" = (),
+    manifest: BuildManifest | None = None,
+) -> int:
+    """
+    --check: report drift and budget violations without writing anything.
+
+    Budgets are checked against what would be built now, so an asset over
+    budget fails the check even when the working tree is up to date.
+
+    Args:
+        manifest: Build manifest; raster outputs it says are fresh are not
+            rendered and optimized again, which would take seconds
+
+    Returns:
+        The exit code
+    """
+    # The in-process cache is enough; the disk cache would be written to
+    TRANSFORM_CACHE.cache_dir = None
+    try:
+        expected = expected_assets(
+            mappings, assets_dir, project_root, PNG_EXPORTS, FAVICON_BUNDLE, manifest
+        )
+        weights = measure_assets(
+            {
+                display_path(path, project_root).as_posix(): data
+                for path, data in expected.items()
+            }
+        )
+    except (FileNotFoundError, ValueError) as e:
+        raise SystemExit(f"Cannot check: {e}") from None
+    drift = find_drift(expected)
+    violations = report_budgets(weights, budgets)
+
+    if not drift:
+        print(f"✓ {len(expected)} assets up to date")
+        return 1 if violations else 0
+    print(f"✗ {len(drift)} of {len(expected)} assets out of date:")
+    print("\n".join(format_drift(drift, project_root)))
+    precompress = any(d.path.name.endswith(GZIP_SUFFIX) for d in drift)
+    print(
+        "Run: uv run assets/generate/generate_logos.py"
+        + (" --precompress" if precompress else "")
+    )
+    return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.cprofile is None:
+        return build(args)
+
+    import cProfile
+
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(build, args)
+    finally:
+        profile.dump_stats(args.cprofile)
+        print(f"  cProfile stats: {args.cprofile}")
+
+
+def build(args: argparse.Namespace) -> int:
+    """Generate and deploy assets as selected by parsed arguments."""
+    if args.profile or args.report:
+        PROFILER.start()
+
+    # Assets directory structure: assets/{category}/
+    script_dir = Path(__file__).parent
+    assets_dir = script_dir.parent  # assets/generate/../ = assets/
+    wordmark_dir = assets_dir / "wordmark"
+
+    # Deploy destinations are relative to the project root
+    mappings_file = script_dir / "asset-mappings.yaml"
+    project_root = Path.cwd()
+
+    cache_dir = os.environ.get(ENV_CACHE_DIR, str(assets_dir.parent / CACHE_DIR))
+    TRANSFORM_CACHE.cache_dir = Path(cache_dir) if cache_dir else None
+    PNG_CACHE.cache_dir = Path(cache_dir) / "png" if cache_dir else None
+    RENDER_CACHE.cache_dir = Path(cache_dir) / "render" if cache_dir else None
+    RENDER_CACHE.read_only = args.check
+    # Parsed YAML is cached next to the transforms (see yamlcache); --check
+    # must not write, so it always parses
+    yaml_cache_dir = None if args.check else TRANSFORM_CACHE.cache_dir
+
+    with PROFILER.stage("yaml"):
+        try:
+            mappings = load_mappings(mappings_file, yaml_cache_dir)
+        except ValueError as e:
+            raise SystemExit(f"Cannot deploy: {e}") from None
+        from assets.generate.budget import load_budgets
+
+        try:
+            budgets = load_budgets(script_dir / BUDGETS_FILE, yaml_cache_dir)
+        except ValueError as e:
+            raise SystemExit(f"Cannot check budgets: {e}") from None
+
+    if args.check:
+        manifest = BuildManifest(script_dir / MANIFEST_FILE, assets_dir)
+        return run_check(mappings, assets_dir, project_root, budgets, manifest)
 
-def main():
-    # Assets directory structure: assets/{category}/
-    script_dir = Path(__file__).parent
-    assets_dir = script_dir.parent  # assets/generate/../ = assets/
-    wordmark_dir = assets_dir / "wordmark"
     wordmark_dir.mkdir(parents=True, exist_ok=True)
 
     wordmark_config = CONFIG["wordmark"]
-    variants = ["dark", "light", "white", "adaptive"]
+
+    from assets.generate.writeset import FileLock, WriteSet
+
+    writes = WriteSet()
+    try:
+        with PROFILER.stage("config"):
+            manifest = BuildManifest(
+                script_dir / MANIFEST_FILE, assets_dir, yaml_cache_dir
+            )
+            graph = build_asset_graph(
+                mappings,
+                assets_dir,
+                project_root,
+                manifest,
+                writes,
+                force=args.force,
+                link=args.link,
+                png_exports=PNG_EXPORTS,
+                favicon_bundle=FAVICON_BUNDLE,
+            )
+    except (FileNotFoundError, ValueError) as e:
+        raise SystemExit(f"Cannot deploy: {e}") from None
+    file_nodes = [name for name in graph.nodes if is_file_node(name)]
+    try:
+        targets = (
+            resolve_targets(graph, args.only, project_root) if args.only else file_nodes
+        )
+    except UnknownTargetError as e:
+        available = "\n  ".join(file_nodes)
+        raise SystemExit(
+            f"Unknown target: {e.args[0]}\nAvailable targets:\n  {available}"
+        ) from None
 
     print("Generating logos...")
     print(
@@ -449,35 +2416,147 @@ def main():
     print(f"  Output directory: {wordmark_dir}")
     print()
 
-    for variant in variants:
-        # Regular version
-        svg = generate_wordmark(variant, tight=False)
-        filename = f"wordmark-{variant}.svg"
-        filepath = wordmark_dir / filename
-        filepath.write_text(svg)
-        print(f"  ✓ {filename}")
-
-        # Tight version
-        svg = generate_wordmark(variant, tight=True)
-        filename = f"wordmark-{variant}-tight.svg"
-        filepath = wordmark_dir / filename
-        filepath.write_text(svg)
-        print(f"  ✓ {filename}")
-
+    # With --jobs, render the stale wordmarks in worker processes up front and
+    # hand the results to the graph instead of rendering them in-process
+    seed: dict[str, str] = {}
+    if args.jobs > 1:
+        needed = set(graph.closure(targets))
+        stale = [
+            (variant, tight)
+            for variant in WORDMARK_VARIANTS
+            for tight in (False, True)
+            if f"svg:{wordmark_filename(variant, tight)}" in needed
+            and (
+                args.force
+                or not manifest.is_fresh(
+                    f"{wordmark_dir.name}/{wordmark_filename(variant, tight)}",
+                    inputs_hash(wordmark_inputs(variant, tight)),
+                )
+            )
+        ]
+        svgs = build_wordmarks(stale, jobs=args.jobs)
+        seed = {
+            f"svg:{wordmark_filename(*target)}": svg
+            for target, svg in zip(stale, svgs, strict=True)
+        }
+
+    with FileLock(assets_dir.parent / LOCK_FILE, on_wait=report_lock_wait):
+        run = graph.run(targets, seed=seed)
+        with PROFILER.stage("write"):
+            manifest.save(writes)
+            writes.commit()
+    if PROFILER.enabled:
+        PROFILER.stop()
+
+    results = [run.values[name] for name in run.evaluated]
+    generated = [r for r in results if isinstance(r, OutputStatus)]
+    deployed = [r for r in results if isinstance(r, DeployResult)]
+    for status in generated:
+        if status.rebuilt:
+            print(f"  ✓ {status.path.name}")
+        else:
+            print(f"  · {status.path.name} (fresh)")
+    rebuilt = sum(status.rebuilt for status in generated)
+
+    stats = TRANSFORM_CACHE.stats
     print()
-    print("Done! Generated 8 wordmark files.")
+    print(f"Done! Rebuilt {rebuilt} generated files, {len(generated) - rebuilt} fresh.")
+    print(
+        f"  Transform cache: {stats.hits} hits, {stats.disk_hits} from disk, "
+        f"{stats.misses} misses"
+    )
+    print(f"  Build graph: {len(run.evaluated)} of {len(graph.nodes)} nodes evaluated")
+    for name, simplified in SIMPLIFY_STATS.items():
+        print(
+            f"  Simplified {name}: {simplified.nodes_before} → "
+            f"{simplified.nodes_after} nodes, {simplified.bytes_before:,} → "
+            f"{simplified.bytes_after:,} path bytes"
+        )
 
     # Deploy assets to destinations (paths relative to project root)
     print()
     print("Deploying assets...")
-    mappings_file = script_dir / "asset-mappings.yaml"
-    project_root = Path.cwd()
-
-    with open(mappings_file) as f:
-        mappings = yaml.safe_load(f)
+    for result in deployed:
+        if result.changed:
+            print(f"  ✓ {result.dest.relative_to(project_root)} ({result.method})")
+    copied = sum(result.changed for result in deployed)
+    print(f"  ✓ Deployed {copied} assets ({len(deployed) - copied} already up to date)")
+    precompressed: list[PrecompressResult] = []
+    if args.precompress:
+        with FileLock(assets_dir.parent / LOCK_FILE, on_wait=report_lock_wait):
+            precompressed = precompress_deployed(
+                [result.dest for result in deployed], writes, jobs=os.cpu_count() or 1
+            )
+            writes.commit()
+        for result in precompressed:
+            name = result.sibling.relative_to(project_root)
+            if result.method == METHOD_WRITE:
+                print(f"  ✓ {name} ({len(result.data):,} bytes)")
+            elif result.method == METHOD_DROPPED:
+                print(f"  · {name} (not smaller, skipped)")
+        written = sum(r.method == METHOD_WRITE for r in precompressed)
+        unchanged = sum(r.method == METHOD_UNCHANGED for r in precompressed)
+        print(f"  ✓ Precompressed {written} assets ({unchanged} already up to date)")
+    if args.prune:
+        keep = {project_root / name for name in graph.nodes if is_file_node(name)}
+        for path in prune_orphans(project_root, PRUNE_PATTERNS, keep):
+            print(f"  ✗ Pruned {path.relative_to(project_root)}")
+
+    if not args.only:
+        print()
+        print("Optimizing images...")
+        with FileLock(assets_dir.parent / LOCK_FILE, on_wait=report_lock_wait):
+            try:
+                optimized = optimize_images(
+                    project_root, PNG_OPTIMIZE, writes, jobs=os.cpu_count() or 1
+                )
+            except ValueError as e:
+                raise SystemExit(f"Cannot optimize: {e}") from None
+            writes.commit()
+        for result in optimized:
+            if result.changed:
+                print(
+                    f"  ✓ {result.path.relative_to(project_root)} "
+                    f"({result.before:,} → {result.after:,} bytes)"
+                )
+        saved = sum(result.before - result.after for result in optimized)
+        skipped = sum(result.cached for result in optimized)
+        print(
+            f"  ✓ Optimized {len(optimized)} images, saved {saved:,} bytes "
+            f"({skipped} already optimal)"
+        )
 
-    deployed_count = deploy_assets(mappings, assets_dir, project_root)
-    print(f"  ✓ Deployed {deployed_count} assets")
+    # Weigh everything this run produced, including unchanged outputs, so an
+    # asset over budget keeps failing the build until it is fixed
+    print()
+    print("Checking asset budgets...")
+    files = produced_files(run)
+    files.update(
+        (result.sibling.relative_to(project_root).as_posix(), result.sibling)
+        for result in precompressed
+        if result.method != METHOD_DROPPED
+    )
+    if not args.only:
+        files.update(
+            (result.path.relative_to(project_root).as_posix(), result.path)
+            for result in optimized
+        )
+    try:
+        weights = measure_assets(
+            {name: path.read_bytes() for name, path in files.items()}
+        )
+    except ValueError as e:
+        raise SystemExit(f"Cannot check budgets: {e}") from None
+    violations = report_budgets(weights, budgets)
+
+    if args.profile:
+        print()
+        print("Profile (self time per stage, tracemalloc peak):")
+        print("\n".join(format_profile(PROFILER)))
+    if args.report:
+        report = build_report(run, PROFILER, weights, violations)
+        args.report.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"  Build report: {args.report}")
 
     print()
     print("To adjust padding, edit CONFIG at the top of this script:")
@@ -490,6 +2569,10 @@ def main():
         f"{wordmark_config['tight']['vertical_padding']}"
     )
 
+    if args.watch:
+        return watch(args, mappings_file, assets_dir, project_root, manifest)
+    return 1 if violations else 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Glyph Atlas
+
+Sets text from an atlas of glyph outlines instead of absolute path data.
+Each glyph is parsed once, relative to its pen position on the baseline, and
+stored with its advance width. Laying out a string parses nothing: it only
+offsets the cached points of each glyph by its pen position, producing one
+GeometryBatch for the whole line.
+
+Individual occurrences of a glyph can be given their own outline when a
+line is set (see GlyphAtlas.layout()), for lettering that is not strictly
+monospaced.
+"""
+
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from assets.generate.affine import GeometryBatch
+from assets.generate.pathdata import PathData
+
+
+class UnknownGlyphError(KeyError):
+    """Raised when text uses a character the atlas has no glyph for."""
+
+
+@dataclass(frozen=True)
+class Glyph:
+    """
+    One glyph of the atlas.
+
+    Attributes:
+        commands: Command bytes of the outline (empty for blank glyphs)
+        points: Outline points, shape (n, 2), relative to the pen position
+        advance: Distance to the next glyph's pen position
+    """
+
+    commands: bytes
+    points: np.ndarray
+    advance: float
+
+    @classmethod
+    def from_data(cls, entry: Mapping[str, Any]) -> "Glyph":
+        """
+        Parse one glyph entry.
+
+        Args:
+            entry: {"d": outline relative to the pen position, "advance": width};
+                an empty "d" makes a blank glyph (e.g. space)
+
+        Raises:
+            ValueError: If the outline is invalid
+        """
+        outline = (
+            PathData.parse(entry["d"]) if entry["d"] else PathData(b"", array("d"))
+        )
+        points = np.array(outline.coords, dtype=np.float64).reshape(-1, 2)
+        points.flags.writeable = False
+        return cls(outline.commands, points, float(entry["advance"]))
+
+
+class GlyphAtlas:
+    """
+    Glyph outlines by character.
+
+    Build one with from_data() and reuse it: every layout() call reads the
+    parsed outlines, so setting many strings costs no parsing at all.
+    """
+
+    def __init__(self, glyphs: Mapping[str, Glyph]) -> None:
+        self._glyphs = dict(glyphs)
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Mapping[str, Any]]) -> "GlyphAtlas":
+        """
+        Parse glyph entries keyed by character.
+
+        Args:
+            data: Glyph entries (see Glyph.from_data()) per character
+
+        Raises:
+            ValueError: If a key is not a single character or an outline is invalid
+        """
+        glyphs = {}
+        for char, entry in data.items():
+            if len(char) != 1:
+                raise ValueError(f"Glyph keys must be single characters: {char!r}")
+            glyphs[char] = Glyph.from_data(entry)
+        return cls(glyphs)
+
+    def __contains__(self, char: object) -> bool:
+        return char in self._glyphs
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def width(self, text: str) -> float:
+        """Total advance of text."""
+        return sum(glyph.advance for glyph in self._lookup(text))
+
+    def names(self, text: str) -> list[str]:
+        """
+        Path names layout(text) gives its glyphs, in order.
+
+        A glyph is named by its character, with a count appended from the
+        second occurrence on ("p", ..., "p2"). Blank glyphs get no path.
+        """
+        seen: dict[str, int] = {}
+        names = []
+        for char, glyph in zip(text, self._lookup(text), strict=True):
+            if not glyph.commands:
+                continue
+            seen[char] = seen.get(char, 0) + 1
+            names.append(char if seen[char] == 1 else f"{char}{seen[char]}")
+        return names
+
+    def layout(
+        self,
+        text: str,
+        origin: tuple[float, float] = (0.0, 0.0),
+        variants: Mapping[str, Glyph] | None = None,
+    ) -> GeometryBatch:
+        """
+        Set text on one line.
+
+        Args:
+            text: Characters to set; each must be in the atlas
+            origin: Pen position of the first glyph, on the baseline
+            variants: Glyphs replacing the atlas glyph of single occurrences,
+                keyed by path name (e.g. "p2" for the second "p")
+
+        Returns:
+            One path per non-blank glyph, named as by names()
+
+        Raises:
+            UnknownGlyphError: If text has characters the atlas lacks
+            ValueError: If a variant names no glyph of text
+        """
+        glyphs = self._lookup(text)
+        if variants:
+            names = self.names(text)
+            unknown = sorted(variants.keys() - set(names))
+            if unknown:
+                raise ValueError(f"No glyph named {', '.join(unknown)} in {text!r}")
+            visible = (i for i, glyph in enumerate(glyphs) if glyph.commands)
+            for i, name in zip(visible, names, strict=True):
+                glyphs[i] = variants.get(name, glyphs[i])
+        advances = np.array([0.0, *(glyph.advance for glyph in glyphs[:-1])])
+        pens = origin[0] + np.cumsum(advances)
+
+        visible = [i for i, glyph in enumerate(glyphs) if glyph.commands]
+        counts = [len(glyphs[i].points) for i in visible]
+        offsets = np.zeros(len(visible) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+
+        points = np.empty((offsets[-1], 2))
+        for i, start, end in zip(visible, offsets[:-1], offsets[1:], strict=True):
+            points[start:end] = glyphs[i].points + (pens[i], origin[1])
+
+        return GeometryBatch(
+            tuple(self.names(text)),
+            tuple(glyphs[i].commands for i in visible),
+            points,
+            offsets,
+        )
+
+    def _lookup(self, text: str) -> list[Glyph]:
+        """The glyph of every character of text."""
+        try:
+            return [self._glyphs[char] for char in text]
+        except KeyError:
+            missing = sorted(set(text) - self._glyphs.keys())
+            raise UnknownGlyphError(
+                f"No glyph for {', '.join(map(repr, missing))}"
+            ) from None
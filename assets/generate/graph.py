@@ -0,0 +1,166 @@
+"""
+Asset Build Graph
+
+A small declarative build graph. Each node has a name, the names of the nodes
+it depends on, and a build function. Running a set of targets evaluates each
+needed node at most once, so intermediate results shared by several outputs
+(geometry, layouts, palettes) are computed once per run.
+
+Dependencies are resolved lazily: a build function receives a Deps accessor
+and only the dependencies it actually reads are built. An output that turns
+out to be up to date therefore never forces its inputs to be computed.
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+class UnknownTargetError(KeyError):
+    """Raised when a requested target is not a node of the graph."""
+
+
+class DependencyCycleError(ValueError):
+    """Raised when the declared dependencies of a node form a cycle."""
+
+
+@dataclass(frozen=True)
+class Node:
+    """A named build step and the nodes it may read."""
+
+    name: str
+    deps: tuple[str, ...]
+    build: Callable[["Deps"], Any]
+
+
+class Deps(Mapping[str, Any]):
+    """Lazy, read-only view of the declared dependencies of one node."""
+
+    def __init__(self, run: "BuildRun", node: Node) -> None:
+        self._run = run
+        self._node = node
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._node.deps:
+            raise KeyError(f"{self._node.name!r} does not depend on {name!r}")
+        return self._run.get(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node.deps)
+
+    def __len__(self) -> int:
+        return len(self._node.deps)
+
+    def resolve(self) -> None:
+        """Build every declared dependency now, for their effects, not values."""
+        for name in self._node.deps:
+            self._run.get(name)
+
+
+class BuildGraph:
+    """Named build nodes and their declared dependencies."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, Node] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.nodes
+
+    def add(
+        self,
+        name: str,
+        build: Callable[[Deps], Any],
+        deps: Iterable[str] = (),
+    ) -> None:
+        """Add a node. Dependencies may be added later but must exist to run."""
+        if name in self.nodes:
+            raise ValueError(f"Duplicate build node: {name!r}")
+        self.nodes[name] = Node(name, tuple(deps), build)
+
+    def closure(self, targets: Iterable[str]) -> list[str]:
+        """
+        Targets plus everything they may depend on, dependencies first.
+
+        Raises:
+            UnknownTargetError: If a target or dependency is not in the graph
+            DependencyCycleError: If dependencies form a cycle
+        """
+        order: list[str] = []
+        done: set[str] = set()
+        visiting: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise DependencyCycleError(f"Dependency cycle through {name!r}")
+            node = self.nodes.get(name)
+            if node is None:
+                raise UnknownTargetError(name)
+            visiting.add(name)
+            for dep in node.deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def run(
+        self,
+        targets: Iterable[str],
+        seed: Mapping[str, Any] | None = None,
+    ) -> "BuildRun":
+        """
+        Build targets (and whatever they read) once each.
+
+        Args:
+            targets: Node names to build, in order
+            seed: Precomputed node values to use instead of building them
+
+        Returns:
+            The finished run with every evaluated value
+        """
+        targets = list(targets)
+        self.closure(targets)  # validate names and cycles up front
+        run = BuildRun(self, seed)
+        for target in targets:
+            run.get(target)
+        return run
+
+
+class BuildRun:
+    """
+    Memoized evaluation of a BuildGraph.
+
+    Attributes:
+        values: Value of every node evaluated or seeded in this run
+        evaluated: Names of nodes whose build function ran, in order
+        seconds: Wall time of each evaluated node, including the dependencies
+            it built
+    """
+
+    def __init__(
+        self, graph: BuildGraph, seed: Mapping[str, Any] | None = None
+    ) -> None:
+        self.graph = graph
+        self.values: dict[str, Any] = dict(seed or {})
+        self.evaluated: list[str] = []
+        self.seconds: dict[str, float] = {}
+
+    def get(self, name: str) -> Any:
+        """Value of node name, building it on first use."""
+        if name in self.values:
+            return self.values[name]
+        node = self.graph.nodes.get(name)
+        if node is None:
+            raise UnknownTargetError(name)
+        start = time.perf_counter()
+        value = node.build(Deps(self, node))
+        self.seconds[name] = time.perf_counter() - start
+        self.values[name] = value
+        self.evaluated.append(name)
+        return value
@@ -0,0 +1,129 @@
+"""
+Build Manifest
+
+Tracks, for every generated output, a hash of the inputs it was built from and
+the Git blob hash of the file that was written. An output whose inputs hash
+and on-disk content both still match is fresh and can be skipped.
+
+Like spx-lock.yaml the manifest is deterministic: it holds only hashes, no
+timestamps, and is rewritten only when an entry changes.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from assets.generate.yamlcache import load_yaml
+
+if TYPE_CHECKING:
+    from assets.generate.writeset import WriteSet
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MANIFEST_SCHEMA = "generate-lock/v1"
+
+YAML_KEY_SCHEMA = "schema"
+YAML_KEY_OUTPUTS = "outputs"
+YAML_KEY_PATH = "path"
+YAML_KEY_INPUTS = "inputs"
+YAML_KEY_BLOB = "blob"
+
+
+def git_blob_hash(data: bytes) -> str:
+    """Git blob SHA-1 of data, as `git hash-object` would print it."""
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
+
+def inputs_hash(inputs: Any) -> str:
+    """SHA-256 of a JSON-serializable description of a target's inputs."""
+    canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# =============================================================================
+# MANIFEST
+# =============================================================================
+
+
+class BuildManifest:
+    """
+    Inputs hash and output blob for each generated file.
+
+    Attributes:
+        path: Manifest file location
+        root: Directory that entry paths are relative to
+        cache_dir: Where parsed manifests are cached (see yamlcache), or None
+        entries: {relative output path: {"inputs": hash, "blob": hash}}
+    """
+
+    def __init__(self, path: Path, root: Path, cache_dir: Path | None = None) -> None:
+        self.path = path
+        self.root = root
+        self.entries: dict[str, dict[str, str]] = {}
+        self._dirty = False
+
+        if path.exists():
+            data = load_yaml(path, cache_dir) or {}
+            if data.get(YAML_KEY_SCHEMA) == MANIFEST_SCHEMA:
+                for entry in data.get(YAML_KEY_OUTPUTS) or []:
+                    self.entries[entry[YAML_KEY_PATH]] = {
+                        YAML_KEY_INPUTS: entry[YAML_KEY_INPUTS],
+                        YAML_KEY_BLOB: entry[YAML_KEY_BLOB],
+                    }
+
+    def is_fresh(self, output: str, inputs: str) -> bool:
+        """
+        Whether output was built from these inputs and is unchanged on disk.
+
+        Args:
+            output: Output path relative to root
+            inputs: Current inputs hash for the output
+        """
+        entry = self.entries.get(output)
+        if entry is None or entry[YAML_KEY_INPUTS] != inputs:
+            return False
+        try:
+            data = (self.root / output).read_bytes()
+        except OSError:
+            return False
+        return git_blob_hash(data) == entry[YAML_KEY_BLOB]
+
+    def record(self, output: str, inputs: str, data: bytes) -> None:
+        """Remember that output now holds data built from inputs."""
+        entry = {YAML_KEY_INPUTS: inputs, YAML_KEY_BLOB: git_blob_hash(data)}
+        if self.entries.get(output) != entry:
+            self.entries[output] = entry
+            self._dirty = True
+
+    def dump(self) -> bytes:
+        """The manifest file content for the current entries."""
+        outputs = [
+            {YAML_KEY_PATH: output, **self.entries[output]}
+            for output in sorted(self.entries)
+        ]
+        import yaml
+
+        return yaml.safe_dump(
+            {YAML_KEY_SCHEMA: MANIFEST_SCHEMA, YAML_KEY_OUTPUTS: outputs},
+            sort_keys=False,
+        ).encode()
+
+    def save(self, writes: "WriteSet | None" = None) -> bool:
+        """
+        Write the manifest if any entry changed. Returns whether it wrote.
+
+        Args:
+            writes: Stage the manifest here instead of writing it directly
+        """
+        if not self._dirty:
+            return False
+        if writes is None:
+            self.path.write_bytes(self.dump())
+        else:
+            writes.add(self.path, self.dump())
+        self._dirty = False
+        return True
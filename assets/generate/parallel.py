@@ -0,0 +1,85 @@
+"""
+Shared Geometry for Worker Processes
+
+Publishes the point buffer of a GeometryBatch in a multiprocessing shared
+memory block. Worker processes attach to it and get a read-only, zero-copy
+view of the pre-parsed geometry instead of parsing the path data themselves.
+"""
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from assets.generate.affine import GeometryBatch
+
+# Blocks attached in this process; kept alive for as long as the views are used
+_attached: list[SharedMemory] = []
+
+
+@dataclass(frozen=True)
+class SharedGeometrySpec:
+    """Everything a worker needs to rebuild a GeometryBatch (small, picklable)."""
+
+    shm_name: str
+    names: tuple[str, ...]
+    commands: tuple[bytes, ...]
+    offsets: tuple[int, ...]
+    n_points: int
+
+
+class SharedGeometry:
+    """
+    Context manager owning a shared memory copy of a GeometryBatch.
+
+    The block is unlinked on exit, so workers must be done by then.
+    """
+
+    def __init__(self, batch: GeometryBatch) -> None:
+        self.batch = batch
+        self._shm: SharedMemory | None = None
+
+    def __enter__(self) -> SharedGeometrySpec:
+        points = np.ascontiguousarray(self.batch.points, dtype=np.float64)
+        self._shm = SharedMemory(create=True, size=max(points.nbytes, 1))
+        view = np.ndarray(points.shape, dtype=np.float64, buffer=self._shm.buf)
+        view[:] = points
+        return SharedGeometrySpec(
+            shm_name=self._shm.name,
+            names=self.batch.names,
+            commands=self.batch.commands,
+            offsets=tuple(int(o) for o in self.batch.offsets),
+            n_points=len(points),
+        )
+
+    def __exit__(self, *exc: object) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+def attach_geometry(spec: SharedGeometrySpec) -> GeometryBatch:
+    """Rebuild a GeometryBatch whose points are a read-only view of shared memory."""
+    shm = _attach(spec.shm_name)
+    _attached.append(shm)
+    points = np.ndarray((spec.n_points, 2), dtype=np.float64, buffer=shm.buf)
+    points.flags.writeable = False
+    offsets = np.array(spec.offsets, dtype=np.intp)
+    return GeometryBatch(spec.names, spec.commands, points, offsets)
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing block without taking over its lifetime."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the block with the resource tracker, which
+    # then treats it as owned by this worker; the owner unregisters it on unlink
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
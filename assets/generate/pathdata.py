@@ -0,0 +1,413 @@
+"""
+Compact SVG Path Data
+
+Array-backed representation of SVG path data for the logo generator.
+
+A path is stored as one byte per command (b"M", b"L", b"Q", b"C", b"Z") plus a
+flat array('d') of absolute coordinates. H/V are normalized to L and relative
+commands to absolute at parse time, so every coordinate is an explicit (x, y)
+pair and any affine transform is a plain pass over the array.
+
+Supported grammar: M/L/H/V/Q/C/Z in absolute and relative form, including
+implicit command repetition. Other commands raise UnsupportedPathCommandError.
+
+to_d() writes svgpathtools-compatible data by default; given a precision it
+writes the shortest data it can at that many decimal places instead. Every
+coordinate is first rounded to an integer count of 10**-precision units, so
+relative offsets are exact integer differences and the output is the same on
+every platform.
+"""
+
+import re
+from array import array
+from itertools import chain
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+CMD_MOVE = ord("M")
+CMD_LINE = ord("L")
+CMD_QUAD = ord("Q")
+CMD_CUBIC = ord("C")
+CMD_CLOSE = ord("Z")
+
+# Number of coordinate values stored per command
+COORDS_PER_COMMAND = {
+    CMD_MOVE: 2,
+    CMD_LINE: 2,
+    CMD_QUAD: 4,
+    CMD_CUBIC: 6,
+    CMD_CLOSE: 0,
+}
+
+# Number of values consumed per command in the source grammar
+ARGS_PER_COMMAND = {"M": 2, "L": 2, "H": 1, "V": 1, "Q": 4, "C": 6, "Z": 0}
+
+_COMMAND_CODES = {"M": CMD_MOVE, "L": CMD_LINE, "Q": CMD_QUAD, "C": CMD_CUBIC}
+
+# Absolute command letters of the compact serializer, by command code
+_COMPACT_LETTERS = {CMD_MOVE: "M", CMD_LINE: "L", CMD_QUAD: "Q", CMD_CUBIC: "C"}
+
+_COMMAND_SPLIT_RE = re.compile(r"([A-Za-z])")
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+class UnsupportedPathCommandError(ValueError):
+    """Raised when path data uses a command outside M/L/H/V/Q/C/Z."""
+
+
+def _parse_numbers(text: str) -> list[float]:
+    """Parse the argument list of one command."""
+    try:
+        return [float(v) for v in text.split()]
+    except ValueError:
+        # Compact forms such as "1-2" or "0.5.5" need the full number grammar
+        return [float(v) for v in _NUMBER_RE.findall(text)]
+
+
+# =============================================================================
+# PATH DATA
+# =============================================================================
+
+
+class PathData:
+    """
+    Parsed SVG path: command bytes plus flat absolute coordinates.
+
+    Attributes:
+        commands: One byte per command (M, L, Q, C, Z)
+        coords: Flat x, y coordinate pairs in command order
+    """
+
+    __slots__ = ("commands", "coords")
+
+    def __init__(self, commands: bytes, coords: array) -> None:
+        self.commands = commands
+        self.coords = coords
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathData):
+            return NotImplemented
+        return self.commands == other.commands and self.coords == other.coords
+
+    def __repr__(self) -> str:
+        return f"PathData({self.commands!r}, {len(self.coords) // 2} points)"
+
+    @classmethod
+    def parse(cls, d: str) -> "PathData":
+        """
+        Parse an SVG path d attribute.
+
+        Args:
+            d: SVG path d attribute string
+
+        Returns:
+            Parsed path with absolute coordinates
+
+        Raises:
+            UnsupportedPathCommandError: If d uses a command other than M/L/H/V/Q/C/Z
+            ValueError: If a command has the wrong number of arguments
+        """
+        parts = _COMMAND_SPLIT_RE.split(d.replace(",", " "))
+        if parts[0].strip():
+            raise ValueError(f"Path data must start with a command: {d[:20]!r}")
+
+        letters = parts[1::2]
+        tokens = list(map(str.split, parts[2::2]))
+        if list(map(len, tokens)) == [ARGS_PER_COMMAND.get(c, -1) for c in letters]:
+            try:
+                values = list(map(float, chain.from_iterable(tokens)))
+            except ValueError:
+                pass
+            else:
+                return cls._from_absolute(letters, values)
+
+        return cls._parse_general(parts, d)
+
+    @classmethod
+    def _from_absolute(cls, letters: list[str], values: list[float]) -> "PathData":
+        """Build from absolute commands that each carry exactly one argument set."""
+        commands = "".join(letters)
+        if "H" not in commands and "V" not in commands:
+            return cls(commands.encode("ascii"), array("d", values))
+
+        coords = array("d")
+        append = coords.append
+        extend = coords.extend
+        pos = 0
+        x = y = start_x = start_y = 0.0
+        for letter in letters:
+            if letter == "H":
+                x = values[pos]
+                pos += 1
+                append(x)
+                append(y)
+            elif letter == "V":
+                y = values[pos]
+                pos += 1
+                append(x)
+                append(y)
+            elif letter == "Z":
+                x, y = start_x, start_y
+            else:
+                end = pos + ARGS_PER_COMMAND[letter]
+                extend(values[pos:end])
+                pos = end
+                x, y = values[end - 2], values[end - 1]
+                if letter == "M":
+                    start_x, start_y = x, y
+        return cls(commands.replace("H", "L").replace("V", "L").encode("ascii"), coords)
+
+    @classmethod
+    def _parse_general(cls, parts: list[str], d: str) -> "PathData":
+        """Parse relative commands, implicit repetition and compact numbers."""
+        commands = bytearray()
+        coords = array("d")
+        append_cmd = commands.append
+        extend = coords.extend
+
+        x = y = 0.0
+        start_x = start_y = 0.0
+
+        for i in range(1, len(parts), 2):
+            letter = parts[i]
+            command = letter.upper()
+            nargs = ARGS_PER_COMMAND.get(command)
+            if nargs is None:
+                raise UnsupportedPathCommandError(
+                    f"Unsupported path command {letter!r} in {d[:40]!r}"
+                )
+            values = _parse_numbers(parts[i + 1])
+
+            if command == "Z":
+                if values:
+                    raise ValueError(f"Command 'Z' takes no arguments: {d[:40]!r}")
+                append_cmd(CMD_CLOSE)
+                x, y = start_x, start_y
+                continue
+
+            count = len(values)
+            if not count or count % nargs:
+                raise ValueError(
+                    f"Command {letter!r} expects a multiple of {nargs} values, "
+                    f"got {count} in {d[:40]!r}"
+                )
+
+            relative = letter != command
+            for j in range(0, count, nargs):
+                if nargs == 1:
+                    if command == "H":
+                        x = values[j] + x if relative else values[j]
+                    else:
+                        y = values[j] + y if relative else values[j]
+                    append_cmd(CMD_LINE)
+                    extend((x, y))
+                    continue
+                seg = values[j : j + nargs]
+                if relative:
+                    seg = [v + (y if k & 1 else x) for k, v in enumerate(seg)]
+                if command == "M" and j == 0:
+                    start_x, start_y = seg[0], seg[1]
+                    append_cmd(CMD_MOVE)
+                elif command == "M":
+                    # Pairs following a moveto are implicit linetos
+                    append_cmd(CMD_LINE)
+                else:
+                    append_cmd(_COMMAND_CODES[command])
+                extend(seg)
+                x, y = seg[-2], seg[-1]
+
+        return cls(bytes(commands), coords)
+
+    def transformed(
+        self,
+        scale: float = 1.0,
+        translate: tuple[float, float] = (0.0, 0.0),
+    ) -> "PathData":
+        """
+        Return a copy with every point scaled, then translated.
+
+        Identity components are skipped so untouched coordinates stay
+        bit-identical to the input.
+        """
+        tx, ty = translate
+        coords = array("d", self.coords)
+        if abs(scale - 1.0) > 1e-9:
+            coords = array("d", [v * scale for v in coords])
+        if abs(tx) > 1e-9:
+            coords[0::2] = array("d", [v + tx for v in coords[0::2]])
+        if abs(ty) > 1e-9:
+            coords[1::2] = array("d", [v + ty for v in coords[1::2]])
+        return PathData(self.commands, coords)
+
+    def segment_count(self) -> int:
+        """Number of drawing commands (everything except moveto)."""
+        return len(self.commands) - self.commands.count(CMD_MOVE)
+
+    def to_d(self, precision: int | None = None) -> str:
+        """
+        Serialize to a path d attribute.
+
+        By default the output matches svgpathtools' Path.d(): absolute M/L/Q/C
+        commands with "x,y" pairs and full float precision. Closepath is
+        written as a line back to the subpath start (omitted when already
+        there), and M is only written where a segment does not continue from
+        the previous one.
+
+        Args:
+            precision: Decimal places to round coordinates to, writing the
+                compact form instead (see _to_compact_d()); None for the
+                svgpathtools form
+        """
+        if precision is not None:
+            return self._to_compact_d(precision)
+
+        coords = self.coords
+        # Build a %-template and the coordinate indices that fill it, then
+        # format every number in a single C-level call
+        parts: list[str] = []
+        indices: list[int] = []
+        append = parts.append
+        pos = 0
+        current = -1  # coord index of the last point written
+        pen = -1  # coord index of the current point
+        start = -1  # coord index of the subpath start
+
+        for cmd in self.commands:
+            if cmd == CMD_MOVE:
+                pen = start = pos
+                pos += 2
+                continue
+            if cmd == CMD_CLOSE:
+                if start >= 0 and not _same_point(coords, pen, start):
+                    if not _same_point(coords, current, pen):
+                        append("M %r,%r")
+                        indices += (pen, pen + 1)
+                    append("L %r,%r")
+                    indices += (start, start + 1)
+                    current = start
+                pen = start
+                continue
+
+            if not _same_point(coords, current, pen):
+                append("M %r,%r")
+                indices += (pen, pen + 1)
+            if cmd == CMD_LINE:
+                append("L %r,%r")
+                pos += 2
+            elif cmd == CMD_QUAD:
+                append("Q %r,%r %r,%r")
+                pos += 4
+            else:
+                append("C %r,%r %r,%r %r,%r")
+                pos += 6
+            indices += range(pos - COORDS_PER_COMMAND[cmd], pos)
+            current = pen = pos - 2
+
+        if not parts:
+            return ""
+        return " ".join(parts) % tuple([coords[i] for i in indices])
+
+    def _to_compact_d(self, precision: int) -> str:
+        """
+        Shortest path data at a fixed precision.
+
+        Each command is written absolute or relative, whichever is shorter
+        (absolute on a tie); horizontal and vertical lines become H/V; a
+        command letter is left out where it repeats the previous one (or is
+        the implicit lineto after a moveto); numbers lose leading zeros and
+        are only separated where needed; a line back to the subpath start
+        right before Z is left to the Z.
+        """
+        if precision < 0:
+            raise ValueError(f"Precision must be at least 0, got {precision}")
+        scale = 10**precision
+        q = [round(v * scale) for v in self.coords]
+
+        out: list[str] = []
+        last_letter = ""  # letter a number may implicitly repeat
+        last_number = ""  # last number written, to choose its separator
+        pen = start = (0, 0)
+        pos = 0
+        commands = self.commands
+        for i, cmd in enumerate(commands):
+            if cmd == CMD_CLOSE:
+                out.append("Z")
+                last_letter = last_number = ""
+                pen = start
+                continue
+
+            n = COORDS_PER_COMMAND[cmd]
+            values = q[pos : pos + n]
+            pos += n
+            end = (values[-2], values[-1])
+            closing = i + 1 < len(commands) and commands[i + 1] == CMD_CLOSE
+            if cmd == CMD_LINE and end == start and closing:
+                pen = end
+                continue
+
+            letter = _COMPACT_LETTERS[cmd]
+            if cmd == CMD_LINE and end[1] == pen[1]:
+                letter, values = "H", values[:1]
+            elif cmd == CMD_LINE and end[0] == pen[0]:
+                letter, values = "V", values[1:]
+            relative = [
+                v - pen[(j + (letter == "V")) % 2] for j, v in enumerate(values)
+            ]
+
+            options = []
+            for candidate, numbers in ((letter, values), (letter.lower(), relative)):
+                texts = [_format_fixed(v, precision) for v in numbers]
+                implicit = candidate == last_letter
+                text = _join_numbers(texts, last_number if implicit else "")
+                options.append(
+                    ((text if implicit else candidate + text), candidate, texts)
+                )
+            text, letter, texts = min(options, key=lambda option: len(option[0]))
+
+            out.append(text)
+            # After a moveto, further pairs are implicit linetos
+            last_letter = {"M": "L", "m": "l"}.get(letter, letter)
+            last_number = texts[-1]
+            pen = end
+            if cmd == CMD_MOVE:
+                start = end
+
+        return "".join(out)
+
+
+def _format_fixed(value: int, precision: int) -> str:
+    """A count of 10**-precision units as the shortest decimal, e.g. 50, 2 -> .5."""
+    if precision == 0 or value == 0:
+        return str(value)
+    digits = str(abs(value)).rjust(precision + 1, "0")
+    whole, fraction = digits[:-precision].lstrip("0"), digits[-precision:].rstrip("0")
+    text = whole + ("." + fraction if fraction else "")
+    return "-" + text if value < 0 else text
+
+
+def _join_numbers(texts: list[str], previous: str = "") -> str:
+    """
+    Join numbers with a space only where the parser would merge them.
+
+    Args:
+        texts: Formatted numbers
+        previous: Number right before the first, if nothing separates them
+    """
+    parts = []
+    for text in texts:
+        if previous and not (
+            text.startswith("-") or (text.startswith(".") and "." in previous)
+        ):
+            parts.append(" ")
+        parts.append(text)
+        previous = text
+    return "".join(parts)
+
+
+def _same_point(coords: array, a: int, b: int) -> bool:
+    """Whether the points at coord indices a and b coincide (-1 is no point)."""
+    if a < 0 or b < 0:
+        return a == b
+    return coords[a] == coords[b] and coords[a + 1] == coords[b + 1]
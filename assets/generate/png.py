@@ -0,0 +1,394 @@
+"""
+PNG Codec
+
+Writes 8-bit grayscale, gray+alpha, RGB or RGBA images as PNG using only
+zlib. Each scanline gets the filter (None, Sub, Up, Average or Paeth) whose
+output has the smallest sum of absolute byte values, the usual heuristic for
+what deflate compresses best; all five filters are computed for the whole
+image at once with NumPy.
+
+Output is deterministic: no timestamps or other ancillary chunks are written.
+
+decode_png() reads back non-interlaced PNGs of 8 bits per sample or fewer, of
+any color type, for the optimizer (see pngopt.py). Average and Paeth make
+every byte depend on its left and upper neighbors, so scanlines are
+unfiltered along anti-diagonals: all pixels with the same x + y are
+independent, and one vectorized step per diagonal decodes the image.
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# PNG color type by channel count
+COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+
+FILTER_NONE = 0
+FILTER_SUB = 1
+FILTER_UP = 2
+FILTER_AVERAGE = 3
+FILTER_PAETH = 4
+
+DEFAULT_COMPRESSION = 9
+
+# Per-scanline filter heuristics understood by select_filters()
+FILTER_HEURISTICS = ("minsum", "entropy")
+
+
+# =============================================================================
+# FILTERING
+# =============================================================================
+
+
+def filter_candidates(pixels: "np.ndarray") -> "np.ndarray":
+    """
+    Every filter applied to every scanline.
+
+    Args:
+        pixels: (height, width, channels) uint8 image
+
+    Returns:
+        (5, height, width * channels) uint8, indexed by filter type
+    """
+    import numpy as np
+
+    height, width, channels = pixels.shape
+    x = pixels.reshape(height, width * channels)
+    a = np.zeros_like(x)  # left
+    a[:, channels:] = x[:, :-channels]
+    b = np.zeros_like(x)  # up
+    b[1:] = x[:-1]
+    c = np.zeros_like(x)  # up-left
+    c[1:, channels:] = x[:-1, :-channels]
+
+    # Paeth picks whichever neighbor is closest to a + b - c
+    a16, b16, c16 = a.astype(np.int16), b.astype(np.int16), c.astype(np.int16)
+    pa = np.abs(b16 - c16)
+    pb = np.abs(a16 - c16)
+    pc = np.abs(a16 + b16 - 2 * c16)
+    paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+    average = ((a.astype(np.uint16) + b) >> 1).astype(np.uint8)
+
+    # uint8 arithmetic wraps modulo 256, as the filters are defined
+    return np.stack([x, x - a, x - b, x - average, x - paeth])
+
+
+def select_filters(candidates: "np.ndarray", heuristic: str = "minsum") -> "np.ndarray":
+    """
+    Filter type of each scanline, chosen by a heuristic.
+
+    Args:
+        candidates: Output of filter_candidates()
+        heuristic: "minsum" picks the smallest sum of absolute values (each
+            byte read as signed); "entropy" the lowest Shannon entropy of the
+            filtered bytes
+
+    Raises:
+        ValueError: If heuristic is not one of FILTER_HEURISTICS
+    """
+    import numpy as np
+
+    if heuristic == "minsum":
+        # min(v, 256 - v) is the absolute value of v read as a signed byte
+        cost = np.minimum(candidates, 0 - candidates).sum(axis=2, dtype=np.uint32)
+    elif heuristic == "entropy":
+        n_filters, height, row_bytes = candidates.shape
+        cost = np.empty((n_filters, height))
+        offsets = np.arange(height, dtype=np.int32)[:, None] * 256
+        for filter_type in range(n_filters):
+            # Byte histogram of every row at once
+            counts = np.bincount(
+                (offsets + candidates[filter_type]).ravel(), minlength=height * 256
+            ).reshape(height, 256)
+            p = counts / row_bytes
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cost[filter_type] = -np.nansum(p * np.log2(p), axis=1)
+    else:
+        raise ValueError(f"Unknown filter heuristic: {heuristic}")
+    return np.argmin(cost, axis=0)
+
+
+def pack_scanlines(candidates: "np.ndarray", chosen: "np.ndarray") -> bytes:
+    """PNG image data before compression: each scanline prefixed by its filter."""
+    import numpy as np
+
+    filtered = candidates[chosen, np.arange(len(chosen))]
+    return np.hstack([chosen[:, None].astype(np.uint8), filtered]).tobytes()
+
+
+def filter_scanlines(pixels: "np.ndarray", filter_type: int | None = None) -> bytes:
+    """
+    PNG image data before compression: each scanline prefixed by its filter.
+
+    Args:
+        pixels: (height, width, channels) uint8 image
+        filter_type: Filter for every scanline, or None to pick per scanline
+    """
+    import numpy as np
+
+    candidates = filter_candidates(pixels)
+    if filter_type is None:
+        chosen = select_filters(candidates)
+    else:
+        chosen = np.full(pixels.shape[0], filter_type)
+    return pack_scanlines(candidates, chosen)
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    """One length-prefixed, CRC-terminated PNG chunk."""
+    return (
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(kind + data))
+    )
+
+
+def encode_png(
+    pixels: "np.ndarray",
+    filter_type: int | None = None,
+    level: int = DEFAULT_COMPRESSION,
+) -> bytes:
+    """
+    Encode an 8-bit image as PNG.
+
+    Args:
+        pixels: (height, width, channels) uint8 image with 1-4 channels
+            (gray, gray+alpha, RGB, RGBA); a 2-D array is grayscale
+        filter_type: Filter for every scanline, or None to pick per scanline
+        level: zlib compression level
+
+    Raises:
+        ValueError: If pixels is not a non-empty uint8 image of 1-4 channels
+    """
+    import numpy as np
+
+    if pixels.ndim == 2:
+        pixels = pixels[..., None]
+    if (
+        pixels.dtype != np.uint8
+        or pixels.ndim != 3
+        or pixels.shape[2] not in COLOR_TYPES
+    ):
+        raise ValueError(
+            f"Expected a uint8 image of 1-4 channels, got {pixels.dtype} {pixels.shape}"
+        )
+    height, width, channels = pixels.shape
+    if not height or not width:
+        raise ValueError("Cannot encode an empty image")
+
+    header = struct.pack(">IIBBBBB", width, height, 8, COLOR_TYPES[channels], 0, 0, 0)
+    data = zlib.compress(filter_scanlines(pixels, filter_type), level)
+    return (
+        PNG_SIGNATURE
+        + png_chunk(b"IHDR", header)
+        + png_chunk(b"IDAT", data)
+        + png_chunk(b"IEND", b"")
+    )
+
+
+# =============================================================================
+# DECODING
+# =============================================================================
+
+
+class UnsupportedPngError(ValueError):
+    """A valid PNG that decode_png() cannot read (16-bit or interlaced)."""
+
+
+@dataclass(frozen=True)
+class DecodedPng:
+    """
+    Pixels and ancillary chunks of a PNG file.
+
+    Attributes:
+        pixels: (height, width, channels) uint8 image: gray, gray+alpha, RGB
+            or RGBA. Palettes are expanded, samples under 8 bits scaled to
+            0-255, and transparency (tRNS) becomes an alpha channel
+        chunks: (type, data, after IDAT) of every ancillary chunk but tRNS,
+            in file order
+    """
+
+    pixels: "np.ndarray"
+    chunks: tuple[tuple[bytes, bytes, bool], ...]
+
+
+def read_chunks(data: bytes) -> list[tuple[bytes, bytes]]:
+    """
+    (type, data) of every chunk of a PNG file, CRCs verified.
+
+    Raises:
+        ValueError: If data is not a well-formed PNG chunk stream
+    """
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError("Not a PNG file")
+    chunks, offset = [], 8
+    while offset < len(data):
+        if offset + 12 > len(data):
+            raise ValueError("Truncated PNG chunk")
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        kind = data[offset + 4 : offset + 8]
+        body = data[offset + 8 : offset + 8 + length]
+        crc = data[offset + 8 + length : offset + 12 + length]
+        if len(crc) < 4 or struct.unpack(">I", crc)[0] != zlib.crc32(kind + body):
+            raise ValueError(f"Bad CRC in PNG chunk {kind!r}")
+        chunks.append((kind, body))
+        offset += 12 + length
+        if kind == b"IEND":
+            break
+    return chunks
+
+
+def unfilter_scanlines(
+    raw: bytes, height: int, row_bytes: int, bpp: int
+) -> "np.ndarray":
+    """
+    Undo per-scanline filtering.
+
+    Args:
+        raw: Decompressed image data: each scanline prefixed by its filter
+        height: Scanline count
+        row_bytes: Bytes per scanline, excluding the filter byte
+        bpp: Bytes per complete pixel (at least 1), the filters' left offset
+
+    Returns:
+        (height, row_bytes) uint8 scanlines
+
+    Raises:
+        ValueError: If raw has the wrong size or an unknown filter type
+    """
+    import numpy as np
+
+    if len(raw) != height * (row_bytes + 1):
+        raise ValueError("PNG image data has the wrong size")
+    lines = np.frombuffer(raw, dtype=np.uint8).reshape(height, row_bytes + 1)
+    types = lines[:, 0]
+    if (types > FILTER_PAETH).any():
+        raise ValueError("Unknown PNG filter type")
+    width = row_bytes // bpp
+    filtered = lines[:, 1:].reshape(height, width, bpp).astype(np.int16)
+
+    # out[y + 1, x + y + 1] is pixel (y, x): row y is shifted right by y, so
+    # column d holds the diagonal x + y = d - 1, and a pixel's left (a), upper
+    # (b) and upper-left (c) neighbors are in columns d - 1, d - 1 and d - 2.
+    # The zero first row and column stand for the pixels outside the image.
+    out = np.zeros((height + 1, width + height + 1, bpp), dtype=np.int16)
+    rows = np.arange(height)
+    shift = rows[:, None] + np.arange(width) + 1
+    skewed = np.zeros_like(out)
+    skewed[rows[:, None] + 1, shift] = filtered
+    kinds = np.zeros((height + 1, 1), dtype=np.uint8)
+    kinds[1:, 0] = types
+
+    for d in range(1, width + height):
+        lo, hi = max(1, d - width + 1), min(height, d) + 1
+        kind = kinds[lo:hi]
+        a = out[lo:hi, d - 1]
+        b = out[lo - 1 : hi - 1, d - 1]
+        c = out[lo - 1 : hi - 1, d - 2] if d >= 2 else np.zeros_like(a)
+        pa, pb, pc = np.abs(b - c), np.abs(a - c), np.abs(a + b - 2 * c)
+        paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+        predictor = np.select(
+            [
+                kind == FILTER_SUB,
+                kind == FILTER_UP,
+                kind == FILTER_AVERAGE,
+                kind == FILTER_PAETH,
+            ],
+            [a, b, (a + b) >> 1, paeth],
+            0,
+        )
+        out[lo:hi, d] = (skewed[lo:hi, d] + predictor) & 0xFF
+
+    return out[rows[:, None] + 1, shift].astype(np.uint8).reshape(height, row_bytes)
+
+
+def decode_png(data: bytes) -> DecodedPng:
+    """
+    Decode a non-interlaced PNG of up to 8 bits per sample.
+
+    Raises:
+        UnsupportedPngError: If the image is 16-bit or interlaced
+        ValueError: If data is not a valid PNG
+    """
+    import numpy as np
+
+    chunks = read_chunks(data)
+    if not chunks or chunks[0][0] != b"IHDR":
+        raise ValueError("PNG does not start with IHDR")
+    width, height, depth, color_type, _, _, interlace = struct.unpack(
+        ">IIBBBBB", chunks[0][1]
+    )
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}.get(color_type)
+    if channels is None or depth not in (1, 2, 4, 8, 16):
+        raise ValueError(f"Invalid PNG: {depth}-bit color type {color_type}")
+    if depth == 16 or interlace:
+        raise UnsupportedPngError(
+            f"Unsupported PNG: {depth}-bit, interlace {interlace}"
+        )
+    if depth < 8 and color_type not in (0, 3):
+        raise ValueError(f"Invalid PNG: {depth}-bit color type {color_type}")
+
+    idat = b"".join(body for kind, body in chunks if kind == b"IDAT")
+    bits = width * channels * depth
+    row_bytes = (bits + 7) // 8
+    lines = unfilter_scanlines(
+        zlib.decompress(idat), height, row_bytes, max(1, channels * depth // 8)
+    )
+    if depth < 8:
+        # Unpack samples most significant bits first, dropping row padding
+        bit_rows = np.unpackbits(lines, axis=1)[:, :bits].reshape(height, width, depth)
+        weights = 1 << np.arange(depth - 1, -1, -1)
+        samples = (bit_rows * weights).sum(axis=2, dtype=np.uint8)[..., None]
+    else:
+        samples = lines.reshape(height, width, channels)
+
+    ancillary = {kind: body for kind, body in chunks if kind in (b"PLTE", b"tRNS")}
+    transparency = ancillary.get(b"tRNS")
+    if color_type == 3:
+        if b"PLTE" not in ancillary:
+            raise ValueError("Palette PNG without PLTE")
+        palette = np.frombuffer(ancillary[b"PLTE"], dtype=np.uint8).reshape(-1, 3)
+        if transparency is not None:
+            alpha = np.full((len(palette), 1), 255, dtype=np.uint8)
+            alpha[: len(transparency), 0] = np.frombuffer(
+                transparency[: len(palette)], dtype=np.uint8
+            )
+            palette = np.hstack([palette, alpha])
+        index = samples[..., 0]
+        if index.max(initial=0) >= len(palette):
+            raise ValueError("PNG palette index out of range")
+        pixels = palette[index]
+    else:
+        pixels = samples
+        if transparency is not None:
+            key = np.frombuffer(transparency, dtype=">u2").astype(np.uint8)
+            alpha = np.where((samples == key).all(axis=2), 0, 255).astype(np.uint8)
+            pixels = np.concatenate([samples, alpha[..., None]], axis=2)
+        if depth < 8:
+            pixels = pixels.copy()
+            pixels[..., 0] *= 255 // ((1 << depth) - 1)
+
+    idat_seen = False
+    kept = []
+    for kind, body in chunks[1:]:
+        if kind == b"IDAT":
+            idat_seen = True
+        elif kind[0] & 0x20 and kind != b"tRNS":  # lowercase first letter: ancillary
+            kept.append((kind, body, idat_seen))
+    return DecodedPng(np.ascontiguousarray(pixels), tuple(kept))
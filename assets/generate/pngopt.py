@@ -0,0 +1,413 @@
+"""
+PNG Optimizer
+
+Recompresses PNGs losslessly: the decoded pixels of the result are identical
+to those of the input, and the smaller of the two files is kept.
+
+1. Exact color reductions: an opaque alpha channel is dropped, equal RGB
+   samples become grayscale, and images of at most 256 colors also get a
+   palette of the smallest bit depth that holds them
+2. Every pixel format is filtered with each fixed filter and each
+   per-scanline heuristic of png.py, plus "brute", which picks the filter of
+   each scanline that grows a running deflate stream the least
+3. Each candidate is deflated at level 9; the FINALISTS smallest are retried
+   with every other zlib strategy
+
+Color management chunks are kept; text, timestamps and chunks that the PNG
+specification marks unsafe to copy once the image data changes are dropped.
+
+optimize_files() runs over many files in a process pool and skips files whose
+content hash is recorded as already optimal.
+"""
+
+import hashlib
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from assets.generate.cache import TransformCache
+from assets.generate.png import (
+    COLOR_TYPES,
+    FILTER_HEURISTICS,
+    FILTER_NONE,
+    FILTER_PAETH,
+    PNG_SIGNATURE,
+    UnsupportedPngError,
+    decode_png,
+    filter_candidates,
+    pack_scanlines,
+    png_chunk,
+    select_filters,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Bump when a change can make the optimizer produce smaller files, so that
+# files recorded as optimal are tried again
+OPTIMIZER_VERSION = 1
+
+# Candidates retried with every zlib strategy after the first pass
+FINALISTS = 2
+
+# zlib strategies tried on the finalists (the first pass uses the default)
+ZLIB_STRATEGIES = (zlib.Z_FILTERED, zlib.Z_RLE)
+
+# Level of the running deflate stream that the brute filter search measures
+BRUTE_FORCE_LEVEL = 6
+
+# Ancillary chunks describing how samples map to colors; always kept
+COLOR_CHUNKS = frozenset(
+    {b"cHRM", b"gAMA", b"iCCP", b"sRGB", b"cICP", b"mDCV", b"cLLI"}
+)
+
+# Ancillary chunks that do not affect display; always dropped
+METADATA_CHUNKS = frozenset({b"tEXt", b"zTXt", b"iTXt", b"tIME"})
+
+# Color profiles, which are either for gray or for color samples: an image
+# with one keeps its kind of samples (a palette counts as color)
+COLOR_PROFILE_CHUNKS = frozenset({b"iCCP", b"cICP"})
+
+
+# =============================================================================
+# PIXEL FORMATS
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class PixelFormat:
+    """
+    One exact encoding of an image's pixels.
+
+    Attributes:
+        color_type: PNG color type
+        bit_depth: Bits per sample
+        width: Image width in pixels
+        samples: (height, units, bytes per unit) uint8 scanlines, where a unit
+            is a pixel, or a byte when samples are packed below 8 bits
+        palette: PLTE chunk data, for color type 3
+        transparency: tRNS chunk data, for color type 3 with translucent colors
+    """
+
+    color_type: int
+    bit_depth: int
+    width: int
+    samples: "np.ndarray"
+    palette: bytes = b""
+    transparency: bytes = b""
+
+    def header(self) -> bytes:
+        """IHDR chunk data."""
+        return struct.pack(
+            ">IIBBBBB",
+            self.width,
+            len(self.samples),
+            self.bit_depth,
+            self.color_type,
+            0,
+            0,
+            0,
+        )
+
+    def chunks(self, data: bytes) -> list[bytes]:
+        """PLTE and tRNS (when present), then the IDAT chunk of deflated data."""
+        chunks = []
+        if self.palette:
+            chunks.append(png_chunk(b"PLTE", self.palette))
+        if self.transparency:
+            chunks.append(png_chunk(b"tRNS", self.transparency))
+        return [*chunks, png_chunk(b"IDAT", data)]
+
+
+def pixel_formats(pixels: "np.ndarray", recolor: bool = True) -> list[PixelFormat]:
+    """
+    Every exact encoding of pixels worth trying, palette first.
+
+    Args:
+        pixels: (height, width, channels) uint8 gray, gray+alpha, RGB or RGBA
+        recolor: Whether samples may switch between gray and color
+    """
+    import numpy as np
+
+    width, channels = pixels.shape[1:]
+    has_alpha = channels in (2, 4)
+    color = pixels[..., : channels - has_alpha]
+    alpha = pixels[..., channels - 1 :] if has_alpha else None
+    if alpha is not None and (alpha == 255).all():
+        alpha = None
+    if color.shape[2] == 3 and recolor and (color == color[..., :1]).all():
+        color = color[..., :1]
+
+    samples = color if alpha is None else np.concatenate([color, alpha], axis=2)
+    color_type = COLOR_TYPES[samples.shape[2]]
+    formats = [PixelFormat(color_type, 8, width, np.ascontiguousarray(samples))]
+
+    if recolor or channels >= 3:
+        palette_format = palette_reduce(pixels)
+        if palette_format is not None:
+            formats.insert(0, palette_format)
+    return formats
+
+
+def palette_reduce(pixels: "np.ndarray") -> PixelFormat | None:
+    """
+    Palette encoding of pixels, or None if they have more than 256 colors.
+
+    Translucent colors come first, so the tRNS chunk is as short as it can
+    be; colors are otherwise ordered from most to least frequent.
+    """
+    import numpy as np
+
+    height, width, channels = pixels.shape
+    rgba = pixels
+    if channels < 3:
+        rgba = np.concatenate(
+            [pixels[..., :1].repeat(3, axis=2), pixels[..., 1:]], axis=2
+        )
+    if rgba.shape[2] == 3:
+        rgba = np.concatenate(
+            [rgba, np.full((height, width, 1), 255, np.uint8)], axis=2
+        )
+
+    packed = np.ascontiguousarray(rgba).view(np.uint32).reshape(-1)
+    colors, index, counts = np.unique(packed, return_inverse=True, return_counts=True)
+    if len(colors) > 256:
+        return None
+
+    entries = colors.view(np.uint8).reshape(-1, 4)
+    order = np.lexsort((-counts, entries[:, 3] == 255))
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    entries = entries[order]
+
+    bit_depth = next(depth for depth in (1, 2, 4, 8) if len(colors) <= 1 << depth)
+    indices = rank[index].reshape(height, width).astype(np.uint8)
+    if bit_depth < 8:
+        # Most significant bits first, each row padded to whole bytes
+        shifts = np.arange(bit_depth - 1, -1, -1, dtype=np.uint8)
+        bits = (indices[..., None] >> shifts) & 1
+        indices = np.packbits(bits.reshape(height, width * bit_depth), axis=1)
+    translucent = int((entries[:, 3] < 255).sum())
+    return PixelFormat(
+        3,
+        bit_depth,
+        width,
+        indices[..., None],
+        palette=entries[:, :3].tobytes(),
+        transparency=entries[:translucent, 3].tobytes(),
+    )
+
+
+# =============================================================================
+# COMPRESSION
+# =============================================================================
+
+
+def brute_filters(
+    candidates: "np.ndarray", level: int = BRUTE_FORCE_LEVEL
+) -> "np.ndarray":
+    """
+    Filter of each scanline that adds the fewest bytes to a deflate stream.
+
+    Scanlines are compressed in order; each is tried with every filter on a
+    copy of the stream, which is flushed to measure its size.
+    """
+    import numpy as np
+
+    n_filters, height, _ = candidates.shape
+    stream = zlib.compressobj(level, zlib.DEFLATED, 15, 9)
+    chosen = np.zeros(height, dtype=np.int64)
+    for y in range(height):
+        best_size = None
+        for filter_type in range(n_filters):
+            line = bytes([filter_type]) + candidates[filter_type, y].tobytes()
+            trial = stream.copy()
+            size = len(trial.compress(line)) + len(trial.flush(zlib.Z_SYNC_FLUSH))
+            if best_size is None or size < best_size:
+                best_size, chosen[y] = size, filter_type
+        stream.compress(bytes([chosen[y]]) + candidates[chosen[y], y].tobytes())
+    return chosen
+
+
+def filter_choices(candidates: "np.ndarray") -> "Iterator[np.ndarray]":
+    """Per-scanline filter types of every strategy: fixed, heuristic, brute."""
+    import numpy as np
+
+    height = candidates.shape[1]
+    for filter_type in range(FILTER_NONE, FILTER_PAETH + 1):
+        yield np.full(height, filter_type)
+    for heuristic in FILTER_HEURISTICS:
+        yield select_filters(candidates, heuristic)
+    yield brute_filters(candidates)
+
+
+def deflate(data: bytes, strategy: int = zlib.Z_DEFAULT_STRATEGY) -> bytes:
+    """zlib stream of data at level 9 with the largest window and memory."""
+    stream = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+    return stream.compress(data) + stream.flush()
+
+
+def smallest_encoding(formats: Iterable[PixelFormat]) -> tuple[PixelFormat, bytes]:
+    """
+    Pixel format and IDAT data of the smallest candidate encoding.
+
+    Sizes include the PLTE and tRNS chunks; ties go to the format listed
+    first, then to the earlier filter strategy.
+    """
+    trials = []
+    for pixel_format in formats:
+        candidates = filter_candidates(pixel_format.samples)
+        overhead = len(pixel_format.palette) + len(pixel_format.transparency)
+        for chosen in filter_choices(candidates):
+            raw = pack_scanlines(candidates, chosen)
+            data = deflate(raw)
+            trials.append((len(data) + overhead, pixel_format, raw, data))
+    trials.sort(key=lambda trial: trial[0])
+
+    best_size, best_format, _, best_data = trials[0]
+    for size, pixel_format, raw, data in trials[:FINALISTS]:
+        overhead = size - len(data)
+        for strategy in ZLIB_STRATEGIES:
+            data = deflate(raw, strategy)
+            if len(data) + overhead < best_size:
+                best_size, best_format, best_data = (
+                    len(data) + overhead,
+                    pixel_format,
+                    data,
+                )
+    return best_format, best_data
+
+
+# =============================================================================
+# OPTIMIZATION
+# =============================================================================
+
+
+def keep_chunk(kind: bytes) -> bool:
+    """Whether an ancillary chunk is copied to the optimized file."""
+    if kind in COLOR_CHUNKS:
+        return True
+    safe_to_copy = bool(kind[3] & 0x20)  # lowercase fourth letter
+    return safe_to_copy and kind not in METADATA_CHUNKS
+
+
+def encode_optimized(
+    pixels: "np.ndarray", chunks: Iterable[tuple[bytes, bytes, bool]] = ()
+) -> bytes:
+    """
+    Smallest PNG of pixels this optimizer finds.
+
+    Args:
+        pixels: (height, width, channels) uint8 gray, gray+alpha, RGB or RGBA
+        chunks: (type, data, after IDAT) of ancillary chunks to consider
+            copying (see keep_chunk())
+    """
+    kept = [chunk for chunk in chunks if keep_chunk(chunk[0])]
+    recolor = not any(kind in COLOR_PROFILE_CHUNKS for kind, _, _ in kept)
+    pixel_format, data = smallest_encoding(pixel_formats(pixels, recolor))
+
+    parts = [PNG_SIGNATURE, png_chunk(b"IHDR", pixel_format.header())]
+    parts += [png_chunk(kind, body) for kind, body, after in kept if not after]
+    parts += pixel_format.chunks(data)
+    parts += [png_chunk(kind, body) for kind, body, after in kept if after]
+    parts.append(png_chunk(b"IEND", b""))
+    return b"".join(parts)
+
+
+def optimize_png(data: bytes) -> bytes:
+    """
+    Smallest lossless version of a PNG file: data itself if it cannot shrink.
+
+    Raises:
+        ValueError: If data is not a valid PNG
+    """
+    try:
+        decoded = decode_png(data)
+    except UnsupportedPngError:
+        return data
+    optimized = encode_optimized(decoded.pixels, decoded.chunks)
+    return optimized if len(optimized) < len(data) else data
+
+
+def png_key(data: bytes) -> str:
+    """Cache key of a PNG file's content (see optimize_files())."""
+    return hashlib.sha256(f"png-v{OPTIMIZER_VERSION}\0".encode() + data).hexdigest()
+
+
+@dataclass(frozen=True)
+class OptimizeResult:
+    """Outcome of optimizing one file."""
+
+    path: Path
+    before: int  # Size on disk, in bytes
+    data: bytes  # Optimized content; the original when it cannot shrink
+    cached: bool  # Skipped: the content was recorded as optimal
+
+    @property
+    def after(self) -> int:
+        return len(self.data)
+
+    @property
+    def changed(self) -> bool:
+        return self.after < self.before
+
+
+def optimize_files(
+    paths: Iterable[Path], cache: TransformCache, jobs: int = 1
+) -> list[OptimizeResult]:
+    """
+    Optimize PNG files, without writing them.
+
+    Files whose content is recorded in cache as optimal are not decoded; every
+    optimized result is recorded, so they are skipped next time.
+
+    Args:
+        paths: PNG files to optimize
+        cache: Records of optimal content, keyed by png_key()
+        jobs: Worker processes to use; 1 optimizes in this process
+
+    Returns:
+        One result per path, in the order given
+
+    Raises:
+        ValueError: If a file is not a valid PNG
+    """
+    originals = {path: path.read_bytes() for path in paths}
+    pending = [
+        path for path, data in originals.items() if cache.get(png_key(data)) is None
+    ]
+
+    datas = [originals[path] for path in pending]
+    if jobs <= 1 or len(pending) <= 1:
+        optimized = [
+            _optimize_file(path, data)
+            for path, data in zip(pending, datas, strict=True)
+        ]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            optimized = list(pool.map(_optimize_file, pending, datas))
+
+    results = dict(zip(pending, optimized, strict=True))
+    for data in optimized:
+        cache.put(png_key(data), "optimal")
+    return [
+        OptimizeResult(path, len(data), results.get(path, data), path not in results)
+        for path, data in originals.items()
+    ]
+
+
+def _optimize_file(path: Path, data: bytes) -> bytes:
+    """Process pool task: optimize_png() naming the file in errors."""
+    try:
+        return optimize_png(data)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
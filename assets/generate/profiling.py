@@ -0,0 +1,100 @@
+"""
+Stage Profiling
+
+Records wall time and tracemalloc allocation peak per named build stage.
+Stages may nest; each stage is charged its own (exclusive) time, so the
+stage times of a run add up to the time spent inside stages.
+
+The profiler is disabled by default; a disabled stage() is a no-op context,
+so stage markers can stay in the build code.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements of one stage."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    peak_bytes: int = 0
+
+
+@dataclass
+class _Frame:
+    name: str
+    start: float
+    start_bytes: int
+    peak_bytes: int = 0
+    child_seconds: float = 0.0
+
+
+class StageProfiler:
+    """
+    Per-stage timing and allocation peaks.
+
+    Attributes:
+        enabled: Whether stage() measures anything
+        stages: Stats by stage name, in first-use order
+        total_seconds: Wall time between start() and stop()
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stages: dict[str, StageStats] = {}
+        self.total_seconds = 0.0
+        self._stack: list[_Frame] = []
+        self._started = 0.0
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        """Enable the profiler and start tracing allocations."""
+        self.enabled = True
+        self.stages.clear()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Disable the profiler and stop tracing if start() began it."""
+        self.total_seconds = time.perf_counter() - self._started
+        self.enabled = False
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the enclosed block as (part of) stage `name`."""
+        if not self.enabled:
+            yield
+            return
+
+        parent = self._stack[-1] if self._stack else None
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            parent.peak_bytes = max(parent.peak_bytes, peak)
+        tracemalloc.reset_peak()
+        frame = _Frame(name, time.perf_counter(), current)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame.start
+            peak = max(frame.peak_bytes, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+            stats = self.stages.setdefault(name, StageStats())
+            stats.calls += 1
+            stats.seconds += elapsed - frame.child_seconds
+            stats.peak_bytes = max(stats.peak_bytes, peak - frame.start_bytes)
+            if parent is not None:
+                parent.child_seconds += elapsed
+                parent.peak_bytes = max(parent.peak_bytes, peak)
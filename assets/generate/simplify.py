@@ -0,0 +1,350 @@
+"""
+Path Simplification
+
+Removes segments that do not change a path by more than a tolerance, in
+user units, before it is serialized:
+
+1. Degenerate segments, all of whose points are the pen position, are
+   dropped
+2. Curves that stay within tolerance of their chord become lines (a
+   quadratic's distance from its chord is at most half its control point's,
+   a cubic's at most three quarters of its farthest control point's)
+3. Runs of lines are merged into one line while every vertex, and every
+   control point of a curve turned into a line, lies within tolerance of it
+4. Runs of quadratics are merged into one quadratic, with its control point
+   where the run's end tangents meet, while each stays within tolerance of
+   the other at every sampled point, less the sampling error
+
+Each pass checks its result against the original segments, not the output
+of an earlier pass, so deviations do not add up. Cubics are only dropped or
+turned into lines.
+"""
+
+from array import array
+from dataclasses import dataclass
+
+import numpy as np
+
+from assets.generate.affine import GeometryBatch
+from assets.generate.pathdata import (
+    CMD_CLOSE,
+    CMD_CUBIC,
+    CMD_LINE,
+    CMD_MOVE,
+    CMD_QUAD,
+    COORDS_PER_COMMAND,
+    PathData,
+)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Points sampled along each quadratic when checking a merged run against it
+CURVE_SAMPLES = 16
+
+# Tangents closer to parallel than this (sine of the angle) do not meet
+PARALLEL_EPSILON = 1e-9
+
+Point = tuple[float, float]
+Segment = tuple[int, tuple[Point, ...]]  # command and its points, end last
+Quad = tuple[Point, Point, Point]  # start, control, end
+
+
+# =============================================================================
+# STATISTICS
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SimplifyStats:
+    """
+    Size of some geometry before and after simplification.
+
+    Attributes:
+        nodes_before: Drawing commands (see PathData.segment_count()) before
+        nodes_after: Drawing commands after
+        bytes_before: Serialized path data bytes before
+        bytes_after: Serialized path data bytes after
+    """
+
+    nodes_before: int
+    nodes_after: int
+    bytes_before: int
+    bytes_after: int
+
+
+def simplify_stats(
+    before: GeometryBatch, after: GeometryBatch, precision: int | None = None
+) -> SimplifyStats:
+    """Compare two versions of the same paths, serialized at precision."""
+    old, new = before.to_paths().values(), after.to_paths().values()
+    return SimplifyStats(
+        nodes_before=sum(path.segment_count() for path in old),
+        nodes_after=sum(path.segment_count() for path in new),
+        bytes_before=sum(len(path.to_d(precision)) for path in old),
+        bytes_after=sum(len(path.to_d(precision)) for path in new),
+    )
+
+
+# =============================================================================
+# GEOMETRY HELPERS
+# =============================================================================
+
+
+def _distance_to_segment(points: np.ndarray, a: Point, b: Point) -> np.ndarray:
+    """Distance of each of points (n, 2) to the line segment from a to b."""
+    start, direction = np.asarray(a), np.subtract(b, a)
+    length_sq = float(direction @ direction)
+    if length_sq == 0.0:
+        return np.hypot(*(points - start).T)
+    t = np.clip((points - start) @ direction / length_sq, 0.0, 1.0)
+    return np.hypot(*(points - start - t[:, None] * direction).T)
+
+
+def _distance_to_polyline(points: np.ndarray, polyline: np.ndarray) -> np.ndarray:
+    """Distance of each of points (n, 2) to the polyline (m, 2)."""
+    starts, ends = polyline[:-1], polyline[1:]
+    direction = ends - starts
+    length_sq = np.maximum((direction * direction).sum(axis=1), 1e-300)
+    offset = points[:, None, :] - starts[None, :, :]
+    t = np.clip((offset * direction).sum(axis=2) / length_sq, 0.0, 1.0)
+    nearest = starts + t[..., None] * direction
+    return np.hypot(*(points[:, None, :] - nearest).transpose(2, 0, 1)).min(axis=1)
+
+
+def _curve_points(points: tuple[Point, ...], samples: int) -> np.ndarray:
+    """samples + 1 points of a quadratic or cubic Bézier, evenly spaced in t."""
+    t = np.linspace(0.0, 1.0, samples + 1)[:, None]
+    control = np.asarray(points)
+    if len(points) == 3:
+        weights = ((1 - t) ** 2, 2 * (1 - t) * t, t**2)
+    else:
+        weights = ((1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t**2, t**3)
+    return sum(w * p for w, p in zip(weights, control, strict=True))
+
+
+def _tangent_intersection(p0: Point, d0: Point, p1: Point, d1: Point) -> Point | None:
+    """Where the lines p0 + s * d0 and p1 + u * d1 meet, ahead of p0."""
+    cross = d0[0] * d1[1] - d0[1] * d1[0]
+    norms = np.hypot(*d0) * np.hypot(*d1)
+    if norms == 0.0 or abs(cross) <= PARALLEL_EPSILON * norms:
+        return None
+    s = ((p1[0] - p0[0]) * d1[1] - (p1[1] - p0[1]) * d1[0]) / cross
+    if s <= 0.0:
+        return None
+    return (p0[0] + s * d0[0], p0[1] + s * d0[1])
+
+
+# =============================================================================
+# SIMPLIFICATION PASSES
+# =============================================================================
+
+
+def _drop_degenerate(start: Point, segments: list[Segment]) -> list[Segment]:
+    """Segments without those whose every point is the pen position."""
+    kept: list[Segment] = []
+    pen = start
+    for cmd, points in segments:
+        if all(point == pen for point in points):
+            continue
+        kept.append((cmd, points))
+        pen = points[-1]
+    return kept
+
+
+def _flatten_curves(
+    start: Point, segments: list[Segment], tolerance: float
+) -> list[tuple[Segment, np.ndarray]]:
+    """
+    Segments with curves that stay near their chord turned into lines.
+
+    Each segment comes with the points a line replacing it must pass near:
+    a line's end, or the control polygon of the curve a line replaced (which
+    contains the curve).
+    """
+    flattened = []
+    pen = start
+    for cmd, points in segments:
+        end = points[-1]
+        trace = np.asarray([end])
+        if cmd in (CMD_QUAD, CMD_CUBIC):
+            # Bound on the curve's distance from its chord
+            factor = 0.5 if cmd == CMD_QUAD else 0.75
+            controls = np.asarray(points[:-1])
+            if factor * _distance_to_segment(controls, pen, end).max() <= tolerance:
+                trace = np.asarray(points)
+                cmd, points = CMD_LINE, (end,)
+        flattened.append(((cmd, points), trace))
+        pen = end
+    return flattened
+
+
+def _merge_lines(
+    start: Point, segments: list[tuple[Segment, np.ndarray]], tolerance: float
+) -> list[Segment]:
+    """Segments with runs of nearly collinear lines merged."""
+    merged: list[Segment] = []
+    anchor = start  # start of the pending line
+    run: list[np.ndarray] = []  # traces of the lines the pending line replaces
+    end = start
+    for (cmd, points), trace in segments:
+        if cmd == CMD_LINE:
+            traces = np.concatenate([*run, trace])
+            if (
+                run
+                and _distance_to_segment(traces, anchor, points[0]).max() > tolerance
+            ):
+                merged.append((CMD_LINE, (end,)))
+                anchor, run = end, []
+            run.append(trace)
+            end = points[0]
+            continue
+        if run:
+            merged.append((CMD_LINE, (end,)))
+            run = []
+        merged.append((cmd, points))
+        anchor = points[-1]
+    if run:
+        merged.append((CMD_LINE, (end,)))
+    return merged
+
+
+def _merge_quads(
+    start: Point, segments: list[Segment], tolerance: float
+) -> list[Segment]:
+    """Segments with runs of quadratics refitted as single quadratics."""
+    merged: list[Segment] = []
+    pen = start
+    run: list[Quad] = []
+    control: Point | None = None  # of the quadratic replacing the run
+
+    for cmd, points in segments:
+        if cmd == CMD_QUAD:
+            quad = (pen, *points)
+            fit = _refit([*run, quad], tolerance) if run else None
+            if fit is not None:
+                run.append(quad)
+                control = fit
+            else:
+                if run:
+                    merged.append((CMD_QUAD, (control, run[-1][2])))
+                run, control = [quad], points[0]
+        else:
+            if run:
+                merged.append((CMD_QUAD, (control, run[-1][2])))
+            run = []
+            merged.append((cmd, points))
+        pen = points[-1]
+    if run:
+        merged.append((CMD_QUAD, (control, run[-1][2])))
+    return merged
+
+
+def _refit(quads: list[Quad], tolerance: float) -> Point | None:
+    """
+    Control point of one quadratic matching a run of quadratics, if any.
+
+    The control point is where the run's start and end tangents meet; the
+    fit is accepted when every sampled point of each curve is within
+    tolerance of the other curve's samples, less how far the chords between
+    samples can be from the curves.
+    """
+    first, last = quads[0], quads[-1]
+    p0, p2 = first[0], last[2]
+    d0 = (first[1][0] - p0[0], first[1][1] - p0[1])
+    d1 = (last[1][0] - p2[0], last[1][1] - p2[1])
+    control = _tangent_intersection(p0, d0, p2, d1)
+    if control is None:
+        return None
+
+    samples = CURVE_SAMPLES * len(quads)
+    fitted = _curve_points((p0, control, p2), samples)
+    original = np.concatenate([_curve_points(q, CURVE_SAMPLES) for q in quads])
+    # A chord over 1/n of a quadratic is within |p0 - 2c + p2| / (4n²) of it
+    budget = tolerance - max(
+        _sagitta((p0, control, p2), samples),
+        max(_sagitta(q, CURVE_SAMPLES) for q in quads),
+    )
+    if _distance_to_polyline(original, fitted).max() > budget:
+        return None
+    if _distance_to_polyline(fitted, original).max() > budget:
+        return None
+    return control
+
+
+def _sagitta(quad: Quad, samples: int) -> float:
+    """Largest distance of a quadratic from its samples + 1 point polyline."""
+    (x0, y0), (x1, y1), (x2, y2) = quad
+    return float(np.hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2)) / (4 * samples**2)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+
+def simplify_path(path: PathData, tolerance: float) -> PathData:
+    """
+    Simplify a path to within tolerance user units of its outline.
+
+    Args:
+        path: Path to simplify
+        tolerance: Largest distance, in user units, between the outlines;
+            0 only drops repeated points and exactly collinear ones
+
+    Returns:
+        The simplified path; subpaths keep their start points and closepaths
+
+    Raises:
+        ValueError: If tolerance is negative
+    """
+    if tolerance < 0:
+        raise ValueError(f"Tolerance must be at least 0, got {tolerance}")
+
+    commands = bytearray()
+    coords = array("d")
+
+    def emit(start: Point, segments: list[Segment]) -> None:
+        segments = _drop_degenerate(start, segments)
+        lines = _merge_lines(
+            start, _flatten_curves(start, segments, tolerance), tolerance
+        )
+        for cmd, points in _merge_quads(start, lines, tolerance):
+            commands.append(cmd)
+            for x, y in points:
+                coords.extend((x, y))
+
+    start: Point = (0.0, 0.0)
+    segments: list[Segment] = []
+    pos = 0
+    for cmd in path.commands:
+        n = COORDS_PER_COMMAND[cmd]
+        values = path.coords[pos : pos + n]
+        pos += n
+        points = tuple(zip(values[0::2], values[1::2], strict=True))
+        if cmd == CMD_MOVE:
+            emit(start, segments)
+            segments = []
+            start = points[0]
+            commands.append(CMD_MOVE)
+            coords.extend(start)
+        elif cmd == CMD_CLOSE:
+            emit(start, segments)
+            segments = []
+            commands.append(CMD_CLOSE)
+        else:
+            segments.append((cmd, points))
+    emit(start, segments)
+
+    return PathData(bytes(commands), coords)
+
+
+def simplify_batch(batch: GeometryBatch, tolerance: float) -> GeometryBatch:
+    """Simplify every path of a batch (see simplify_path())."""
+    return GeometryBatch.from_paths(
+        {
+            name: simplify_path(path, tolerance)
+            for name, path in batch.to_paths().items()
+        }
+    )
@@ -0,0 +1,65 @@
+"""
+Compiled SVG Templates
+
+An SVG whose geometry is frozen and whose fill colors are named slots. A
+template is compiled once by rendering the SVG with a unique marker as the
+value of every slot; filling it afterwards is a single %-substitution, with
+no path transforms, element building or string joins.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+
+# Stand-in value for a slot while compiling; NUL never occurs in SVG text
+SLOT_MARKER = "\0{}\0"
+
+
+class SvgTemplate:
+    """
+    SVG text with named slots.
+
+    Attributes:
+        slots: Slot names, in the order given to compile()
+    """
+
+    __slots__ = ("_format", "slots")
+
+    def __init__(self, format_string: str, slots: tuple[str, ...]) -> None:
+        self._format = format_string
+        self.slots = slots
+
+    @classmethod
+    def compile(
+        cls,
+        render: Callable[[Mapping[str, str]], str],
+        slots: Iterable[str],
+    ) -> "SvgTemplate":
+        """
+        Compile a renderer into a template.
+
+        Args:
+            render: Renders the SVG given a value for every slot; it must
+                insert the values verbatim
+            slots: Slot names
+
+        Raises:
+            ValueError: If the rendered SVG does not contain some slot
+        """
+        slots = tuple(slots)
+        markers = {slot: SLOT_MARKER.format(slot) for slot in slots}
+        text = render(markers).replace("%", "%%")
+        for slot, marker in markers.items():
+            if marker not in text:
+                raise ValueError(f"Slot {slot!r} does not appear in the rendered SVG")
+            text = text.replace(marker, f"%({slot})s")
+        return cls(text, slots)
+
+    def fill(self, values: Mapping[str, str]) -> str:
+        """
+        Render the template with a value for every slot.
+
+        Keys that are not slots are ignored.
+
+        Raises:
+            KeyError: If a slot has no value
+        """
+        return self._format % values
@@ -0,0 +1,163 @@
+"""
+File Watching
+
+Reports changes to a fixed set of files, using Linux inotify when available
+and stat polling otherwise. Parent directories are watched rather than the
+files themselves, so editors that save by writing a new file and renaming it
+over the old one are seen as well.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# A burst of saves is reported once, after this long without further events
+DEBOUNCE_SECONDS = 0.1
+POLL_INTERVAL_SECONDS = 0.25
+
+# inotify(7)
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+INOTIFY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+
+class InotifyWatcher:
+    """Watch files through inotify on their parent directories (Linux only)."""
+
+    kind = "inotify"
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._files: dict[int, dict[str, Path]] = {}
+        for path in {p.resolve() for p in paths}:
+            wd = libc.inotify_add_watch(
+                self._fd, os.fsencode(path.parent), INOTIFY_MASK
+            )
+            if wd < 0:
+                err = ctypes.get_errno()
+                self.close()
+                raise OSError(err, f"inotify_add_watch failed for {path.parent}")
+            self._files.setdefault(wd, {})[path.name] = path
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block up to timeout seconds (None: forever) for changes."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0").decode()
+            offset += length
+            path = self._files.get(wd, {}).get(name)
+            if path is not None:
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """Watch files by comparing their stat signatures at a fixed interval."""
+
+    kind = "polling"
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        interval: float = POLL_INTERVAL_SECONDS,
+    ) -> None:
+        self.interval = interval
+        self._signatures = {p.resolve(): None for p in paths}
+        self._scan()
+
+    def _scan(self) -> set[Path]:
+        changed = set()
+        for path, before in self._signatures.items():
+            try:
+                st = path.stat()
+                after = (st.st_mtime_ns, st.st_size, st.st_ino)
+            except OSError:
+                after = None
+            if after != before:
+                self._signatures[path] = after
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block up to timeout seconds (None: forever) for changes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self._scan()
+            if changed:
+                return changed
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(paths: Iterable[Path]) -> InotifyWatcher | PollingWatcher:
+    """Create an inotify watcher where supported, else a polling one."""
+    paths = list(paths)
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass  # no inotify (e.g. exhausted watches, unusual libc)
+    return PollingWatcher(paths)
+
+
+def debounced_changes(
+    watcher: InotifyWatcher | PollingWatcher,
+    quiet: float = DEBOUNCE_SECONDS,
+) -> Iterator[set[Path]]:
+    """
+    Yield the set of changed paths once per burst of changes.
+
+    A burst ends when no further change arrives for `quiet` seconds.
+    """
+    while True:
+        changed = watcher.wait()
+        while changed:
+            more = watcher.wait(quiet)
+            if not more:
+                break
+            changed |= more
+        if changed:
+            yield changed
@@ -0,0 +1,282 @@
+"""
+Atomic Bulk Writes
+
+Collects the files a build produces and commits them together:
+
+1. Every file is written into a hidden staging directory next to its
+   destination, so nothing visible changes until the whole set is staged
+2. One filesystem sync makes all staged data durable, instead of one fsync
+   per file
+3. Each staged file is renamed over its destination, and a second sync
+   persists the renames
+
+Commits are meant to run under a FileLock, an advisory lock that keeps
+concurrent generator runs (e.g. two CI jobs) from interleaving their writes.
+"""
+
+import ctypes
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Staging directories are created next to their destinations with this prefix
+STAGING_PREFIX = ".generate-staging-"
+
+
+# =============================================================================
+# LOCKING
+# =============================================================================
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file (flock), held while the context is open.
+
+    Waits for other holders. Where flock is unavailable (Windows) the lock is
+    a no-op.
+    """
+
+    def __init__(self, path: Path, on_wait: Callable[[], object] | None = None) -> None:
+        """
+        Args:
+            path: Lock file; created, with its parent directories, if missing
+            on_wait: Called once if the lock is held elsewhere, before waiting
+        """
+        self.path = path
+        self.on_wait = on_wait
+        self._fd = -1
+
+    def __enter__(self) -> Self:
+        if fcntl is None:
+            return self
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            if self.on_wait is not None:
+                self.on_wait()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        except BaseException:
+            self._close()
+            raise
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)  # releases the lock
+            self._fd = -1
+
+
+# =============================================================================
+# WRITE SET
+# =============================================================================
+
+
+class WriteSet:
+    """
+    Files to write, held in memory until commit().
+
+    Paths are used as given; relative paths resolve against the working
+    directory at commit time.
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[Path, bytes] = {}
+        self._links: dict[Path, Path] = {}
+        self._removals: dict[Path, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._files) + len(self._links) + len(self._removals)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._files or path in self._links
+
+    def add(self, path: Path, data: bytes) -> None:
+        """Stage data to be written to path, replacing anything staged before."""
+        self._links.pop(path, None)
+        self._removals.pop(path, None)
+        self._files[path] = data
+
+    def link(self, path: Path, source: Path) -> None:
+        """
+        Stage path as a hard link to the staged file source.
+
+        Falls back to a copy of source's data when the two cannot be linked
+        (different filesystems, or links unsupported).
+
+        Raises:
+            KeyError: If source is not staged with add()
+        """
+        if source not in self._files:
+            raise KeyError(f"Cannot link to unstaged file: {source}")
+        self._files.pop(path, None)
+        self._removals.pop(path, None)
+        self._links[path] = source
+
+    def remove(self, path: Path) -> None:
+        """Stage path for deletion, if it exists at commit time."""
+        self._files.pop(path, None)
+        self._links.pop(path, None)
+        self._removals[path] = None
+
+    def get(self, path: Path) -> bytes | None:
+        """Data staged for path, or None."""
+        if path in self._links:
+            return self._files[self._links[path]]
+        return self._files.get(path)
+
+    def commit(self, sync: bool = True) -> list[Path]:
+        """
+        Write every staged file and delete those staged for removal, then
+        empty the set.
+
+        Run under a FileLock: staging directories left behind by interrupted
+        commits in the destination directories are removed first.
+
+        Args:
+            sync: Make the data and renames durable before returning
+
+        Returns:
+            The committed paths, in staging order, removals last
+
+        Raises:
+            OSError: If staging fails; no destination has been touched then
+        """
+        paths = [*self._files, *self._links]
+        removals = list(self._removals)
+        if not paths and not removals:
+            return []
+
+        staging: dict[Path, Path] = {}
+        try:
+            for parent in dict.fromkeys(path.parent for path in paths):
+                parent.mkdir(parents=True, exist_ok=True)
+                _remove_stale_staging(parent)
+                staging[parent] = Path(
+                    tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=parent)
+                )
+
+            def staged(path: Path) -> Path:
+                return staging[path.parent] / path.name
+
+            for path, data in self._files.items():
+                _write_staged(staged(path), data, path)
+            for path, source in self._links.items():
+                try:
+                    os.link(staged(source), staged(path))
+                except OSError:
+                    _write_staged(staged(path), self._files[source], path)
+
+            if sync and not _sync_filesystems(staging.values()):
+                _fsync_files(staging.values())
+            for path in paths:
+                os.replace(staged(path), path)
+            for path in removals:
+                path.unlink(missing_ok=True)
+            if sync:
+                parents = (path.parent for path in removals)
+                _sync_filesystems({*staging, *(p for p in parents if p.is_dir())})
+        finally:
+            for directory in staging.values():
+                shutil.rmtree(directory, ignore_errors=True)
+
+        self._files.clear()
+        self._links.clear()
+        self._removals.clear()
+        return [*paths, *removals]
+
+
+def _write_staged(staged: Path, data: bytes, dest: Path) -> None:
+    """Write a staged file, keeping the permissions of the file it replaces."""
+    staged.write_bytes(data)
+    try:
+        mode = stat.S_IMODE(dest.stat().st_mode)
+    except OSError:
+        return  # new file: default permissions
+    os.chmod(staged, mode)
+
+
+def _remove_stale_staging(directory: Path) -> None:
+    """Delete staging directories of commits that never finished."""
+    for stale in directory.glob(f"{STAGING_PREFIX}*"):
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+# =============================================================================
+# SYNCING
+# =============================================================================
+
+
+def _load_syncfs() -> Callable[[int], int] | None:
+    """libc syncfs(2) where available (Linux), else None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syncfs
+    except (OSError, AttributeError):
+        return None
+
+
+_syncfs = _load_syncfs()
+
+
+def _sync_filesystems(paths: Iterable[Path]) -> bool:
+    """
+    Flush every filesystem holding one of paths, once per filesystem.
+
+    Uses syncfs on Linux and sync on other POSIX systems.
+
+    Returns:
+        False if the platform has neither (Windows), True otherwise
+    """
+    if _syncfs is None:
+        if not hasattr(os, "sync"):
+            return False
+        os.sync()
+        return True
+
+    devices = set()
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            device = os.fstat(fd).st_dev
+            if device not in devices:
+                devices.add(device)
+                if _syncfs(fd) != 0:
+                    err = ctypes.get_errno()
+                    raise OSError(err, f"syncfs failed for {path}")
+        finally:
+            os.close(fd)
+    return True
+
+
+def _fsync_files(directories: Iterable[Path]) -> None:
+    """Fsync every file in directories (fallback when filesystems cannot be synced)."""
+    for directory in directories:
+        for file in directory.iterdir():
+            with open(file, "rb+") as f:
+                os.fsync(f.fileno())
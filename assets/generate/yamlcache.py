@@ -0,0 +1,104 @@
+"""
+Cached YAML Loading
+
+Parses YAML with libyaml's C loader when PyYAML was built with it, and keeps
+the parsed document as JSON in a cache directory, one entry per file, tagged
+with the SHA-256 of the file's content. While a file is unchanged, later runs
+read the JSON and never import PyYAML at all.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Bump when the cached representation changes so stale entries are ignored
+YAML_CACHE_VERSION = 1
+YAML_CACHE_SUBDIR = "yaml"
+
+
+def parse_yaml(text: str) -> Any:
+    """Parse YAML safely, with the C loader when available."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)
+
+
+def iter_yaml_documents(path: Path) -> Iterator[Any]:
+    """
+    Stream the documents of a multi-document YAML file.
+
+    Documents are parsed one at a time as they are consumed, so a file of
+    any size is read with bounded memory. Nothing is cached.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with path.open() as f:
+        yield from yaml.load_all(f, Loader=loader)
+
+
+def load_yaml(
+    path: Path,
+    cache_dir: Path | None = None,
+    validate: Callable[[Any], object] | None = None,
+) -> Any:
+    """
+    Load a YAML file, reusing a cached parse while its content is unchanged.
+
+    Args:
+        path: YAML file to read
+        cache_dir: Directory for cached parses, None to always parse
+        validate: Called on a fresh parse before it is cached; raise to reject
+
+    Returns:
+        The parsed document
+    """
+    data = path.read_bytes()
+    if cache_dir is None:
+        document = parse_yaml(data.decode())
+        if validate is not None:
+            validate(document)
+        return document
+
+    # One entry per source file, valid while the file's digest matches
+    digest = hashlib.sha256(data).hexdigest()
+    name = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+    entry = cache_dir / YAML_CACHE_SUBDIR / f"{name}.json"
+    try:
+        cached = json.loads(entry.read_text())
+        if cached["version"] == YAML_CACHE_VERSION and cached["digest"] == digest:
+            return cached["document"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    document = parse_yaml(data.decode())
+    if validate is not None:
+        validate(document)
+    try:
+        encoded = json.dumps(
+            {"version": YAML_CACHE_VERSION, "digest": digest, "document": document}
+        )
+    except (TypeError, ValueError):
+        return document  # not representable as JSON (e.g. dates): skip caching
+    _write_atomic(entry, encoded)
+    return document
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Best-effort cache write; a failure only costs a re-parse next time."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
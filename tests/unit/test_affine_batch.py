@@ -0,0 +1,120 @@
+"""
+Level 1 Unit Tests: Batched affine transforms over packed glyph geometry.
+
+Tests verify that GeometryBatch:
+- Packs paths into one buffer and slices them back unchanged
+- Matches transform_path() exactly for translations
+- Applies general 2x3 matrices (rotation, composition) to every point
+"""
+
+import pytest
+
+# Constants
+SQUARE_PATH = "M 0 0 L 10 0 L 10 10 L 0 10 Z"
+TIGHT_OFFSET = (3.5999999999999996, -5.0)
+
+
+class TestPackingRoundTrip:
+    """Level 1: Verify packing and slicing preserves every path."""
+
+    def test_untransformed_batch_returns_original_paths(self) -> None:
+        """GIVEN all generator paths WHEN packed and sliced THEN unchanged."""
+        from assets.generate.affine import GeometryBatch
+        from assets.generate.generate_logos import wordmark_paths
+        from assets.generate.pathdata import PathData
+
+        paths = wordmark_paths()
+
+        result = GeometryBatch.from_paths(paths).to_paths()
+
+        assert list(result) == list(paths)
+        for name, d in paths.items():
+            assert result[name] == PathData.parse(d)
+
+    def test_offsets_cover_whole_buffer(self) -> None:
+        """GIVEN packed paths WHEN offsets read THEN they span every point."""
+        from assets.generate.affine import GeometryBatch
+        from assets.generate.generate_logos import ICON_PATHS
+
+        batch = GeometryBatch.from_paths(ICON_PATHS)
+
+        assert batch.offsets[0] == 0
+        assert batch.offsets[-1] == len(batch.points)
+        assert len(batch) == len(ICON_PATHS)
+
+    def test_concat_keeps_order_and_offsets(self) -> None:
+        """GIVEN two batches WHEN concatenated THEN paths slice back unchanged."""
+        from assets.generate.affine import GeometryBatch
+        from assets.generate.generate_logos import ICON_PATHS
+        from assets.generate.pathdata import PathData
+
+        first = GeometryBatch.from_paths({"square": SQUARE_PATH})
+        second = GeometryBatch.from_paths(ICON_PATHS)
+
+        result = GeometryBatch.concat([first, second]).to_paths()
+
+        assert list(result) == ["square", *ICON_PATHS]
+        assert result["square"] == PathData.parse(SQUARE_PATH)
+        for name, d in ICON_PATHS.items():
+            assert result[name] == PathData.parse(d)
+
+    def test_concat_rejects_repeated_names(self) -> None:
+        """GIVEN two batches sharing a name WHEN concatenated THEN ValueError."""
+        from assets.generate.affine import GeometryBatch
+
+        batch = GeometryBatch.from_paths({"square": SQUARE_PATH})
+
+        with pytest.raises(ValueError, match="repeated path names"):
+            GeometryBatch.concat([batch, batch])
+
+
+class TestBatchMatchesTransformPath:
+    """Level 1: Verify one batched translation equals per-path transforms."""
+
+    def test_translation_is_byte_identical(self) -> None:
+        """
+        GIVEN every icon and text path
+        WHEN translated as one batch
+        THEN each result equals transform_path() on that path.
+        """
+        from assets.generate.affine import GeometryBatch, translation
+        from assets.generate.generate_logos import (
+            transform_path,
+            wordmark_paths,
+        )
+
+        paths = wordmark_paths()
+
+        result = GeometryBatch.from_paths(paths).transformed(translation(*TIGHT_OFFSET))
+
+        for name, d in result.to_d().items():
+            assert d == transform_path(paths[name], translate=TIGHT_OFFSET)
+
+
+class TestGeneralMatrices:
+    """Level 1: Verify matrices beyond scale and translate."""
+
+    def test_rotation_quarter_turn(self) -> None:
+        """GIVEN a square WHEN rotated 90 degrees THEN (10, 0) maps to (0, 10)."""
+        from assets.generate.affine import GeometryBatch, rotation
+
+        batch = GeometryBatch.from_paths({"square": SQUARE_PATH})
+
+        points = batch.transformed(rotation(90)).points
+
+        assert points[1] == pytest.approx([0.0, 10.0], abs=1e-12)
+
+    def test_compose_applies_first_matrix_first(self) -> None:
+        """GIVEN scale 2 then translate 5 WHEN composed THEN (10, 10) -> (25, 25)."""
+        from assets.generate.affine import (
+            GeometryBatch,
+            compose,
+            scaling,
+            translation,
+        )
+
+        batch = GeometryBatch.from_paths({"square": SQUARE_PATH})
+
+        points = batch.transformed(compose(scaling(2), translation(5, 5))).points
+
+        assert points[2] == pytest.approx([25.0, 25.0])
@@ -0,0 +1,142 @@
+"""
+Level 1 Unit Tests: Asset weight budgets.
+
+Tests verify that:
+- SVGs are weighed by bytes, gzip size, path elements and segments
+- Segments are counted for any path data, arcs and smooth curves included
+- Malformed budget files are rejected with every problem listed
+- Every budget matching an asset applies; unmatched assets are unlimited
+- The checked-in budgets hold for the generated wordmarks
+- --check fails when an asset is over budget
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Constants
+PROJECT_ROOT = Path(__file__).parents[2]
+BUDGETS_FILE = PROJECT_ROOT / "assets" / "generate" / "asset-budgets.yaml"
+SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 8">'
+    b'<path d="M0 0H4V4Z"/><path d="M5 5Q6 6 7 5"/></svg>'
+)
+# One arc, one smooth cubic, one smooth quadratic and a closepath
+ARC_PATH = "M0 0A5 5 0 0 1 10 10S12 12 14 14T16 16Z"
+
+
+class TestMeasureAsset:
+    """Level 1: Verify the measurements."""
+
+    def test_svg_paths_and_segments(self) -> None:
+        """GIVEN an SVG with two paths WHEN measured THEN paths and segments."""
+        from assets.generate.budget import gzip_size, measure_asset
+
+        weight = measure_asset("logo.svg", SVG)
+
+        assert weight.bytes == len(SVG)
+        assert weight.gzip_bytes == gzip_size(SVG)
+        assert (weight.paths, weight.segments) == (2, 4)
+
+    def test_other_files_have_no_paths(self) -> None:
+        """GIVEN a non-SVG file WHEN measured THEN only sizes."""
+        from assets.generate.budget import measure_asset
+
+        weight = measure_asset("icon.png", SVG)
+
+        assert (weight.paths, weight.segments) == (0, 0)
+
+    def test_arc_path_counted(self) -> None:
+        """GIVEN an SVG with arc and smooth curves WHEN measured THEN 4 segments."""
+        from assets.generate.budget import measure_asset
+
+        svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16">'
+            f'<path d="{ARC_PATH}"/></svg>'
+        )
+
+        weight = measure_asset("arc.svg", svg.encode())
+
+        assert (weight.paths, weight.segments) == (1, 4)
+
+    def test_segments_match_path_data(self) -> None:
+        """GIVEN every wordmark path WHEN counted THEN same as PathData."""
+        from assets.generate.budget import count_segments
+        from assets.generate.generate_logos import wordmark_paths
+        from assets.generate.pathdata import PathData
+
+        for d in wordmark_paths().values():
+            compact = PathData.parse(d).to_d(2)
+
+            assert count_segments(d) == PathData.parse(d).segment_count()
+            assert count_segments(compact) == PathData.parse(compact).segment_count()
+
+    def test_malformed_svg_rejected(self) -> None:
+        """GIVEN a truncated SVG WHEN measured THEN ValueError naming it."""
+        from assets.generate.budget import measure_asset
+
+        with pytest.raises(ValueError, match="logo.svg"):
+            measure_asset("logo.svg", SVG[:-6])
+
+
+class TestBudgets:
+    """Level 1: Verify budget parsing and comparison."""
+
+    def test_invalid_budgets_rejected(self) -> None:
+        """GIVEN an unknown metric and a negative limit WHEN parsed THEN both listed."""
+        from assets.generate.budget import parse_budgets
+
+        with pytest.raises(ValueError) as error:
+            parse_budgets({"*.svg": {"size": 10}, "*.png": {"bytes": -1}})
+
+        assert "unknown metric 'size'" in str(error.value)
+        assert "*.png: bytes must be an integer >= 0" in str(error.value)
+
+    def test_every_matching_budget_applies(self) -> None:
+        """GIVEN a broad and a narrow budget WHEN checked THEN both limits apply."""
+        from assets.generate.budget import AssetWeight, check_budgets, parse_budgets
+
+        budgets = parse_budgets(
+            {"*.svg": {"bytes": 1000, "segments": 10}, "public/*": {"bytes": 100}}
+        )
+        weights = {
+            "public/logo.svg": AssetWeight(500, 200, 2, 20),
+            "assets/logo.svg": AssetWeight(500, 200, 2, 5),
+            "notes.txt": AssetWeight(10**6, 10**5, 0, 0),
+        }
+
+        violations = check_budgets(weights, budgets)
+
+        assert [(v.name, v.metric, v.limit) for v in violations] == [
+            ("public/logo.svg", "segments", 10),
+            ("public/logo.svg", "bytes", 100),
+        ]
+
+    def test_checked_in_budgets_hold(self) -> None:
+        """GIVEN every generated wordmark WHEN checked THEN within budget."""
+        from assets.generate.budget import check_budgets, load_budgets, measure_asset
+        from assets.generate.generate_logos import render_assets
+
+        weights = {
+            name: measure_asset(name, data) for name, data in render_assets().items()
+        }
+
+        assert check_budgets(weights, load_budgets(BUDGETS_FILE)) == []
+
+
+class TestBudgetCheckMode:
+    """Level 1: Verify --check enforces budgets."""
+
+    def test_over_budget_fails_check(self, capsys: pytest.CaptureFixture) -> None:
+        """GIVEN a budget below a wordmark's size WHEN checked THEN exit 1."""
+        from assets.generate.budget import parse_budgets
+        from assets.generate.generate_logos import run_check
+
+        budgets = parse_budgets({"assets/wordmark/wordmark-dark.svg": {"bytes": 100}})
+
+        code = run_check({}, PROJECT_ROOT / "assets", PROJECT_ROOT, budgets)
+
+        output = capsys.readouterr().out
+        assert code == 1
+        assert "✗ assets/wordmark/wordmark-dark.svg" in output
+        assert "✗ Over budget (1 limits exceeded)" in output
@@ -0,0 +1,177 @@
+"""
+Level 1 Unit Tests: In-memory rendering and atomic bulk writes.
+
+Tests verify that:
+- A committed write set replaces every file and leaves no staging directory
+- A failure while staging leaves every destination untouched
+- Linked entries share the data (and inode) of their source
+- Removals are applied with the rest of the commit, not before
+- A held FileLock makes the next holder wait, and tells it so
+- render_assets() returns every built file, wordmarks, PNG exports and the
+  favicon bundle included, without writing to disk
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+# Constants
+MAPPINGS = {
+    "wordmark": [{"source": "wordmark-dark-tight.svg", "dest": "site/logo.svg"}]
+}
+ICON_SOURCE = "icon/icon-rounded-tight.svg"
+ASSETS_DIR = Path(__file__).parents[2] / "assets"
+
+
+class TestWriteSet:
+    """Level 1: Verify staged, all-or-nothing commits."""
+
+    def test_commit_writes_every_file(self, tmp_path: Path) -> None:
+        """GIVEN files in two directories WHEN committed THEN all written, none staged."""
+        from assets.generate.writeset import STAGING_PREFIX, WriteSet
+
+        (tmp_path / "a.svg").write_bytes(b"old")
+        writes = WriteSet()
+        writes.add(tmp_path / "a.svg", b"new")
+        writes.add(tmp_path / "sub" / "b.svg", b"b")
+
+        committed = writes.commit()
+
+        assert committed == [tmp_path / "a.svg", tmp_path / "sub" / "b.svg"]
+        assert (tmp_path / "a.svg").read_bytes() == b"new"
+        assert (tmp_path / "sub" / "b.svg").read_bytes() == b"b"
+        assert not list(tmp_path.rglob(f"{STAGING_PREFIX}*"))
+        assert len(writes) == 0
+
+    def test_failed_staging_leaves_destinations_untouched(self, tmp_path: Path) -> None:
+        """GIVEN an unwritable entry WHEN committed THEN no destination changes."""
+        from assets.generate.writeset import STAGING_PREFIX, WriteSet
+
+        (tmp_path / "a.svg").write_bytes(b"old")
+        (tmp_path / "blocker").write_bytes(b"")  # a file where a directory must go
+        writes = WriteSet()
+        writes.add(tmp_path / "a.svg", b"new")
+        writes.add(tmp_path / "blocker" / "b.svg", b"b")
+
+        with pytest.raises(OSError):
+            writes.commit()
+
+        assert (tmp_path / "a.svg").read_bytes() == b"old"
+        assert not list(tmp_path.rglob(f"{STAGING_PREFIX}*"))
+
+    def test_link_shares_source_inode(self, tmp_path: Path) -> None:
+        """GIVEN a link to a staged file WHEN committed THEN both are one inode."""
+        from assets.generate.writeset import WriteSet
+
+        writes = WriteSet()
+        writes.add(tmp_path / "source.svg", b"<svg/>")
+        writes.link(tmp_path / "copy.svg", tmp_path / "source.svg")
+
+        writes.commit(sync=False)
+
+        assert (tmp_path / "copy.svg").read_bytes() == b"<svg/>"
+        assert os.path.samefile(tmp_path / "copy.svg", tmp_path / "source.svg")
+
+    def test_removal_applied_on_commit(self, tmp_path: Path) -> None:
+        """GIVEN a file staged for removal WHEN committed THEN deleted only then."""
+        from assets.generate.writeset import WriteSet
+
+        stale = tmp_path / "logo.svg.gz"
+        stale.write_bytes(b"stale")
+        writes = WriteSet()
+        writes.add(tmp_path / "logo.svg", b"<svg/>")
+        writes.remove(stale)
+        writes.remove(tmp_path / "missing.svg.gz")
+
+        assert stale.exists()
+        committed = writes.commit(sync=False)
+
+        assert not stale.exists()
+        assert committed[-2:] == [stale, tmp_path / "missing.svg.gz"]
+
+    def test_link_to_unstaged_file_rejected(self, tmp_path: Path) -> None:
+        """GIVEN a source that is not staged WHEN linked THEN KeyError."""
+        from assets.generate.writeset import WriteSet
+
+        with pytest.raises(KeyError):
+            WriteSet().link(tmp_path / "copy.svg", tmp_path / "missing.svg")
+
+
+class TestFileLock:
+    """Level 1: Verify the advisory lock serializes runs."""
+
+    @pytest.mark.skipif(os.name == "nt", reason="flock is unavailable on Windows")
+    def test_second_holder_waits(self, tmp_path: Path) -> None:
+        """GIVEN a held lock WHEN taken again THEN on_wait runs, then it waits."""
+        from assets.generate.writeset import FileLock
+
+        lock_file = tmp_path / "locks" / "run.lock"
+        waited = threading.Event()
+        order = []
+
+        def second_run() -> None:
+            with FileLock(lock_file, on_wait=waited.set):
+                order.append("second")
+
+        with FileLock(lock_file):
+            thread = threading.Thread(target=second_run)
+            thread.start()
+            assert waited.wait(timeout=5)
+            order.append("first")
+        thread.join(timeout=5)
+
+        assert order == ["first", "second"]
+
+
+class TestRenderAssets:
+    """Level 1: Verify the in-memory rendering API."""
+
+    def test_matches_built_files_without_io(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GIVEN a built tree WHEN rendered in memory THEN same bytes, no files."""
+        from assets.generate.generate_logos import (
+            FAVICON_BUNDLE,
+            PNG_EXPORTS,
+            build_asset_graph,
+            is_file_node,
+            render_assets,
+        )
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.writeset import WriteSet
+
+        build_dir = tmp_path / "build"
+        render_dir = tmp_path / "render"
+        render_dir.mkdir()
+        icon = build_dir / "assets" / ICON_SOURCE
+        icon.parent.mkdir(parents=True)
+        icon.write_bytes((ASSETS_DIR / ICON_SOURCE).read_bytes())
+        manifest = BuildManifest(build_dir / "lock.yaml", build_dir / "assets")
+        writes = WriteSet()
+        graph = build_asset_graph(
+            MAPPINGS,
+            build_dir / "assets",
+            build_dir,
+            manifest,
+            writes,
+            png_exports=PNG_EXPORTS,
+            favicon_bundle=FAVICON_BUNDLE,
+        )
+        built = [name for name in graph.nodes if is_file_node(name)]
+        graph.run(built)
+        writes.commit(sync=False)
+
+        monkeypatch.chdir(render_dir)
+        files = render_assets(MAPPINGS)
+
+        assert sorted(files) == sorted(built)
+        assert {
+            "assets/favicon/favicon.ico",
+            "assets/favicon/site.webmanifest",
+            "assets/icon/icon-rounded-tight_512x512.png",
+        } <= set(files)
+        for name, data in files.items():
+            assert (build_dir / name).read_bytes() == data
+        assert list(render_dir.iterdir()) == []
@@ -0,0 +1,84 @@
+"""
+Level 1 Unit Tests: Benchmark harness.
+
+Tests verify that:
+- Timing calibrates loops, warms up and repeats
+- Baselines round-trip through JSON
+- Comparison flags only slowdowns beyond the threshold
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Constants
+THRESHOLD = 10.0
+
+
+def result(median: float):
+    """A BenchmarkResult with the given median."""
+    from assets.generate.benchmark import BenchmarkResult
+
+    return BenchmarkResult(
+        median=median, min=median, mean=median, stdev=0.0, loops=1, repeat=1
+    )
+
+
+class TestTiming:
+    """Level 1: Verify the timing loop."""
+
+    def test_warmup_and_repetitions_are_run(self) -> None:
+        """GIVEN a counting function WHEN timed THEN warmup + calibration + repeats ran."""
+        from assets.generate.benchmark import time_function
+
+        calls = []
+
+        timing = time_function(lambda: calls.append(1), warmup=2, repeat=3, min_time=0)
+
+        assert timing.loops == 1
+        assert timing.repeat == 3
+        assert len(calls) == 2 + 1 + 3
+        assert 0 <= timing.min <= timing.median
+
+
+class TestBaselines:
+    """Level 1: Verify baseline files and comparison."""
+
+    def test_results_round_trip(self, tmp_path: Path) -> None:
+        """GIVEN saved results WHEN loaded THEN they are unchanged."""
+        from assets.generate.benchmark import load_results, save_results
+
+        results = {"transform_path[a]": result(1e-5)}
+        save_results(results, tmp_path / "baseline.json")
+
+        assert load_results(tmp_path / "baseline.json") == results
+
+    def test_rejects_foreign_json(self, tmp_path: Path) -> None:
+        """GIVEN a JSON file without the schema WHEN loaded THEN ValueError."""
+        from assets.generate.benchmark import load_results
+
+        path = tmp_path / "other.json"
+        path.write_text("{}")
+
+        with pytest.raises(ValueError):
+            load_results(path)
+
+    def test_only_slowdowns_beyond_threshold_regress(self) -> None:
+        """GIVEN faster, slightly slower and much slower results THEN only the last fails."""
+        from assets.generate.benchmark import compare_results
+
+        baseline = {"faster": result(1.0), "noise": result(1.0), "slower": result(1.0)}
+        current = {"faster": result(0.5), "noise": result(1.05), "slower": result(1.2)}
+
+        _, regressions = compare_results(baseline, current, THRESHOLD)
+
+        assert regressions == ["slower"]
+
+    def test_unmatched_benchmarks_are_reported_not_failed(self) -> None:
+        """GIVEN disjoint result sets WHEN compared THEN nothing regresses."""
+        from assets.generate.benchmark import compare_results
+
+        lines, regressions = compare_results({"old": result(1.0)}, {"new": result(1.0)})
+
+        assert regressions == []
+        assert len(lines) == 2
@@ -0,0 +1,82 @@
+"""
+Level 1 Unit Tests: Exact bounding boxes.
+
+Tests verify that:
+- Bounds match svgpathtools bbox() for lines, quadratics and cubics
+- Control points outside a curve do not widen its bounds
+- The tight wordmark layout derives its padding from the bounds
+"""
+
+import pytest
+
+# Constants
+CUBIC_PATH = "M 0 0 C 0 -10 10 -10 10 0 C 10 10 20 10 20 0 Z"
+QUAD_PATH = "M 0 0 Q 5 10 10 0 L 10 -2 Z"
+RELATIVE_PATH = "m 5 5 h 10 v 4 q -5 6 -10 0 z m 2 2 c 1 -3 3 -3 4 0"
+TOLERANCE = 1e-9
+
+
+def svgpathtools_bounds(d: str) -> tuple[float, float, float, float]:
+    """(left, top, right, bottom) via svgpathtools for reference."""
+    from svgpathtools import parse_path
+
+    xmin, xmax, ymin, ymax = parse_path(d).bbox()
+    return xmin, ymin, xmax, ymax
+
+
+class TestBatchBounds:
+    """Level 1: Verify exact bounds against svgpathtools."""
+
+    @pytest.mark.parametrize("d", [CUBIC_PATH, QUAD_PATH, RELATIVE_PATH])
+    def test_matches_svgpathtools(self, d: str) -> None:
+        """GIVEN a path WHEN bounded THEN the box equals svgpathtools bbox()."""
+        from assets.generate.affine import GeometryBatch
+        from assets.generate.bounds import batch_bounds
+
+        bounds = batch_bounds(GeometryBatch.from_paths({"p": d}))["p"]
+
+        expected = svgpathtools_bounds(d)
+        actual = (bounds.left, bounds.top, bounds.right, bounds.bottom)
+        assert actual == pytest.approx(expected, abs=TOLERANCE)
+
+    def test_control_points_do_not_count(self) -> None:
+        """GIVEN a quadratic with control at y=10 WHEN bounded THEN bottom is 5."""
+        from assets.generate.affine import GeometryBatch
+        from assets.generate.bounds import batch_bounds
+
+        bounds = batch_bounds(GeometryBatch.from_paths({"p": QUAD_PATH}))["p"]
+
+        assert bounds.bottom == pytest.approx(5.0)
+
+    def test_all_glyphs_match_svgpathtools(self) -> None:
+        """GIVEN every wordmark glyph WHEN bounded THEN each matches svgpathtools."""
+        from assets.generate.generate_logos import get_bounds, wordmark_paths
+
+        bounds = get_bounds()
+
+        for name, d in wordmark_paths().items():
+            box = bounds[name]
+            assert (box.left, box.top, box.right, box.bottom) == pytest.approx(
+                svgpathtools_bounds(d), abs=TOLERANCE
+            ), name
+
+
+class TestTightLayout:
+    """Level 1: Verify the tight layout is derived from the bounds."""
+
+    def test_padding_is_exact_on_all_sides(self) -> None:
+        """GIVEN the tight layout WHEN its paths are bounded THEN padding matches CONFIG."""
+        from assets.generate.affine import GeometryBatch
+        from assets.generate.bounds import batch_bounds, union_bounds
+        from assets.generate.generate_logos import CONFIG, wordmark_layout
+
+        layout = wordmark_layout(tight=True)
+        box = union_bounds(
+            list(batch_bounds(GeometryBatch.from_paths(layout.paths)).values())
+        )
+        tight = CONFIG["wordmark"]["tight"]
+
+        assert box.left == pytest.approx(tight["horizontal_padding"])
+        assert box.top == pytest.approx(tight["vertical_padding"])
+        assert layout.viewbox_width == round(box.width + 2 * box.left)
+        assert layout.viewbox_height == round(box.height + 2 * box.top)
@@ -0,0 +1,139 @@
+"""
+Level 1 Unit Tests: Declarative asset build graph.
+
+Tests verify that:
+- Each node is evaluated at most once per run
+- Dependencies are only built when a node reads them
+- Target selection builds just the requested outputs and what they need
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Constants
+TIGHT_VARIANTS = ["dark", "light", "white", "adaptive"]
+DEPLOY_DEST = "site/logo.svg"
+MAPPINGS = {"wordmark": [{"source": "wordmark-dark-tight.svg", "dest": DEPLOY_DEST}]}
+
+
+def make_asset_graph(tmp_path: Path, writes=None):
+    """Build the generator graph over a temporary assets tree."""
+    from assets.generate.generate_logos import build_asset_graph
+    from assets.generate.manifest import BuildManifest
+    from assets.generate.writeset import WriteSet
+
+    assets_dir = tmp_path / "assets"
+    manifest = BuildManifest(tmp_path / "lock.yaml", assets_dir)
+    if writes is None:
+        writes = WriteSet()
+    return build_asset_graph(MAPPINGS, assets_dir, tmp_path, manifest, writes)
+
+
+class TestGraphEvaluation:
+    """Level 1: Verify memoized, lazy evaluation."""
+
+    def test_shared_dependency_built_once(self) -> None:
+        """GIVEN two nodes reading one dependency WHEN both run THEN it builds once."""
+        from assets.generate.graph import BuildGraph
+
+        calls = []
+        graph = BuildGraph()
+        graph.add("shared", lambda deps: calls.append("shared") or 1)
+        graph.add("a", lambda deps: deps["shared"] + 1, ["shared"])
+        graph.add("b", lambda deps: deps["shared"] + 2, ["shared"])
+
+        run = graph.run(["a", "b"])
+
+        assert (run.values["a"], run.values["b"]) == (2, 3)
+        assert calls == ["shared"]
+
+    def test_unread_dependency_is_not_built(self) -> None:
+        """GIVEN a node that skips its dependency WHEN run THEN it is not built."""
+        from assets.generate.graph import BuildGraph
+
+        graph = BuildGraph()
+        graph.add("expensive", lambda deps: pytest.fail("should not build"))
+        graph.add("output", lambda deps: "fresh", ["expensive"])
+
+        run = graph.run(["output"])
+
+        assert run.evaluated == ["output"]
+
+    def test_resolve_builds_dependencies_first(self) -> None:
+        """GIVEN a node resolving its dependencies WHEN run THEN they build first."""
+        from assets.generate.graph import BuildGraph
+
+        graph = BuildGraph()
+        graph.add("source", lambda deps: "written")
+        graph.add("copy", lambda deps: deps.resolve(), ["source"])
+
+        run = graph.run(["copy"])
+
+        assert run.evaluated == ["source", "copy"]
+
+    def test_cycle_is_rejected(self) -> None:
+        """GIVEN nodes depending on each other WHEN run THEN DependencyCycleError."""
+        from assets.generate.graph import BuildGraph, DependencyCycleError
+
+        graph = BuildGraph()
+        graph.add("a", lambda deps: deps["b"], ["b"])
+        graph.add("b", lambda deps: deps["a"], ["a"])
+
+        with pytest.raises(DependencyCycleError):
+            graph.run(["a"])
+
+    def test_unknown_target_is_rejected(self) -> None:
+        """GIVEN an empty graph WHEN a missing target is run THEN UnknownTargetError."""
+        from assets.generate.graph import BuildGraph, UnknownTargetError
+
+        with pytest.raises(UnknownTargetError):
+            BuildGraph().run(["missing"])
+
+
+class TestAssetGraph:
+    """Level 1: Verify the generator's graph and target selection."""
+
+    def test_tight_layout_computed_once_for_all_variants(self, tmp_path: Path) -> None:
+        """GIVEN all four tight outputs WHEN built THEN layout:tight evaluated once."""
+        graph = make_asset_graph(tmp_path)
+        targets = [f"assets/wordmark/wordmark-{v}-tight.svg" for v in TIGHT_VARIANTS]
+
+        run = graph.run(targets)
+
+        assert run.evaluated.count("layout:tight") == 1
+        assert "layout:regular" not in run.evaluated
+
+    def test_only_deploy_target_builds_its_source(self, tmp_path: Path) -> None:
+        """GIVEN a deploy destination WHEN built alone THEN only its chain runs."""
+        from assets.generate.generate_logos import resolve_targets
+        from assets.generate.writeset import WriteSet
+
+        writes = WriteSet()
+        graph = make_asset_graph(tmp_path, writes)
+        targets = resolve_targets(graph, [DEPLOY_DEST], tmp_path)
+
+        run = graph.run(targets)
+        writes.commit(sync=False)
+
+        assert (tmp_path / DEPLOY_DEST).exists()
+        assert (tmp_path / "assets/wordmark/wordmark-dark-tight.svg").exists()
+        assert not (tmp_path / "assets/wordmark/wordmark-light-tight.svg").exists()
+        assert set(run.evaluated) == {
+            "layout:tight",
+            "template:tight",
+            "palette:dark",
+            "svg:wordmark-dark-tight.svg",
+            "assets/wordmark/wordmark-dark-tight.svg",
+            DEPLOY_DEST,
+        }
+
+    def test_unknown_only_target_is_rejected(self, tmp_path: Path) -> None:
+        """GIVEN a path that is not an asset WHEN resolved THEN UnknownTargetError."""
+        from assets.generate.generate_logos import resolve_targets
+        from assets.generate.graph import UnknownTargetError
+
+        graph = make_asset_graph(tmp_path)
+
+        with pytest.raises(UnknownTargetError):
+            resolve_targets(graph, ["README.md"], tmp_path)
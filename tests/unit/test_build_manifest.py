@@ -0,0 +1,97 @@
+"""
+Level 1 Unit Tests: Incremental build manifest.
+
+Tests verify that BuildManifest:
+- Hashes blobs exactly like git hash-object
+- Treats an output as fresh only when inputs and content both match
+- Writes a deterministic file only when an entry changed
+"""
+
+from pathlib import Path
+
+# Constants
+OUTPUT = "wordmark/wordmark-dark.svg"
+CONTENT = b"<svg/>"
+EMPTY_BLOB_HASH = "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+
+
+class TestHashing:
+    """Level 1: Verify content and input hashing."""
+
+    def test_empty_blob_matches_git(self) -> None:
+        """GIVEN empty content WHEN hashed THEN equals git's empty blob id."""
+        from assets.generate.manifest import git_blob_hash
+
+        assert git_blob_hash(b"") == EMPTY_BLOB_HASH
+
+    def test_inputs_hash_ignores_key_order(self) -> None:
+        """GIVEN equal dicts in different order WHEN hashed THEN hashes match."""
+        from assets.generate.manifest import inputs_hash
+
+        assert inputs_hash({"a": 1, "b": 2}) == inputs_hash({"b": 2, "a": 1})
+
+
+class TestFreshness:
+    """Level 1: Verify skip decisions."""
+
+    def test_recorded_output_is_fresh(self, tmp_path: Path) -> None:
+        """GIVEN a recorded output on disk WHEN checked THEN fresh."""
+        from assets.generate.manifest import BuildManifest
+
+        (tmp_path / "wordmark").mkdir()
+        (tmp_path / OUTPUT).write_bytes(CONTENT)
+        manifest = BuildManifest(tmp_path / "lock.yaml", tmp_path)
+        manifest.record(OUTPUT, "inputs-1", CONTENT)
+
+        assert manifest.is_fresh(OUTPUT, "inputs-1")
+
+    def test_changed_inputs_are_stale(self, tmp_path: Path) -> None:
+        """GIVEN a recorded output WHEN inputs hash differs THEN stale."""
+        from assets.generate.manifest import BuildManifest
+
+        (tmp_path / "wordmark").mkdir()
+        (tmp_path / OUTPUT).write_bytes(CONTENT)
+        manifest = BuildManifest(tmp_path / "lock.yaml", tmp_path)
+        manifest.record(OUTPUT, "inputs-1", CONTENT)
+
+        assert not manifest.is_fresh(OUTPUT, "inputs-2")
+
+    def test_edited_output_is_stale(self, tmp_path: Path) -> None:
+        """GIVEN a recorded output WHEN the file is edited THEN stale."""
+        from assets.generate.manifest import BuildManifest
+
+        (tmp_path / "wordmark").mkdir()
+        manifest = BuildManifest(tmp_path / "lock.yaml", tmp_path)
+        manifest.record(OUTPUT, "inputs-1", CONTENT)
+        (tmp_path / OUTPUT).write_bytes(b"<svg>edited</svg>")
+
+        assert not manifest.is_fresh(OUTPUT, "inputs-1")
+
+
+class TestPersistence:
+    """Level 1: Verify the manifest file round-trips."""
+
+    def test_saved_manifest_reloads(self, tmp_path: Path) -> None:
+        """GIVEN a saved manifest WHEN reloaded THEN entries are preserved."""
+        from assets.generate.manifest import BuildManifest
+
+        manifest = BuildManifest(tmp_path / "lock.yaml", tmp_path)
+        manifest.record(OUTPUT, "inputs-1", CONTENT)
+        manifest.save()
+
+        reloaded = BuildManifest(tmp_path / "lock.yaml", tmp_path)
+
+        assert reloaded.entries == manifest.entries
+
+    def test_unchanged_manifest_is_not_rewritten(self, tmp_path: Path) -> None:
+        """GIVEN a reloaded manifest WHEN the same entry recorded THEN no write."""
+        from assets.generate.manifest import BuildManifest
+
+        manifest = BuildManifest(tmp_path / "lock.yaml", tmp_path)
+        manifest.record(OUTPUT, "inputs-1", CONTENT)
+        manifest.save()
+        reloaded = BuildManifest(tmp_path / "lock.yaml", tmp_path)
+
+        reloaded.record(OUTPUT, "inputs-1", CONTENT)
+
+        assert reloaded.save() is False
@@ -0,0 +1,134 @@
+"""
+Level 1 Unit Tests: --check mode.
+
+Tests verify that:
+- A freshly built tree has no drift
+- Modified and missing files are reported by Git blob hash
+- Checking writes nothing
+- Checking a fresh checkout, with no cache, stays within budget
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Constants
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+MAPPINGS = {
+    "wordmark": [{"source": "wordmark-dark-tight.svg", "dest": "site/logo.svg"}]
+}
+EXPECTED_FILES = 9  # 8 wordmarks + 1 deployed copy
+# Wall time of `generate_logos.py --check` on the full asset set, including
+# interpreter startup; re-optimizing the rasters alone takes longer
+CHECK_BUDGET_S = 1.0
+ATTEMPTS = 3
+CHECK_SCRIPT = """
+from assets.generate.generate_logos import main
+raise SystemExit(main(["--check"]))
+"""
+
+
+def build_tree(tmp_path: Path) -> Path:
+    """Generate and deploy every asset into tmp_path; return the assets dir."""
+    from assets.generate.generate_logos import build_asset_graph, is_file_node
+    from assets.generate.manifest import BuildManifest
+    from assets.generate.writeset import WriteSet
+
+    assets_dir = tmp_path / "assets"
+    manifest = BuildManifest(tmp_path / "lock.yaml", assets_dir)
+    writes = WriteSet()
+    graph = build_asset_graph(MAPPINGS, assets_dir, tmp_path, manifest, writes)
+    graph.run([name for name in graph.nodes if is_file_node(name)])
+    writes.commit(sync=False)
+    return assets_dir
+
+
+def timed_check(root: Path, cache_dir: Path) -> float:
+    """Seconds `--check` takes in root with cache_dir as its cache; must pass."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", CHECK_SCRIPT],
+        cwd=root,
+        env={**os.environ, "LOGO_CACHE_DIR": str(cache_dir)},
+        capture_output=True,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+class TestCheckAssets:
+    """Level 1: Verify drift detection."""
+
+    def test_fresh_tree_has_no_drift(self, tmp_path: Path) -> None:
+        """GIVEN a freshly built tree WHEN checked THEN no drift is reported."""
+        from assets.generate.generate_logos import check_assets
+
+        assets_dir = build_tree(tmp_path)
+
+        checked, drift = check_assets(MAPPINGS, assets_dir, tmp_path)
+
+        assert checked == EXPECTED_FILES
+        assert drift == []
+
+    def test_reports_modified_and_missing_files(self, tmp_path: Path) -> None:
+        """GIVEN an edited and a deleted file WHEN checked THEN both are reported."""
+        from assets.generate.generate_logos import check_assets, format_drift
+        from assets.generate.manifest import git_blob_hash
+
+        assets_dir = build_tree(tmp_path)
+        edited = assets_dir / "wordmark" / "wordmark-light.svg"
+        edited.write_text("<svg/>")
+        (tmp_path / "site" / "logo.svg").unlink()
+
+        _, drift = check_assets(MAPPINGS, assets_dir, tmp_path)
+
+        assert {d.path for d in drift} == {edited, tmp_path / "site" / "logo.svg"}
+        modified = next(d for d in drift if d.path == edited)
+        assert modified.actual_blob == git_blob_hash(b"<svg/>")
+        assert format_drift(drift, tmp_path)[0].startswith(
+            "  M assets/wordmark/wordmark-light.svg"
+        )
+
+    def test_check_writes_nothing(self, tmp_path: Path) -> None:
+        """GIVEN an empty tree WHEN checked THEN everything drifts and nothing is written."""
+        from assets.generate.generate_logos import check_assets
+
+        assets_dir = tmp_path / "assets"
+
+        checked, drift = check_assets(MAPPINGS, assets_dir, tmp_path)
+
+        assert len(drift) == checked == EXPECTED_FILES
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCheckBudget:
+    """Level 1: Verify --check is fast on a fresh checkout."""
+
+    def test_cold_check_within_budget(self, tmp_path: Path) -> None:
+        """GIVEN the committed assets and an empty cache WHEN checked THEN under budget."""
+        shutil.copytree(
+            PROJECT_ROOT / "assets",
+            tmp_path / "assets",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        # Deploy destinations outside assets/ are not copied; build them once
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from assets.generate.generate_logos import main; main([])",
+            ],
+            cwd=tmp_path,
+            env={**os.environ, "LOGO_CACHE_DIR": ""},
+            capture_output=True,
+            check=True,
+        )
+        cache_dirs = [tmp_path / f"cache-{i}" for i in range(ATTEMPTS)]
+
+        elapsed = [timed_check(tmp_path, cache_dir) for cache_dir in cache_dirs]
+
+        assert min(elapsed) < CHECK_BUDGET_S
+        assert not any(cache_dir.exists() for cache_dir in cache_dirs)
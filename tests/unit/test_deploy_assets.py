@@ -0,0 +1,127 @@
+"""
+Level 1 Unit Tests: Incremental asset deployment.
+
+Tests verify that:
+- Mappings are validated before any file is written
+- Destinations that already match their source are not rewritten
+- Changed destinations are replaced with the source content and metadata
+- Pruning removes only unmapped copies
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Constants
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg"/>\n'
+
+
+def make_assets(tmp_path: Path) -> Path:
+    """Create assets/wordmark/logo.svg under tmp_path and return assets/."""
+    assets_dir = tmp_path / "assets"
+    (assets_dir / "wordmark").mkdir(parents=True)
+    (assets_dir / "wordmark" / "logo.svg").write_bytes(SVG)
+    return assets_dir
+
+
+class TestValidation:
+    """Level 1: Verify mappings are checked up front."""
+
+    def test_missing_source_fails_before_any_copy(self, tmp_path: Path) -> None:
+        """GIVEN one good and one missing source WHEN deployed THEN nothing is written."""
+        from assets.generate.generate_logos import deploy_assets
+
+        assets_dir = make_assets(tmp_path)
+        mappings = {
+            "wordmark": [
+                {"source": "logo.svg", "dest": "site/logo.svg"},
+                {"source": "missing.svg", "dest": "site/missing.svg"},
+            ]
+        }
+
+        with pytest.raises(FileNotFoundError, match="missing.svg"):
+            deploy_assets(mappings, assets_dir, tmp_path)
+        assert not (tmp_path / "site").exists()
+
+    def test_duplicate_destination_is_rejected(self, tmp_path: Path) -> None:
+        """GIVEN two mappings to one destination WHEN planned THEN ValueError."""
+        from assets.generate.deploy import plan_deploy
+
+        mappings = {
+            "wordmark": [
+                {"source": "a.svg", "dest": "site/logo.svg"},
+                {"source": "b.svg", "dest": "site/logo.svg"},
+            ]
+        }
+
+        with pytest.raises(ValueError, match="site/logo.svg"):
+            plan_deploy(mappings, tmp_path / "assets", tmp_path)
+
+
+class TestDeployFile:
+    """Level 1: Verify incremental, atomic copies."""
+
+    def test_identical_destination_is_skipped(self, tmp_path: Path) -> None:
+        """GIVEN an identical destination WHEN deployed THEN it is not rewritten."""
+        from assets.generate.deploy import METHOD_UNCHANGED, deploy_file
+
+        source = make_assets(tmp_path) / "wordmark" / "logo.svg"
+        dest = tmp_path / "logo.svg"
+        dest.write_bytes(SVG)
+        before = dest.stat().st_ino
+
+        result = deploy_file(source, dest)
+
+        assert result.method == METHOD_UNCHANGED
+        assert dest.stat().st_ino == before
+
+    def test_changed_destination_is_replaced(self, tmp_path: Path) -> None:
+        """GIVEN a stale destination WHEN deployed THEN it matches the source."""
+        from assets.generate.deploy import deploy_file
+
+        source = make_assets(tmp_path) / "wordmark" / "logo.svg"
+        dest = tmp_path / "site" / "logo.svg"
+        dest.parent.mkdir()
+        dest.write_bytes(b"stale")
+
+        result = deploy_file(source, dest)
+
+        assert result.changed
+        assert dest.read_bytes() == SVG
+        assert dest.stat().st_mtime == source.stat().st_mtime
+        assert [p.name for p in dest.parent.iterdir()] == ["logo.svg"]
+
+    def test_link_shares_the_source_file(self, tmp_path: Path) -> None:
+        """GIVEN link allowed WHEN deployed on one filesystem THEN dest is a hard link."""
+        from assets.generate.deploy import METHOD_LINK, deploy_file
+
+        source = make_assets(tmp_path) / "wordmark" / "logo.svg"
+        dest = tmp_path / "logo.svg"
+
+        result = deploy_file(source, dest, link=True)
+
+        assert result.method == METHOD_LINK
+        assert dest.samefile(source)
+
+
+class TestPrune:
+    """Level 1: Verify only unmapped copies are pruned."""
+
+    def test_prunes_unmapped_copies_only(self, tmp_path: Path) -> None:
+        """GIVEN mapped and stale copies WHEN pruned THEN only stale ones go."""
+        from assets.generate.deploy import prune_orphans
+
+        public = tmp_path / "public"
+        public.mkdir()
+        for name in ["wordmark-dark.svg", "wordmark-old.svg", "other.svg"]:
+            (public / name).write_bytes(SVG)
+
+        removed = prune_orphans(
+            tmp_path, ["public/wordmark*.svg"], {public / "wordmark-dark.svg"}
+        )
+
+        assert removed == [public / "wordmark-old.svg"]
+        assert sorted(p.name for p in public.iterdir()) == [
+            "other.svg",
+            "wordmark-dark.svg",
+        ]
@@ -0,0 +1,171 @@
+"""
+Level 1 Unit Tests: Favicon bundle.
+
+Tests verify that:
+- ICO files list every embedded PNG with its size and offset
+- Oversized or non-PNG images are rejected
+- The web manifest fragment lists the icons marked for it
+- Every bundle file comes from one parse of the source icon
+- Bundle files can be deployed like any other asset
+"""
+
+import json
+import struct
+from pathlib import Path
+
+import pytest
+
+# Constants
+ICON_SOURCE = Path(__file__).parents[2] / "assets" / "icon" / "icon-rounded-tight.svg"
+BUNDLE = {
+    "source": "icon/icon-rounded-tight.svg",
+    "ico": {"name": "favicon.ico", "sizes": [16, 32]},
+    "png": [
+        {"name": "favicon-32x32.png", "size": 32},
+        {"name": "icon-48.png", "size": 48, "manifest": True},
+    ],
+    "webmanifest": {"name": "site.webmanifest", "url_prefix": "/static/"},
+}
+
+
+def make_assets(tmp_path: Path) -> Path:
+    """Assets directory holding only the source icon."""
+    assets_dir = tmp_path / "assets"
+    (assets_dir / "icon").mkdir(parents=True)
+    (assets_dir / "icon" / ICON_SOURCE.name).write_bytes(ICON_SOURCE.read_bytes())
+    return assets_dir
+
+
+def read_ico(data: bytes) -> list[tuple[int, int, bytes]]:
+    """(width, height, image) of every ICO entry, per the ICONDIR layout."""
+    reserved, kind, count = struct.unpack("<HHH", data[:6])
+    assert (reserved, kind) == (0, 1)
+    images = []
+    for index in range(count):
+        width, height, _, _, planes, bpp, size, offset = struct.unpack(
+            "<BBBBHHII", data[6 + 16 * index : 22 + 16 * index]
+        )
+        assert (planes, bpp) == (1, 32)
+        images.append((width or 256, height or 256, data[offset : offset + size]))
+    return images
+
+
+class TestPackIco:
+    """Level 1: Verify ICO packing."""
+
+    def test_entries_point_at_images(self) -> None:
+        """GIVEN PNGs of three sizes WHEN packed THEN each entry holds its PNG."""
+        import numpy as np
+
+        from assets.generate.favicon import pack_ico
+        from assets.generate.png import encode_png
+
+        pngs = [
+            encode_png(np.zeros((size, size, 4), dtype=np.uint8))
+            for size in (16, 32, 256)
+        ]
+
+        images = read_ico(pack_ico(pngs))
+
+        assert images == [(16, 16, pngs[0]), (32, 32, pngs[1]), (256, 256, pngs[2])]
+
+    def test_oversized_image_rejected(self) -> None:
+        """GIVEN a 257-pixel PNG WHEN packed THEN ValueError."""
+        import numpy as np
+
+        from assets.generate.favicon import pack_ico
+        from assets.generate.png import encode_png
+
+        png = encode_png(np.zeros((1, 257, 4), dtype=np.uint8))
+
+        with pytest.raises(ValueError, match="256x256"):
+            pack_ico([png])
+
+    def test_non_png_rejected(self) -> None:
+        """GIVEN bytes that are not a PNG WHEN packed THEN ValueError."""
+        from assets.generate.favicon import pack_ico
+
+        with pytest.raises(ValueError, match="PNG"):
+            pack_ico([b"GIF89a"])
+
+
+class TestWebmanifestIcons:
+    """Level 1: Verify the web manifest fragment."""
+
+    def test_lists_icons_under_prefix(self) -> None:
+        """GIVEN two icons WHEN listed THEN src, sizes and type of each."""
+        from assets.generate.favicon import webmanifest_icons
+
+        data = webmanifest_icons(
+            [{"name": "a.png", "size": 192}, {"name": "b.png", "size": 512}], "/img/"
+        )
+
+        assert json.loads(data) == {
+            "icons": [
+                {"src": "/img/a.png", "sizes": "192x192", "type": "image/png"},
+                {"src": "/img/b.png", "sizes": "512x512", "type": "image/png"},
+            ]
+        }
+        assert data.endswith(b"}\n")
+
+
+class TestFaviconBundle:
+    """Level 1: Verify the bundle in the build graph."""
+
+    def test_bundle_built_from_one_parse(self, tmp_path: Path) -> None:
+        """GIVEN a bundle WHEN built THEN every file written, source parsed once."""
+        from assets.generate.generate_logos import (
+            build_asset_graph,
+            check_assets,
+            is_file_node,
+        )
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.writeset import WriteSet
+
+        assets_dir = make_assets(tmp_path)
+        writes = WriteSet()
+        graph = build_asset_graph(
+            {},
+            assets_dir,
+            tmp_path,
+            BuildManifest(tmp_path / "lock.yaml", assets_dir),
+            writes,
+            favicon_bundle=BUNDLE,
+        )
+        run = graph.run([name for name in graph.nodes if is_file_node(name)])
+        writes.commit(sync=False)
+
+        favicon_dir = assets_dir / "favicon"
+        images = read_ico((favicon_dir / "favicon.ico").read_bytes())
+        assert [(width, height) for width, height, _ in images] == [(16, 16), (32, 32)]
+        manifest = json.loads((favicon_dir / "site.webmanifest").read_text())
+        assert [icon["src"] for icon in manifest["icons"]] == ["/static/icon-48.png"]
+        # The 32px PNG is rendered once, for both the ICO and favicon-32x32.png
+        assert images[1][2] == (favicon_dir / "favicon-32x32.png").read_bytes()
+        assert run.evaluated.count(f"scene:{BUNDLE['source']}") == 1
+        _, drift = check_assets({}, assets_dir, tmp_path, favicon_bundle=BUNDLE)
+        assert drift == []
+
+    def test_bundle_file_deployable(self, tmp_path: Path) -> None:
+        """GIVEN a mapping of a bundle file WHEN built THEN it is deployed."""
+        from assets.generate.generate_logos import build_asset_graph
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.writeset import WriteSet
+
+        assets_dir = make_assets(tmp_path)
+        mappings = {"favicon": [{"source": "favicon.ico", "dest": "site/favicon.ico"}]}
+        writes = WriteSet()
+        graph = build_asset_graph(
+            mappings,
+            assets_dir,
+            tmp_path,
+            BuildManifest(tmp_path / "lock.yaml", assets_dir),
+            writes,
+            favicon_bundle=BUNDLE,
+        )
+        graph.run(["site/favicon.ico"])
+        writes.commit(sync=False)
+
+        assert (tmp_path / "site" / "favicon.ico").read_bytes() == (
+            assets_dir / "favicon" / "favicon.ico"
+        ).read_bytes()
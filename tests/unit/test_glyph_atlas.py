@@ -0,0 +1,121 @@
+"""
+Level 1 Unit Tests: Glyph atlas and text layout.
+
+Tests verify that:
+- Glyphs are placed at pen positions advancing by each glyph's advance width
+- Repeated characters reuse one outline and get numbered path names
+- Blank glyphs advance the pen without producing a path
+- Variants replace the outline of single occurrences
+- Unknown characters raise UnknownGlyphError
+- The wordmark text is composed from the atlas, each glyph where it is drawn
+"""
+
+import pytest
+
+# Constants
+BOX_GLYPHS = {
+    "o": {"advance": 10.0, "d": "M 1 0 L 9 0 L 9 -8 L 1 -8 Z"},
+    "i": {"advance": 4.0, "d": "M 1 0 L 3 0 L 3 -8 L 1 -8 Z"},
+    " ": {"advance": 5.0, "d": ""},
+}
+ORIGIN = (100.0, 50.0)
+# First point of the wordmark's second "p" and "t", as drawn
+DRAWN_STARTS = {"p2": (178.3, 27.8), "t2": (193.4, 37.7)}
+
+
+class TestLayout:
+    """Level 1: Verify glyphs are placed by their advance widths."""
+
+    def test_pens_advance_by_glyph_width(self) -> None:
+        """GIVEN "oio" WHEN laid out THEN each glyph starts at the previous advance."""
+        from assets.generate.glyphs import GlyphAtlas
+
+        batch = GlyphAtlas.from_data(BOX_GLYPHS).layout("oio", ORIGIN)
+
+        lefts = [path.coords[0] for path in batch.to_paths().values()]
+        assert lefts == [101.0, 111.0, 115.0]
+        assert batch.points[:, 1].max() == ORIGIN[1]
+
+    def test_repeated_characters_are_numbered(self) -> None:
+        """GIVEN "oio" WHEN laid out THEN paths are named o, i, o2."""
+        from assets.generate.glyphs import GlyphAtlas
+
+        batch = GlyphAtlas.from_data(BOX_GLYPHS).layout("oio")
+
+        assert batch.names == ("o", "i", "o2")
+
+    def test_blank_glyph_advances_without_path(self) -> None:
+        """GIVEN "o o" WHEN laid out THEN two paths, the second after the space."""
+        from assets.generate.glyphs import GlyphAtlas
+
+        atlas = GlyphAtlas.from_data(BOX_GLYPHS)
+        batch = atlas.layout("o o")
+
+        assert batch.names == ("o", "o2")
+        assert batch.path(1).coords[0] == 16.0
+        assert atlas.width("o o") == 25.0
+
+    def test_variant_replaces_one_occurrence(self) -> None:
+        """GIVEN a variant for o2 WHEN "oio" laid out THEN only o2 is replaced."""
+        from assets.generate.glyphs import Glyph, GlyphAtlas
+
+        variant = Glyph.from_data(BOX_GLYPHS["i"])
+
+        batch = GlyphAtlas.from_data(BOX_GLYPHS).layout("oio", variants={"o2": variant})
+
+        assert [path.coords[0] for path in batch.to_paths().values()] == [1, 11, 15]
+        assert batch.path(2).coords[2] == 17.0
+
+    def test_unknown_variant_raises(self) -> None:
+        """GIVEN a variant naming no glyph of the text WHEN laid out THEN ValueError."""
+        from assets.generate.glyphs import Glyph, GlyphAtlas
+
+        variant = Glyph.from_data(BOX_GLYPHS["i"])
+
+        with pytest.raises(ValueError, match="o3"):
+            GlyphAtlas.from_data(BOX_GLYPHS).layout("oio", variants={"o3": variant})
+
+    def test_unknown_character_raises(self) -> None:
+        """GIVEN text with a character not in the atlas WHEN laid out THEN error."""
+        from assets.generate.glyphs import GlyphAtlas, UnknownGlyphError
+
+        with pytest.raises(UnknownGlyphError, match="'x'"):
+            GlyphAtlas.from_data(BOX_GLYPHS).layout("oxo")
+
+    def test_multi_character_key_rejected(self) -> None:
+        """GIVEN a glyph keyed by two characters WHEN parsed THEN ValueError."""
+        from assets.generate.glyphs import GlyphAtlas
+
+        with pytest.raises(ValueError, match="single characters"):
+            GlyphAtlas.from_data({"oo": BOX_GLYPHS["o"]})
+
+
+class TestWordmarkText:
+    """Level 1: Verify the wordmark text is set from GLYPHS."""
+
+    def test_variants_keep_drawn_positions(self) -> None:
+        """GIVEN the wordmark WHEN laid out THEN p2 and t2 start where drawn."""
+        from assets.generate.generate_logos import get_geometry
+
+        geometry = get_geometry()
+
+        for name, start in DRAWN_STARTS.items():
+            coords = geometry.path(geometry.names.index(name)).coords
+            assert tuple(coords[:2]) == pytest.approx(start)
+
+    def test_text_names_split_accent_from_text(self) -> None:
+        """GIVEN WORDMARK_TEXT WHEN named THEN "agent" and "prompt" glyphs."""
+        from assets.generate.generate_logos import wordmark_text_names
+
+        accent, text = wordmark_text_names()
+
+        assert accent == ["a", "g", "e", "n", "t"]
+        assert text == ["p", "r", "o", "m", "p2", "t2"]
+
+    def test_layout_text_sets_any_string(self) -> None:
+        """GIVEN a sub-brand name WHEN set THEN one path per non-blank glyph."""
+        from assets.generate.generate_logos import layout_text
+
+        paths = layout_text("agent tempo")
+
+        assert list(paths) == ["a", "g", "e", "n", "t", "t2", "e2", "m", "p", "o"]
@@ -0,0 +1,138 @@
+"""
+Level 1 Unit Tests: Cold start cost of the logo generator.
+
+Tests verify that:
+- Importing the generator does not import heavy optional modules
+- The import stays within a time budget measured with `-X importtime`
+- A build with nothing to do loads no heavy modules and stays within budget
+- Parsed YAML is cached by content hash and reused without PyYAML
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Constants
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+MODULE = "assets.generate.generate_logos"
+# Loaded only by the stages that need them
+HEAVY_MODULES = ["numpy", "yaml", "svgpathtools", "concurrent.futures", "cProfile"]
+# Generous for slow CI machines; importing NumPy alone exceeds it
+IMPORT_BUDGET_US = 120_000
+ATTEMPTS = 3
+# Same margin, for main() with every output up to date
+NOOP_BUILD_BUDGET_US = 150_000
+NOOP_BUILD_SCRIPT = """
+import sys, time
+from assets.generate.generate_logos import main
+start = time.perf_counter()
+main([])
+elapsed = round((time.perf_counter() - start) * 1e6)
+print(elapsed, *(m for m in HEAVY_MODULES if m in sys.modules))
+"""
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module `module` loads."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def noop_build(root: Path) -> tuple[int, list[str]]:
+    """Microseconds main() takes in root, and the heavy modules it loaded."""
+    script = f"HEAVY_MODULES = {HEAVY_MODULES!r}\n{NOOP_BUILD_SCRIPT}"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=root,
+        env={**os.environ, "LOGO_CACHE_DIR": str(root / ".cache")},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, *loaded = result.stdout.splitlines()[-1].split()
+    return int(elapsed), loaded
+
+
+class TestImportTime:
+    """Level 1: Verify lazy imports and the import-time budget."""
+
+    def test_heavy_modules_are_not_imported(self) -> None:
+        """GIVEN a fresh interpreter WHEN the generator is imported THEN no heavy modules load."""
+        loaded = import_times(MODULE)
+
+        assert MODULE in loaded
+        assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+    def test_import_within_budget(self) -> None:
+        """GIVEN a fresh interpreter WHEN the generator is imported THEN it is within budget."""
+        best = min(import_times(MODULE)[MODULE] for _ in range(ATTEMPTS))
+
+        assert best < IMPORT_BUDGET_US
+
+
+class TestYamlCache:
+    """Level 1: Verify the parsed-YAML cache."""
+
+    def test_cached_parse_is_reused_until_content_changes(self, tmp_path: Path) -> None:
+        """GIVEN a cached parse WHEN the file is unchanged THEN the cache is used."""
+        from assets.generate.yamlcache import load_yaml
+
+        path = tmp_path / "mappings.yaml"
+        cache_dir = tmp_path / "cache"
+        path.write_text("wordmark:\n  - source: a.svg\n    dest: site/a.svg\n")
+        first = load_yaml(path, cache_dir)
+        entry = next((cache_dir / "yaml").iterdir())
+        entry.write_text(entry.read_text().replace("site/a.svg", "cached"))
+
+        assert load_yaml(path, cache_dir)["wordmark"][0]["dest"] == "cached"
+
+        path.write_text("wordmark: []\n")
+        assert load_yaml(path, cache_dir) == {"wordmark": []}
+        assert first["wordmark"][0]["dest"] == "site/a.svg"
+
+    def test_invalid_mappings_are_not_cached(self, tmp_path: Path) -> None:
+        """GIVEN malformed mappings WHEN loaded THEN ValueError and no cache entry."""
+        from assets.generate.deploy import load_mappings
+
+        path = tmp_path / "mappings.yaml"
+        cache_dir = tmp_path / "cache"
+        path.write_text("wordmark:\n  - source: a.svg\n")
+
+        with pytest.raises(ValueError):
+            load_mappings(path, cache_dir)
+        assert not (cache_dir / "yaml").exists()
+
+
+class TestNoOpBuild:
+    """Level 1: Verify a build with nothing to do stays cheap."""
+
+    def test_noop_build_within_budget(self, tmp_path: Path) -> None:
+        """GIVEN an up-to-date copy of the assets WHEN built again THEN no heavy modules and within budget."""
+        shutil.copytree(
+            PROJECT_ROOT / "assets",
+            tmp_path / "assets",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        noop_build(tmp_path)  # deploys into tmp_path and fills the caches
+
+        runs = [noop_build(tmp_path) for _ in range(ATTEMPTS)]
+
+        assert [loaded for _, loaded in runs] == [[]] * ATTEMPTS
+        assert min(elapsed for elapsed, _ in runs) < NOOP_BUILD_BUDGET_US
@@ -0,0 +1,53 @@
+"""
+Level 1 Unit Tests: Parallel wordmark generation over shared geometry.
+
+Tests verify that:
+- Geometry attached from shared memory equals the original batch
+- Generating with a process pool is byte-identical to serial generation
+"""
+
+import numpy as np
+
+# Constants
+VARIANTS = ["dark", "light", "white", "adaptive"]
+TARGETS = [(variant, tight) for variant in VARIANTS for tight in (False, True)]
+
+
+class TestSharedGeometry:
+    """Level 1: Verify the shared memory round trip."""
+
+    def test_attached_geometry_matches_original(self) -> None:
+        """GIVEN the generator geometry WHEN shared and attached THEN equal."""
+        from assets.generate.generate_logos import get_geometry
+        from assets.generate.parallel import SharedGeometry, attach_geometry
+
+        batch = get_geometry()
+
+        with SharedGeometry(batch) as spec:
+            attached = attach_geometry(spec)
+            assert attached.names == batch.names
+            assert np.array_equal(attached.points, batch.points)
+            assert attached.to_d() == batch.to_d()
+
+    def test_attached_points_are_read_only(self) -> None:
+        """GIVEN attached geometry WHEN inspected THEN the view is not writeable."""
+        from assets.generate.generate_logos import get_geometry
+        from assets.generate.parallel import SharedGeometry, attach_geometry
+
+        with SharedGeometry(get_geometry()) as spec:
+            attached = attach_geometry(spec)
+            assert not attached.points.flags.writeable
+
+
+class TestParallelBuild:
+    """Level 1: Verify process pool output equals serial output."""
+
+    def test_parallel_output_is_byte_identical(self) -> None:
+        """GIVEN all wordmark targets WHEN built with 2 jobs THEN same as serial."""
+        from assets.generate.generate_logos import build_wordmarks
+
+        serial = build_wordmarks(TARGETS, jobs=1)
+
+        parallel = build_wordmarks(TARGETS, jobs=2)
+
+        assert parallel == serial
@@ -0,0 +1,116 @@
+"""
+Level 1 Unit Tests: Array-backed PathData parser and serializer.
+
+Tests verify that PathData:
+- Normalizes H/V and relative commands to absolute coordinates
+- Serializes exactly like svgpathtools' Path.d() for generator paths
+- Rejects commands outside the M/L/H/V/Q/C/Z grammar
+"""
+
+import pytest
+from svgpathtools import parse_path  # type: ignore[import-untyped]
+
+# Constants
+SQUARE_PATH = "M 0 0 L 10 0 L 10 10 L 0 10 Z"
+HV_PATH = "M 1 2H 5V 7Z"
+RELATIVE_PATH = "m 1 2 l 3 4 h 5 v 6 z"
+IMPLICIT_LINETO_PATH = "M 0 0 10 0 10 10"
+COMPACT_NUMBERS_PATH = "M0,0L1-2 .5.5Z"
+ARC_PATH = "M 0 0 A 5 5 0 0 1 10 0"
+TIGHT_OFFSET = (3.5999999999999996, -5.0)
+
+
+class TestParseNormalizesCommands:
+    """Level 1: Verify parsing produces absolute M/L/Q/C/Z commands."""
+
+    def test_hv_become_lines_with_both_coordinates(self) -> None:
+        """GIVEN a path with H and V WHEN parsed THEN both become L with x,y."""
+        from assets.generate.pathdata import PathData
+
+        path = PathData.parse(HV_PATH)
+
+        assert path.commands == b"MLLZ"
+        assert list(path.coords) == [1.0, 2.0, 5.0, 2.0, 5.0, 7.0]
+
+    def test_relative_commands_become_absolute(self) -> None:
+        """GIVEN relative commands WHEN parsed THEN coordinates are absolute."""
+        from assets.generate.pathdata import PathData
+
+        path = PathData.parse(RELATIVE_PATH)
+
+        assert path.commands == b"MLLLZ"
+        assert list(path.coords) == [1.0, 2.0, 4.0, 6.0, 9.0, 6.0, 9.0, 12.0]
+
+    def test_implicit_pairs_after_moveto_are_linetos(self) -> None:
+        """GIVEN extra pairs after M WHEN parsed THEN they are implicit L."""
+        from assets.generate.pathdata import PathData
+
+        path = PathData.parse(IMPLICIT_LINETO_PATH)
+
+        assert path.commands == b"MLL"
+
+    def test_compact_number_forms_are_split(self) -> None:
+        """GIVEN numbers without separators WHEN parsed THEN each is read."""
+        from assets.generate.pathdata import PathData
+
+        path = PathData.parse(COMPACT_NUMBERS_PATH)
+
+        assert list(path.coords) == [0.0, 0.0, 1.0, -2.0, 0.5, 0.5]
+
+    def test_unsupported_command_raises(self) -> None:
+        """GIVEN an arc command WHEN parsed THEN UnsupportedPathCommandError."""
+        from assets.generate.pathdata import PathData, UnsupportedPathCommandError
+
+        with pytest.raises(UnsupportedPathCommandError):
+            PathData.parse(ARC_PATH)
+
+    def test_wrong_argument_count_raises(self) -> None:
+        """GIVEN a command missing arguments WHEN parsed THEN ValueError."""
+        from assets.generate.pathdata import PathData
+
+        with pytest.raises(ValueError):
+            PathData.parse("M 0 0 Q 1 2 3")
+
+
+class TestSerializerMatchesSvgpathtools:
+    """Level 1: Verify to_d() output is byte-identical to svgpathtools."""
+
+    @pytest.mark.parametrize("offset", [(0.0, 0.0), TIGHT_OFFSET])
+    def test_generator_paths_match(self, offset: tuple[float, float]) -> None:
+        """
+        GIVEN every icon and text path in the generator
+        WHEN translated by PathData and by svgpathtools
+        THEN the serialized strings are identical.
+        """
+        from assets.generate.generate_logos import wordmark_paths
+        from assets.generate.pathdata import PathData
+
+        for d in wordmark_paths().values():
+            expected = parse_path(d)
+            if offset != (0.0, 0.0):
+                expected = expected.translated(complex(*offset))
+
+            result = PathData.parse(d).transformed(translate=offset).to_d()
+
+            assert result == expected.d()
+
+    def test_close_to_distinct_start_emits_line(self) -> None:
+        """GIVEN Z away from the subpath start WHEN serialized THEN L to start."""
+        from assets.generate.pathdata import PathData
+
+        result = PathData.parse(SQUARE_PATH).to_d()
+
+        assert result == parse_path(SQUARE_PATH).d()
+        assert result.endswith("L 0.0,0.0")
+
+
+class TestTransformPathFallback:
+    """Level 1: Verify transform_path handles paths outside the grammar."""
+
+    def test_arc_path_falls_back_to_svgpathtools(self) -> None:
+        """GIVEN an arc path WHEN transformed THEN the arc is preserved."""
+        from assets.generate.generate_logos import transform_path
+
+        result = transform_path(ARC_PATH, translate=(5.0, 5.0))
+
+        assert "A" in result
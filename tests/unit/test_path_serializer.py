@@ -0,0 +1,110 @@
+"""
+Level 1 Unit Tests: Fixed-precision path serializer.
+
+Tests verify that PathData.to_d(precision):
+- Writes the shortest form: relative or absolute, H/V, implicit commands
+- Round-trips every wordmark path to its rounded coordinates
+- Never writes "-0" or leading zeros
+- Is used by transform_path() and keeps the wordmarks within a byte budget
+"""
+
+import pytest
+
+# Constants
+HV_PATH = "M 10 10 L 10.5 10 L 10.5 10.25 Z"
+# Generated dark tight wordmark at precision 2 is 4,412 bytes (14,720 before)
+TIGHT_WORDMARK_BUDGET = 4600
+
+
+def rounded(d: str, precision: int) -> list[float]:
+    """
+    Coordinates of d rounded to precision decimal places.
+
+    Goes through the svgpathtools form, where closepath is always a line back
+    to the start, so a line the compact form leaves to Z still counts.
+    """
+    from array import array
+
+    from assets.generate.pathdata import PathData
+
+    path = PathData.parse(d)
+    path.coords = array("d", (round(v, precision) for v in path.coords))
+    return list(PathData.parse(path.to_d()).coords)
+
+
+class TestCompactForm:
+    """Level 1: Verify the shortest-form choices."""
+
+    def test_axis_lines_and_closepath(self) -> None:
+        """GIVEN horizontal and vertical lines WHEN serialized THEN h/v and Z."""
+        from assets.generate.pathdata import PathData
+
+        assert PathData.parse(HV_PATH).to_d(2) == "M10 10h.5v.25Z"
+
+    def test_implicit_commands_and_separators(self) -> None:
+        """GIVEN repeated commands WHEN serialized THEN letters and spaces dropped."""
+        from assets.generate.pathdata import PathData
+
+        d = PathData.parse("M 0 0 L 1 1 L 2 3 L -1 -0.5 Z M 5 5 Q 6 6 7 5").to_d(2)
+
+        assert d == "M0 0 1 1 2 3-1-.5ZM5 5Q6 6 7 5"
+
+    def test_line_back_to_start_left_to_closepath(self) -> None:
+        """GIVEN an explicit line to the start before Z WHEN serialized THEN dropped."""
+        from assets.generate.pathdata import PathData
+
+        d = PathData.parse("M 0 0 L 4 0 L 4 4 L 0 0 Z").to_d(0)
+
+        assert d == "M0 0H4V4Z"
+
+    def test_no_negative_zero(self) -> None:
+        """GIVEN coordinates rounding to zero WHEN serialized THEN no "-0"."""
+        from assets.generate.pathdata import PathData
+
+        d = PathData.parse("M -0.001 0.004 L 3 -0.0049").to_d(2)
+
+        assert "-0" not in d
+        assert d == "M0 0H3"
+
+    def test_negative_precision_rejected(self) -> None:
+        """GIVEN precision -1 WHEN serialized THEN ValueError."""
+        from assets.generate.pathdata import PathData
+
+        with pytest.raises(ValueError, match="Precision"):
+            PathData.parse(HV_PATH).to_d(-1)
+
+
+class TestRoundTrip:
+    """Level 1: Verify compact output describes the same geometry."""
+
+    @pytest.mark.parametrize("precision", [0, 1, 2, 3])
+    def test_wordmark_paths_round_trip(self, precision: int) -> None:
+        """GIVEN every wordmark path WHEN serialized and parsed THEN rounded coords."""
+        from assets.generate.generate_logos import wordmark_paths
+        from assets.generate.pathdata import PathData
+
+        for d in wordmark_paths().values():
+            compact = PathData.parse(d).to_d(precision)
+
+            assert rounded(compact, precision) == rounded(d, precision)
+            assert PathData.parse(compact).to_d(precision) == compact
+
+
+class TestSerializerInGenerator:
+    """Level 1: Verify the generator uses the compact form."""
+
+    def test_transform_path_precision(self) -> None:
+        """GIVEN a precision WHEN a path is transformed THEN compact output."""
+        from assets.generate.generate_logos import transform_path
+
+        d = transform_path(HV_PATH, translate=(0.25, -0.5), precision=2)
+
+        assert d == "M10.25 9.5h.5v.25Z"
+
+    def test_tight_wordmark_within_budget(self) -> None:
+        """GIVEN the dark tight wordmark WHEN generated THEN within its byte budget."""
+        from assets.generate.generate_logos import generate_wordmark
+
+        svg = generate_wordmark("dark", tight=True)
+
+        assert len(svg.encode()) <= TIGHT_WORDMARK_BUDGET
@@ -0,0 +1,171 @@
+"""
+Level 1 Unit Tests: Tolerance-bounded path simplification.
+
+Tests verify that:
+- Repeated points and collinear lines are merged away
+- Curves within tolerance of their chord become lines
+- A quadratic split in two is refitted as one
+- Simplified outlines stay within tolerance of the originals
+- Favicon renders use a simplified scene only up to max_size, and report it
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Constants
+ICON_SOURCE = Path(__file__).parents[2] / "assets" / "icon" / "icon-rounded-tight.svg"
+# M 0 0 Q 0 10 10 20 split at t = 0.5 (de Casteljau)
+SPLIT_QUAD = "M 0 0 Q 0 5 2.5 10 Q 5 15 10 20"
+
+
+def outline(path, samples: int = 32):
+    """Points along every segment of a PathData, as an (n, 2) array."""
+    import numpy as np
+
+    from assets.generate.pathdata import COORDS_PER_COMMAND
+
+    points, pen, start, pos = [], (0.0, 0.0), (0.0, 0.0), 0
+    t = np.linspace(0.0, 1.0, samples + 1)[:, None]
+    for cmd in path.commands:
+        n = COORDS_PER_COMMAND[cmd]
+        values = list(path.coords[pos : pos + n])
+        pos += n
+        control = [pen, *zip(values[0::2], values[1::2], strict=True)]
+        if cmd == ord("M"):
+            pen = start = control[1]
+            continue
+        if cmd == ord("Z"):
+            control = [pen, start]
+        degree = len(control) - 1
+        weights = [
+            [1 - t, t],
+            [(1 - t) ** 2, 2 * (1 - t) * t, t**2],
+            [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t**2, t**3],
+        ][degree - 1]
+        points.append(sum(w * np.asarray(p) for w, p in zip(weights, control)))
+        pen = control[-1]
+    return np.concatenate(points)
+
+
+def max_distance(points, polyline) -> float:
+    """Largest distance from one of points to the polyline through polyline."""
+    import numpy as np
+
+    starts, direction = polyline[:-1], np.diff(polyline, axis=0)
+    length_sq = np.maximum((direction**2).sum(axis=1), 1e-12)
+    offset = points[:, None] - starts[None]
+    t = np.clip((offset * direction).sum(axis=2) / length_sq, 0.0, 1.0)
+    gap = offset - t[..., None] * direction
+    return float(np.sqrt((gap**2).sum(axis=2)).min(axis=1).max())
+
+
+class TestSimplifyPath:
+    """Level 1: Verify each simplification."""
+
+    def test_repeats_and_collinear_lines_merged(self) -> None:
+        """GIVEN a repeated point and a collinear run WHEN simplified THEN 3 lines."""
+        from assets.generate.pathdata import PathData
+        from assets.generate.simplify import simplify_path
+
+        path = PathData.parse("M 0 0 L 0 0 L 1 0 L 2 0.001 L 3 0 L 3 3 Z")
+
+        simplified = simplify_path(path, 0.01)
+
+        assert simplified.to_d(2) == "M0 0H3V3Z"
+
+    def test_flat_quadratic_becomes_line(self) -> None:
+        """GIVEN a quadratic 0.01 from its chord WHEN simplified THEN a line."""
+        from assets.generate.pathdata import PathData
+        from assets.generate.simplify import simplify_path
+
+        path = PathData.parse("M 0 0 Q 5 0.02 10 0")
+
+        assert simplify_path(path, 0.05).commands == b"ML"
+        assert simplify_path(path, 0.001).commands == b"MQ"
+
+    def test_split_quadratic_refitted(self) -> None:
+        """GIVEN one quadratic split in two WHEN simplified THEN the original."""
+        from assets.generate.pathdata import PathData
+        from assets.generate.simplify import simplify_path
+
+        simplified = simplify_path(PathData.parse(SPLIT_QUAD), 0.01)
+
+        assert simplified.to_d(6) == "M0 0Q0 10 10 20"
+
+    def test_negative_tolerance_rejected(self) -> None:
+        """GIVEN tolerance -1 WHEN simplified THEN ValueError."""
+        from assets.generate.pathdata import PathData
+        from assets.generate.simplify import simplify_path
+
+        with pytest.raises(ValueError, match="Tolerance"):
+            simplify_path(PathData.parse(SPLIT_QUAD), -1)
+
+    @pytest.mark.parametrize("tolerance", [0.05, 0.25])
+    def test_wordmark_outlines_within_tolerance(self, tolerance: float) -> None:
+        """GIVEN every wordmark path WHEN simplified THEN outlines within tolerance."""
+        from assets.generate.generate_logos import get_geometry
+        from assets.generate.simplify import simplify_path
+
+        for path in get_geometry().to_paths().values():
+            simplified = simplify_path(path, tolerance)
+
+            before, after = outline(path, 8), outline(simplified, 8)
+
+            # Allowing for the polylines' distance from the curves they sample
+            assert max_distance(after, before) <= tolerance + 0.01
+            assert max_distance(before, after) <= tolerance + 0.01
+
+
+class TestSimplifiedGeneration:
+    """Level 1: Verify selective use in the generator."""
+
+    def test_wordmark_geometry_simplified_when_configured(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GIVEN a wordmark tolerance WHEN geometry is built THEN fewer nodes."""
+        from assets.generate import generate_logos
+
+        exact = generate_logos.get_geometry()
+        monkeypatch.setitem(generate_logos.CONFIG["svg"], "simplify_tolerance", 0.1)
+        monkeypatch.setattr(generate_logos, "_geometry", None)
+        monkeypatch.setattr(generate_logos, "SIMPLIFY_STATS", {})
+
+        simplified = generate_logos.get_geometry()
+
+        stats = generate_logos.SIMPLIFY_STATS["wordmark"]
+        assert stats.nodes_after < stats.nodes_before
+        assert stats.bytes_after < stats.bytes_before
+        assert simplified.names == exact.names
+
+    def test_favicon_simplified_up_to_max_size(self, tmp_path: Path) -> None:
+        """GIVEN a bundle simplifying up to 32px WHEN built THEN only small renders."""
+        from assets.generate.generate_logos import SIMPLIFY_STATS, build_asset_graph
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.writeset import WriteSet
+
+        assets_dir = tmp_path / "assets"
+        (assets_dir / "icon").mkdir(parents=True)
+        (assets_dir / "icon" / ICON_SOURCE.name).write_bytes(ICON_SOURCE.read_bytes())
+        bundle = {
+            "source": "icon/icon-rounded-tight.svg",
+            "ico": {"name": "favicon.ico", "sizes": [16, 32]},
+            "png": [{"name": "icon-48.png", "size": 48}],
+            "webmanifest": {"name": "site.webmanifest", "url_prefix": "/"},
+            "simplify": {"tolerance": 0.2, "max_size": 32},
+        }
+        graph = build_asset_graph(
+            {},
+            assets_dir,
+            tmp_path,
+            BuildManifest(tmp_path / "lock.yaml", assets_dir),
+            WriteSet(),
+            favicon_bundle=bundle,
+        )
+
+        run = graph.run(["ico:favicon.ico", f"render:{bundle['source']}@48x48"])
+
+        assert f"render:{bundle['source']}@16x16~0.2" in run.evaluated
+        assert f"render:{bundle['source']}@48x48~0.2" not in graph
+        stats = SIMPLIFY_STATS[f"{bundle['source']}~0.2"]
+        assert stats.nodes_after < stats.nodes_before
@@ -0,0 +1,238 @@
+"""
+Level 1 Unit Tests: PNG decoding and lossless optimization.
+
+Tests verify that:
+- decode_png() inverts every filter, palettes and sub-byte bit depths
+- Opaque, gray and few-color images get exact smaller encodings
+- Color profiles are kept and stop gray conversion; metadata is dropped
+- Optimizing never grows a file and is idempotent
+- optimize_files() skips content recorded as optimal
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Constants
+SIZE = (13, 11)
+
+
+def pixels_of(channels: int, colors: int | None = None, seed: int = 3):
+    """Random (13, 11, channels) image, drawn from colors colors if given."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    if colors is None:
+        return rng.integers(0, 256, (*SIZE, channels), dtype=np.uint8)
+    palette = rng.integers(0, 256, (colors, channels), dtype=np.uint8)
+    return palette[rng.integers(0, colors, SIZE)]
+
+
+def with_chunks(png: bytes, *chunks: tuple[bytes, bytes]) -> bytes:
+    """png with chunks inserted right after IHDR."""
+    from assets.generate.png import png_chunk
+
+    ihdr_end = 8 + 12 + 13
+    extra = b"".join(png_chunk(kind, body) for kind, body in chunks)
+    return png[:ihdr_end] + extra + png[ihdr_end:]
+
+
+def header(png: bytes) -> tuple[int, int]:
+    """(bit depth, color type) from IHDR."""
+    return png[24], png[25]
+
+
+class TestDecodePng:
+    """Level 1: Verify the decoder."""
+
+    @pytest.mark.parametrize("filter_type", [0, 1, 2, 3, 4])
+    @pytest.mark.parametrize("channels", [1, 2, 3, 4])
+    def test_inverts_encoder(self, filter_type: int, channels: int) -> None:
+        """GIVEN an encoded image WHEN decoded THEN the same pixels."""
+        from assets.generate.png import decode_png, encode_png
+
+        pixels = pixels_of(channels)
+
+        decoded = decode_png(encode_png(pixels, filter_type=filter_type))
+
+        assert (decoded.pixels == pixels).all()
+
+    def test_interlaced_unsupported(self) -> None:
+        """GIVEN an interlaced PNG WHEN decoded THEN UnsupportedPngError."""
+        import struct
+        import zlib
+
+        from assets.generate.png import UnsupportedPngError, decode_png, encode_png
+
+        png = bytearray(encode_png(pixels_of(3)))
+        png[28] = 1  # interlace method; the CRC is fixed below
+        png[29:33] = struct.pack(">I", zlib.crc32(bytes(png[12:29])))
+
+        with pytest.raises(UnsupportedPngError):
+            decode_png(bytes(png))
+
+    def test_bad_crc_rejected(self) -> None:
+        """GIVEN a corrupted chunk WHEN decoded THEN ValueError."""
+        from assets.generate.png import decode_png, encode_png
+
+        png = bytearray(encode_png(pixels_of(3)))
+        png[40] ^= 0xFF
+
+        with pytest.raises(ValueError, match="CRC"):
+            decode_png(bytes(png))
+
+
+class TestEncodeOptimized:
+    """Level 1: Verify exact color reductions."""
+
+    @pytest.mark.parametrize(
+        ("channels", "colors", "expected"),
+        [
+            (4, 2, (1, 3)),  # two colors: 1-bit palette
+            (3, 4, (2, 3)),
+            (4, 16, (4, 3)),
+            (3, 40, (8, 3)),
+        ],
+    )
+    def test_palette_bit_depth(
+        self, channels: int, colors: int, expected: tuple[int, int]
+    ) -> None:
+        """GIVEN an image of few colors WHEN optimized THEN smallest palette depth."""
+        from assets.generate.png import decode_png
+        from assets.generate.pngopt import encode_optimized
+
+        pixels = pixels_of(channels, colors)
+
+        png = encode_optimized(pixels)
+
+        assert header(png) == expected
+        assert (decode_png(png).pixels == pixels).all()
+
+    def test_opaque_alpha_dropped(self) -> None:
+        """GIVEN RGBA with alpha 255 everywhere WHEN optimized THEN RGB."""
+        import numpy as np
+
+        from assets.generate.png import decode_png
+        from assets.generate.pngopt import encode_optimized
+
+        rgb = pixels_of(3)
+        pixels = np.concatenate([rgb, np.full((*SIZE, 1), 255, np.uint8)], axis=2)
+
+        png = encode_optimized(pixels)
+
+        assert header(png) == (8, 2)
+        assert (decode_png(png).pixels == rgb).all()
+
+    def test_equal_samples_become_gray(self) -> None:
+        """GIVEN RGB with R = G = B WHEN optimized THEN grayscale."""
+        from assets.generate.png import decode_png
+        from assets.generate.pngopt import encode_optimized
+
+        gray = pixels_of(1)
+
+        png = encode_optimized(gray.repeat(3, axis=2))
+
+        assert header(png) == (8, 0)
+        assert (decode_png(png).pixels == gray).all()
+
+    def test_profile_blocks_gray_and_metadata_dropped(self) -> None:
+        """GIVEN gray RGB with iCCP and tEXt WHEN optimized THEN RGB, iCCP only."""
+        from assets.generate.png import decode_png, encode_png
+        from assets.generate.pngopt import optimize_png
+
+        png = with_chunks(
+            encode_png(pixels_of(1).repeat(3, axis=2)),
+            (b"iCCP", b"rgb\x00\x00" + b"x" * 64),
+            (b"tEXt", b"Comment\x00" + b"y" * 400),
+        )
+
+        optimized = optimize_png(png)
+
+        assert header(optimized) == (8, 2)
+        kinds = [kind for kind, _, _ in decode_png(optimized).chunks]
+        assert kinds == [b"iCCP"]
+
+
+class TestOptimizePng:
+    """Level 1: Verify whole-file optimization."""
+
+    def test_never_grows_and_is_idempotent(self) -> None:
+        """GIVEN noise WHEN optimized twice THEN no larger, second pass unchanged."""
+        from assets.generate.png import decode_png, encode_png
+        from assets.generate.pngopt import optimize_png
+
+        png = encode_png(pixels_of(4), level=1)
+
+        once = optimize_png(png)
+
+        assert len(once) <= len(png)
+        assert optimize_png(once) == once
+        assert (decode_png(once).pixels == pixels_of(4)).all()
+
+    def test_unsupported_returned_as_is(self) -> None:
+        """GIVEN a 16-bit PNG WHEN optimized THEN the same bytes."""
+        import struct
+        import zlib
+
+        from assets.generate.png import PNG_SIGNATURE, png_chunk
+        from assets.generate.pngopt import optimize_png
+
+        png = (
+            PNG_SIGNATURE
+            + png_chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 16, 0, 0, 0, 0))
+            + png_chunk(b"IDAT", zlib.compress(b"\x00\x12\x34"))
+            + png_chunk(b"IEND", b"")
+        )
+
+        assert optimize_png(png) == png
+
+
+class TestOptimizeFiles:
+    """Level 1: Verify the cached bulk optimizer."""
+
+    def test_second_run_skips_optimal_files(self, tmp_path: Path) -> None:
+        """GIVEN two PNGs WHEN optimized, written and re-run THEN all cached."""
+        from assets.generate.cache import TransformCache
+        from assets.generate.png import encode_png
+        from assets.generate.pngopt import optimize_files
+
+        paths = [tmp_path / "a.png", tmp_path / "b.png"]
+        paths[0].write_bytes(encode_png(pixels_of(3, colors=3), level=1))
+        paths[1].write_bytes(encode_png(pixels_of(4, seed=5), level=1))
+        cache = TransformCache(cache_dir=tmp_path / "cache")
+
+        first = optimize_files(paths, cache)
+        for result in first:
+            result.path.write_bytes(result.data)
+        second = optimize_files(paths, TransformCache(cache_dir=tmp_path / "cache"))
+
+        assert first[0].changed
+        assert not any(result.cached for result in first)
+        assert all(result.cached and not result.changed for result in second)
+
+    def test_process_pool_matches_in_process(self, tmp_path: Path) -> None:
+        """GIVEN PNGs WHEN optimized in 2 workers THEN same data as in-process."""
+        from assets.generate.cache import TransformCache
+        from assets.generate.png import encode_png
+        from assets.generate.pngopt import optimize_files
+
+        paths = []
+        for seed in range(3):
+            paths.append(tmp_path / f"{seed}.png")
+            paths[-1].write_bytes(encode_png(pixels_of(3, colors=5, seed=seed)))
+
+        pooled = optimize_files(paths, TransformCache(), jobs=2)
+        serial = optimize_files(paths, TransformCache(), jobs=1)
+
+        assert [r.data for r in pooled] == [r.data for r in serial]
+
+    def test_invalid_file_named(self, tmp_path: Path) -> None:
+        """GIVEN a file that is not a PNG WHEN optimized THEN ValueError naming it."""
+        from assets.generate.cache import TransformCache
+        from assets.generate.pngopt import optimize_files
+
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"GIF89a")
+
+        with pytest.raises(ValueError, match="broken.png"):
+            optimize_files([path], TransformCache())
@@ -0,0 +1,187 @@
+"""
+Level 1 Unit Tests: Precompressed .gz siblings of deployed SVGs.
+
+Tests verify that:
+- Compression is deterministic (no timestamp, maximum level) and lossless
+- A sibling with a damaged body is not taken as up to date
+- Siblings compressed from unchanged content are skipped
+- Files that gzip does not shrink get no sibling, and a stale one is deleted
+  (when a write set is given, only once it is committed)
+- Compressing in threads gives the same results as in one
+- Deploying with precompress writes siblings only for SVGs, and --check
+  reports a stale sibling
+"""
+
+import gzip
+from pathlib import Path
+
+# Constants
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg">' + b'<path d="M0 0H4V4Z"/>' * 40
+TINY_SVG = b"<svg/>"
+
+
+def write_files(tmp_path: Path, count: int) -> list[Path]:
+    """count distinct compressible SVGs in tmp_path."""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"logo-{i}.svg"
+        path.write_bytes(SVG + f"<!-- {i} -->".encode() + b"</svg>")
+        paths.append(path)
+    return paths
+
+
+class TestGzipCompress:
+    """Level 1: Verify the compressed bytes."""
+
+    def test_deterministic_and_lossless(self) -> None:
+        """GIVEN an SVG WHEN compressed twice THEN same bytes, mtime 0, round-trips."""
+        from assets.generate.deploy import gzip_compress
+
+        first, second = gzip_compress(SVG), gzip_compress(SVG)
+
+        assert first == second
+        assert first[4:8] == b"\0\0\0\0"  # MTIME
+        assert first[8] == 2  # XFL: maximum compression
+        assert gzip.decompress(first) == SVG
+
+    def test_compressed_from_reads_trailer(self) -> None:
+        """GIVEN a compressed copy WHEN compared THEN only its own source matches."""
+        from assets.generate.deploy import compressed_from, gzip_compress
+
+        compressed = gzip_compress(SVG)
+
+        assert compressed_from(compressed, SVG)
+        assert not compressed_from(compressed, SVG + b" ")
+        assert not compressed_from(gzip.compress(SVG, mtime=1), SVG)
+
+    def test_damaged_body_rejected(self) -> None:
+        """GIVEN a copy with its header and trailer intact WHEN compared THEN no match."""
+        from assets.generate.deploy import compressed_from, gzip_compress
+
+        compressed = bytearray(gzip_compress(SVG))
+        middle = len(compressed) // 2
+        compressed[middle] ^= 0xFF
+
+        assert not compressed_from(bytes(compressed), SVG)
+
+
+class TestPrecompressFiles:
+    """Level 1: Verify skipping, dropping and parallel compression."""
+
+    def test_unchanged_source_skipped(self, tmp_path: Path) -> None:
+        """GIVEN an up-to-date sibling WHEN precompressed again THEN unchanged."""
+        from assets.generate.deploy import (
+            METHOD_UNCHANGED,
+            METHOD_WRITE,
+            apply_precompressed,
+            precompress_files,
+        )
+
+        (path,) = write_files(tmp_path, 1)
+        first = precompress_files([path])
+        apply_precompressed(first)
+
+        second = precompress_files([path])
+        path.write_bytes(SVG + b"</svg>")
+        third = precompress_files([path])
+
+        assert [r.method for r in (*first, *second, *third)] == [
+            METHOD_WRITE,
+            METHOD_UNCHANGED,
+            METHOD_WRITE,
+        ]
+        # Results are only written by apply_precompressed()
+        assert gzip.decompress(first[0].sibling.read_bytes()) != SVG + b"</svg>"
+
+    def test_incompressible_file_dropped(self, tmp_path: Path) -> None:
+        """GIVEN a tiny SVG with a stale sibling WHEN precompressed THEN deleted."""
+        from assets.generate.deploy import (
+            METHOD_DROPPED,
+            apply_precompressed,
+            precompress_files,
+        )
+
+        path = tmp_path / "tiny.svg"
+        path.write_bytes(TINY_SVG)
+        sibling = tmp_path / "tiny.svg.gz"
+        sibling.write_bytes(b"stale")
+
+        results = precompress_files([path])
+        apply_precompressed(results)
+
+        assert results[0].method == METHOD_DROPPED
+        assert not sibling.exists()
+
+    def test_drop_staged_in_write_set(self, tmp_path: Path) -> None:
+        """GIVEN a stale sibling and a write set WHEN dropped THEN deleted on commit."""
+        from assets.generate.deploy import apply_precompressed, precompress_files
+        from assets.generate.writeset import WriteSet
+
+        path = tmp_path / "tiny.svg"
+        path.write_bytes(TINY_SVG)
+        sibling = tmp_path / "tiny.svg.gz"
+        sibling.write_bytes(b"stale")
+        writes = WriteSet()
+
+        apply_precompressed(precompress_files([path]), writes)
+
+        assert sibling.exists()
+        writes.commit(sync=False)
+        assert not sibling.exists()
+
+    def test_threads_match_serial(self, tmp_path: Path) -> None:
+        """GIVEN several files WHEN compressed in 4 threads THEN same as serial."""
+        from assets.generate.deploy import precompress_files
+
+        paths = write_files(tmp_path, 6)
+
+        assert precompress_files(paths, jobs=4) == precompress_files(paths)
+
+
+class TestDeployPrecompressed:
+    """Level 1: Verify siblings in deploys and --check."""
+
+    def test_deploy_writes_svg_siblings(self, tmp_path: Path) -> None:
+        """GIVEN an SVG and a PNG mapping WHEN deployed THEN only the SVG's .gz."""
+        from assets.generate.generate_logos import deploy_assets
+
+        assets_dir = tmp_path / "assets"
+        (assets_dir / "icon").mkdir(parents=True)
+        (assets_dir / "icon" / "logo.svg").write_bytes(SVG + b"</svg>")
+        (assets_dir / "icon" / "logo.png").write_bytes(SVG)
+        mappings = {
+            "icon": [
+                {"source": "logo.svg", "dest": "site/logo.svg"},
+                {"source": "logo.png", "dest": "site/logo.png"},
+            ]
+        }
+
+        deploy_assets(mappings, assets_dir, tmp_path, precompress=True)
+
+        assert gzip.decompress((tmp_path / "site" / "logo.svg.gz").read_bytes()) == (
+            SVG + b"</svg>"
+        )
+        assert not (tmp_path / "site" / "logo.png.gz").exists()
+
+    def test_check_reports_stale_sibling(self, tmp_path: Path) -> None:
+        """GIVEN a deployed SVG whose source changed WHEN checked THEN .gz drifts."""
+        from assets.generate.generate_logos import check_assets, deploy_assets
+
+        assets_dir = tmp_path / "assets"
+        (assets_dir / "icon").mkdir(parents=True)
+        source = assets_dir / "icon" / "logo.svg"
+        source.write_bytes(SVG + b"</svg>")
+        mappings = {"icon": [{"source": "logo.svg", "dest": "site/logo.svg"}]}
+        deploy_assets(mappings, assets_dir, tmp_path, precompress=True)
+        site = tmp_path / "site"
+
+        _, fresh = check_assets(mappings, assets_dir, tmp_path)
+        source.write_bytes(SVG + b"<!-- edited --></svg>")
+        deploy_assets(mappings, assets_dir, tmp_path)
+        _, drift = check_assets(mappings, assets_dir, tmp_path)
+
+        # Wordmarks are not generated into tmp_path; only site/ is of interest
+        assert [d for d in fresh if d.path.is_relative_to(site)] == []
+        assert [d.path.name for d in drift if d.path.is_relative_to(site)] == [
+            "logo.svg.gz"
+        ]
@@ -0,0 +1,99 @@
+"""
+Level 1 Unit Tests: Stage profiling and build report.
+
+Tests verify that:
+- A disabled profiler records nothing
+- Nested stages are charged exclusive time and their own allocation peak
+- The build report lists every evaluated file with its size and status
+"""
+
+import time
+from pathlib import Path
+
+# Constants
+SLEEP_SECONDS = 0.02
+ALLOCATION_BYTES = 1_000_000
+MAPPINGS = {
+    "wordmark": [{"source": "wordmark-dark-tight.svg", "dest": "site/logo.svg"}]
+}
+
+
+class TestStageProfiler:
+    """Level 1: Verify stage measurements."""
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        """GIVEN a profiler that was not started WHEN a stage runs THEN no stats."""
+        from assets.generate.profiling import StageProfiler
+
+        profiler = StageProfiler()
+        with profiler.stage("parse"):
+            pass
+
+        assert profiler.stages == {}
+
+    def test_nested_stage_time_is_exclusive(self) -> None:
+        """GIVEN a stage nested in another WHEN both run THEN outer excludes inner."""
+        from assets.generate.profiling import StageProfiler
+
+        profiler = StageProfiler()
+        profiler.start()
+        with profiler.stage("outer"), profiler.stage("inner"):
+            time.sleep(SLEEP_SECONDS)
+        profiler.stop()
+
+        assert profiler.stages["inner"].seconds >= SLEEP_SECONDS
+        assert profiler.stages["outer"].seconds < SLEEP_SECONDS
+        assert profiler.total_seconds >= SLEEP_SECONDS
+
+    def test_allocation_peak_is_recorded(self) -> None:
+        """GIVEN a stage that allocates a buffer WHEN profiled THEN its peak covers it."""
+        from assets.generate.profiling import StageProfiler
+
+        profiler = StageProfiler()
+        profiler.start()
+        with profiler.stage("alloc"):
+            buffer = bytearray(ALLOCATION_BYTES)
+            del buffer
+        with profiler.stage("idle"):
+            pass
+        profiler.stop()
+
+        assert profiler.stages["alloc"].peak_bytes >= ALLOCATION_BYTES
+        assert profiler.stages["idle"].peak_bytes < ALLOCATION_BYTES
+
+
+class TestBuildReport:
+    """Level 1: Verify the JSON build report."""
+
+    def test_report_lists_evaluated_files(self, tmp_path: Path) -> None:
+        """GIVEN a built tree WHEN reported THEN files carry bytes, status and time."""
+        from assets.generate.generate_logos import (
+            build_asset_graph,
+            build_report,
+            is_file_node,
+        )
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.profiling import StageProfiler
+        from assets.generate.writeset import WriteSet
+
+        assets_dir = tmp_path / "assets"
+        manifest = BuildManifest(tmp_path / "lock.yaml", assets_dir)
+        writes = WriteSet()
+        graph = build_asset_graph(MAPPINGS, assets_dir, tmp_path, manifest, writes)
+        profiler = StageProfiler()
+        profiler.start()
+        run = graph.run([name for name in graph.nodes if is_file_node(name)])
+        profiler.stop()
+        writes.commit(sync=False)
+
+        report = build_report(run, profiler)
+
+        files = {f["path"]: f for f in report["files"]}
+        assert len(files) == 9
+        assert files["site/logo.svg"]["kind"] == "deployed"
+        generated = files["assets/wordmark/wordmark-dark-tight.svg"]
+        assert generated["status"] == "rebuilt"
+        assert generated["bytes"] == len(
+            (assets_dir / "wordmark" / "wordmark-dark-tight.svg").read_bytes()
+        )
+        assert generated["seconds"] >= 0
@@ -0,0 +1,331 @@
+"""
+Level 1 Unit Tests: Rasterizer and PNG export.
+
+Tests verify that:
+- Coverage is exact for pixel-aligned and half-pixel edges
+- Filling follows the nonzero rule, and open subpaths are closed
+- Scenes are parsed from the generator's SVGs; CSS-styled ones are rejected
+- Every PNG filter round-trips through a reference decoder
+- The icon PNG export is built, and checked, with the other assets
+- Cached renders are reused without parsing, and fresh exports seed the cache
+- Checking takes exports the manifest says are fresh from disk, unrendered
+"""
+
+import base64
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+# Constants
+SQUARE = "M 2 2 L 6 2 L 6 6 L 2 6 Z"
+ICON_SOURCE = Path(__file__).parents[2] / "assets" / "icon" / "icon-rounded-tight.svg"
+PNG_EXPORTS = {"icon/icon-rounded-tight.svg": [[64, 64]]}
+EXPORT_SOURCE = "icon/icon-rounded-tight.svg"
+
+
+def scene_of(*paths: str):
+    """Scene of black paths in an 8x8 viewBox."""
+    from assets.generate.raster import parse_svg_scene
+
+    elements = "".join(f'<path d="{d}" fill="#000"/>' for d in paths)
+    return parse_svg_scene(
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 8">{elements}</svg>'
+    )
+
+
+def decode_png(data: bytes):
+    """Reference decoder for non-interlaced PNGs up to 8 bits (per the PNG spec).
+
+    Palette images are expanded to RGB, or RGBA when they have a tRNS chunk.
+    """
+    import numpy as np
+
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks, offset = {}, 8
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        kind = data[offset + 4 : offset + 8]
+        body = data[offset + 8 : offset + 8 + length]
+        (crc,) = struct.unpack(">I", data[offset + 8 + length : offset + 12 + length])
+        assert crc == zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b"") + body
+        offset += 12 + length
+
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert depth == 8 or (color_type == 3 and depth in (1, 2, 4))
+    channels = {0: 1, 3: 1, 4: 2, 2: 3, 6: 4}[color_type]
+    raw = zlib.decompress(chunks[b"IDAT"])
+    stride = (width * channels * depth + 7) // 8
+    bpp = max(1, channels * depth // 8)
+    rows: list[bytearray] = []
+    prior = bytearray(stride)
+    for y in range(height):
+        filter_type = raw[y * (stride + 1)]
+        line = bytearray(raw[y * (stride + 1) + 1 : (y + 1) * (stride + 1)])
+        for i in range(stride):
+            a = line[i - bpp] if i >= bpp else 0
+            b = prior[i]
+            c = prior[i - bpp] if i >= bpp else 0
+            if filter_type == 1:
+                line[i] = (line[i] + a) & 0xFF
+            elif filter_type == 2:
+                line[i] = (line[i] + b) & 0xFF
+            elif filter_type == 3:
+                line[i] = (line[i] + (a + b) // 2) & 0xFF
+            elif filter_type == 4:
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                pred = a if pa <= pb and pa <= pc else b if pb <= pc else c
+                line[i] = (line[i] + pred) & 0xFF
+        rows.append(line)
+        prior = line
+    if color_type != 3:
+        return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(
+            height, width, channels
+        )
+
+    palette = [
+        list(chunks[b"PLTE"][i : i + 3]) for i in range(0, len(chunks[b"PLTE"]), 3)
+    ]
+    if b"tRNS" in chunks:
+        alpha = list(chunks[b"tRNS"]) + [255] * len(palette)
+        palette = [[*rgb, alpha[i]] for i, rgb in enumerate(palette)]
+    pixels = []
+    for line in rows:
+        bits = "".join(f"{byte:08b}" for byte in line)
+        for x in range(width):
+            pixels.append(palette[int(bits[x * depth : (x + 1) * depth], 2)])
+    return np.array(pixels, dtype=np.uint8).reshape(height, width, -1)
+
+
+class TestCoverage:
+    """Level 1: Verify anti-aliased nonzero coverage."""
+
+    def test_pixel_aligned_square(self) -> None:
+        """GIVEN a square on pixel edges WHEN rendered THEN fully opaque inside only."""
+        from assets.generate.raster import render
+
+        alpha = render(scene_of(SQUARE), 8)[..., 3]
+
+        assert (alpha[2:6, 2:6] == 255).all()
+        assert alpha.sum() == 16 * 255
+
+    def test_half_pixel_edges_are_half_covered(self) -> None:
+        """GIVEN a square offset by half a pixel WHEN rendered THEN edges half covered."""
+        from assets.generate.raster import render
+
+        alpha = render(scene_of("M 2.5 2 L 6.5 2 L 6.5 6 L 2.5 6 Z"), 8)[..., 3]
+
+        assert alpha[3, 2] == alpha[3, 6] == 128
+        assert alpha[3, 3] == 255
+
+    def test_nonzero_rule(self) -> None:
+        """GIVEN overlapping and counter-wound contours WHEN filled THEN nonzero rule."""
+        from assets.generate.raster import render
+
+        same_direction = "M 2 2 L 6 2 L 6 6 L 2 6 Z M 3 3 L 5 3 L 5 5 L 3 5 Z"
+        hole = "M 2 2 L 6 2 L 6 6 L 2 6 Z M 3 3 L 3 5 L 5 5 L 5 3 Z"
+
+        assert render(scene_of(same_direction), 8)[4, 4, 3] == 255
+        assert render(scene_of(hole), 8)[4, 4, 3] == 0
+
+    def test_open_subpath_is_closed(self) -> None:
+        """GIVEN a subpath without Z WHEN filled THEN same as the closed one."""
+        from assets.generate.raster import render
+
+        open_square = "M 2 2 L 6 2 L 6 6 L 2 6"
+
+        assert (render(scene_of(open_square), 8) == render(scene_of(SQUARE), 8)).all()
+
+    def test_viewbox_scaled_to_size(self) -> None:
+        """GIVEN a 2x-sized render WHEN measured THEN coverage area scales by 4."""
+        from assets.generate.raster import render
+
+        alpha = render(scene_of("M 0 0 L 8 0 L 0 8 Z"), 16)[..., 3]
+
+        assert alpha.sum() / 255 == pytest.approx(128, abs=0.5)
+
+
+class TestSvgScene:
+    """Level 1: Verify parsing of generator SVGs."""
+
+    def test_rounded_rect_corners_transparent(self) -> None:
+        """GIVEN the icon WHEN rendered THEN corners clear, background opaque."""
+        from assets.generate.raster import parse_svg_scene, render
+
+        pixels = render(parse_svg_scene(ICON_SOURCE.read_text()), 64)
+
+        assert pixels[0, 0, 3] == 0
+        assert tuple(pixels[1, 32]) == (0x0C, 0x0A, 0x09, 255)
+
+    def test_css_styled_svg_rejected(self) -> None:
+        """GIVEN the adaptive wordmark WHEN parsed THEN ValueError (needs CSS)."""
+        from assets.generate.generate_logos import render_wordmark, wordmark_layout
+        from assets.generate.raster import parse_svg_scene
+
+        svg = render_wordmark("adaptive", wordmark_layout())
+
+        with pytest.raises(ValueError, match="style"):
+            parse_svg_scene(svg)
+
+
+class TestPngEncoder:
+    """Level 1: Verify PNG encoding."""
+
+    @pytest.mark.parametrize("filter_type", [None, 0, 1, 2, 3, 4])
+    @pytest.mark.parametrize("channels", [1, 3, 4])
+    def test_round_trip(self, filter_type: int | None, channels: int) -> None:
+        """GIVEN random pixels WHEN encoded with a filter THEN decode to the same."""
+        import numpy as np
+
+        from assets.generate.png import encode_png
+
+        pixels = np.random.default_rng(7).integers(
+            0, 256, (5, 7, channels), dtype=np.uint8
+        )
+
+        decoded = decode_png(encode_png(pixels, filter_type=filter_type))
+
+        assert (decoded == pixels).all()
+
+    def test_rejects_non_uint8(self) -> None:
+        """GIVEN float pixels WHEN encoded THEN ValueError."""
+        import numpy as np
+
+        from assets.generate.png import encode_png
+
+        with pytest.raises(ValueError, match="uint8"):
+            encode_png(np.zeros((2, 2, 4)))
+
+
+class TestPngExport:
+    """Level 1: Verify PNG exports in the build graph."""
+
+    def test_export_built_and_checked(self, tmp_path: Path) -> None:
+        """GIVEN an icon source WHEN built THEN its PNG is written and up to date."""
+        from assets.generate.generate_logos import (
+            build_asset_graph,
+            check_assets,
+            is_file_node,
+        )
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.writeset import WriteSet
+
+        assets_dir = tmp_path / "assets"
+        (assets_dir / "icon").mkdir(parents=True)
+        (assets_dir / "icon" / ICON_SOURCE.name).write_bytes(ICON_SOURCE.read_bytes())
+        manifest = BuildManifest(tmp_path / "lock.yaml", assets_dir)
+        writes = WriteSet()
+        graph = build_asset_graph(
+            {}, assets_dir, tmp_path, manifest, writes, png_exports=PNG_EXPORTS
+        )
+        graph.run([name for name in graph.nodes if is_file_node(name)])
+        writes.commit(sync=False)
+
+        png = assets_dir / "icon" / "icon-rounded-tight_64x64.png"
+        assert decode_png(png.read_bytes()).shape == (64, 64, 4)
+        _, drift = check_assets({}, assets_dir, tmp_path, PNG_EXPORTS)
+        assert drift == []
+
+    def test_cached_render_not_parsed_again(self, tmp_path: Path) -> None:
+        """GIVEN a rendered size WHEN a new graph renders it THEN the scene is not parsed."""
+        from assets.generate.generate_logos import add_render_node
+        from assets.generate.graph import BuildGraph
+
+        (tmp_path / "icon").mkdir()
+        (tmp_path / EXPORT_SOURCE).write_bytes(ICON_SOURCE.read_bytes())
+        first, second = BuildGraph(), BuildGraph()
+        node = add_render_node(first, EXPORT_SOURCE, 64, 64, tmp_path)
+        add_render_node(second, EXPORT_SOURCE, 64, 64, tmp_path)
+
+        rendered = first.run([node]).values[node]
+        run = second.run([node])
+
+        assert run.values[node] == rendered
+        assert set(run.evaluated) == {f"source:{EXPORT_SOURCE}", node}
+
+    def test_fresh_export_seeds_cache(self, tmp_path: Path) -> None:
+        """GIVEN a built export and an empty cache WHEN built again THEN cached from disk."""
+        from assets.generate.generate_logos import (
+            RENDER_CACHE,
+            build_asset_graph,
+            is_file_node,
+            render_key,
+        )
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.writeset import WriteSet
+
+        assets_dir = tmp_path / "assets"
+        source = assets_dir / EXPORT_SOURCE
+        source.parent.mkdir(parents=True)
+        source.write_bytes(ICON_SOURCE.read_bytes())
+        manifest = BuildManifest(tmp_path / "lock.yaml", assets_dir)
+        for _ in range(2):
+            RENDER_CACHE.clear()
+            writes = WriteSet()
+            graph = build_asset_graph(
+                {}, assets_dir, tmp_path, manifest, writes, png_exports=PNG_EXPORTS
+            )
+            graph.run([name for name in graph.nodes if is_file_node(name)])
+            writes.commit(sync=False)
+
+        node = f"render:{EXPORT_SOURCE}@64x64"
+        png = assets_dir / "icon" / "icon-rounded-tight_64x64.png"
+        cached = RENDER_CACHE.get(render_key(source.read_text(), node))
+        assert cached is not None
+        assert base64.b64decode(cached) == png.read_bytes()
+
+    def test_check_reads_fresh_export(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GIVEN a built export WHEN checked THEN it is rendered only once edited."""
+        from assets.generate import generate_logos
+        from assets.generate.generate_logos import (
+            RENDER_CACHE,
+            build_asset_graph,
+            expected_assets,
+            find_drift,
+            is_file_node,
+        )
+        from assets.generate.manifest import BuildManifest
+        from assets.generate.writeset import WriteSet
+
+        assets_dir = tmp_path / "assets"
+        source = assets_dir / EXPORT_SOURCE
+        source.parent.mkdir(parents=True)
+        source.write_bytes(ICON_SOURCE.read_bytes())
+        manifest = BuildManifest(tmp_path / "lock.yaml", assets_dir)
+        writes = WriteSet()
+        graph = build_asset_graph(
+            {}, assets_dir, tmp_path, manifest, writes, png_exports=PNG_EXPORTS
+        )
+        graph.run([name for name in graph.nodes if is_file_node(name)])
+        writes.commit(sync=False)
+        RENDER_CACHE.clear()
+        rendered = []
+        render_png = generate_logos.render_png
+        monkeypatch.setattr(
+            generate_logos,
+            "render_png",
+            lambda *args, **kwargs: (
+                rendered.append(args) or render_png(*args, **kwargs)
+            ),
+        )
+        png = assets_dir / "icon" / "icon-rounded-tight_64x64.png"
+
+        fresh = expected_assets({}, assets_dir, tmp_path, PNG_EXPORTS, None, manifest)
+        png.write_bytes(b"edited")
+        edited = expected_assets({}, assets_dir, tmp_path, PNG_EXPORTS, None, manifest)
+
+        assert fresh[png] == edited[png] != b"edited"
+        assert len(rendered) == 1
+        assert [d.path for d in find_drift(edited)] == [png]
+
+    def test_missing_source_rejected(self, tmp_path: Path) -> None:
+        """GIVEN an export of a missing SVG WHEN the graph is built THEN error."""
+        from assets.generate.generate_logos import check_assets
+
+        with pytest.raises(FileNotFoundError, match="Raster source"):
+            check_assets({}, tmp_path / "assets", tmp_path, PNG_EXPORTS)
@@ -0,0 +1,140 @@
+"""
+Level 1 Unit Tests: Shared shapes via <defs> and <use>.
+
+Tests verify that:
+- Paths equal up to translation are grouped, within the given tolerance
+- Each group is emitted once in <defs> and placed with <use x y>
+- Wordmarks share only shapes that match within the configured tolerance,
+  drawing them with <use>
+- The rasterizer places <use> shapes like the paths they replace
+"""
+
+import pytest
+
+# Constants
+SQUARE = "M 0 0 L 2 0 L 2 2 Z"
+PATHS = {
+    "a": SQUARE,
+    "b": "M 0 0 L 1 0 L 1 1 Z",
+    "c": "M 5 3 L 7 3 L 7 5 Z",
+    "d": "M 9 9 L 11.05 9 L 11 11 Z",
+}
+# Wide enough to match the wordmark's drawn p2/t2 to p/t, and the icon's
+# a/g to the text's
+LOOSE_TOLERANCE = 0.15
+WORDMARK_GROUPS = [("icon_a", "a"), ("icon_g", "g"), ("p", "p2"), ("t", "t2")]
+
+
+class TestTranslationGroups:
+    """Level 1: Verify translation-equivalence detection."""
+
+    def test_translated_copies_grouped(self) -> None:
+        """GIVEN a square and a moved copy WHEN grouped THEN one group."""
+        from assets.generate.affine import GeometryBatch
+
+        batch = GeometryBatch.from_paths(PATHS)
+
+        assert batch.translation_groups(0.01) == [("a", "c")]
+
+    def test_tolerance_widens_groups(self) -> None:
+        """GIVEN a copy 0.05 off WHEN grouped at 0.1 THEN it joins the group."""
+        from assets.generate.affine import GeometryBatch
+
+        batch = GeometryBatch.from_paths(PATHS)
+
+        assert batch.translation_groups(0.1) == [("a", "c", "d")]
+
+    def test_different_commands_not_grouped(self) -> None:
+        """GIVEN equal points under different commands WHEN grouped THEN none."""
+        from assets.generate.affine import GeometryBatch
+
+        batch = GeometryBatch.from_paths({"a": SQUARE, "b": "M 0 0 Q 2 0 2 2 Z"})
+
+        assert batch.translation_groups(0.01) == []
+
+    def test_wordmark_letters_match_only_loosely(self) -> None:
+        """GIVEN the wordmark geometry WHEN grouped THEN only a loose tolerance matches."""
+        from assets.generate.generate_logos import get_geometry
+
+        geometry = get_geometry()
+
+        assert geometry.translation_groups(0.01) == []
+        assert sorted(geometry.translation_groups(LOOSE_TOLERANCE)) == WORDMARK_GROUPS
+
+
+class TestSharedShapes:
+    """Level 1: Verify <defs>/<use> output."""
+
+    def test_shapes_at_origin_and_uses_at_start(self) -> None:
+        """GIVEN layout paths WHEN shared THEN shape at 0,0, uses at start points."""
+        from assets.generate.generate_logos import share_shapes, wordmark_layout
+
+        layout = wordmark_layout(tight=True)
+
+        shapes, uses = share_shapes(layout.paths, LOOSE_TOLERANCE, 2)
+
+        assert set(shapes) == {group[0] for group in WORDMARK_GROUPS}
+        assert all(d.startswith("M0 0") for d in shapes.values())
+        assert uses["p2"][0] == "p"
+        assert layout.paths["p2"].startswith(f"M{uses['p2'][1]:g} {uses['p2'][2]:g}")
+
+    def test_no_tolerance_shares_nothing(self) -> None:
+        """GIVEN tolerance None WHEN shared THEN no shapes."""
+        from assets.generate.generate_logos import share_shapes, wordmark_layout
+
+        assert share_shapes(wordmark_layout().paths, None) == ({}, {})
+
+    @pytest.mark.parametrize("variant", ["dark", "adaptive"])
+    def test_wordmark_draws_shapes_once(
+        self, variant: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GIVEN a loose tolerance WHEN a wordmark is generated THEN four shapes, eight uses."""
+        from assets.generate.generate_logos import CONFIG, generate_wordmark
+
+        monkeypatch.setitem(CONFIG["svg"], "dedup_tolerance", LOOSE_TOLERANCE)
+
+        svg = generate_wordmark(variant, tight=True)
+
+        defs = svg[svg.index("<defs>") : svg.index("</defs>")]
+        assert defs.count("<path") == 4
+        assert svg.count('<use href="#wordmark-') == 8
+
+    def test_distinct_letters_drawn_as_paths(self) -> None:
+        """GIVEN the default config WHEN a wordmark is generated THEN no <use>."""
+        from assets.generate.generate_logos import generate_wordmark
+
+        svg = generate_wordmark("dark", tight=True)
+
+        assert "<defs>" not in svg
+        assert "<use" not in svg
+
+
+class TestRasterUse:
+    """Level 1: Verify the rasterizer resolves <use>."""
+
+    def test_use_matches_path(self) -> None:
+        """GIVEN a used shape WHEN rendered THEN same pixels as the moved path."""
+        from assets.generate.raster import parse_svg_scene, render
+
+        svg = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 8">{}</svg>'
+        used = svg.format(
+            f'<defs><path id="s" d="{SQUARE}"/></defs>'
+            '<use href="#s" x="5" y="3" fill="#000"/>'
+        )
+        direct = svg.format(f'<path d="{PATHS["c"]}" fill="#000"/>')
+
+        assert (
+            render(parse_svg_scene(used), 8) == render(parse_svg_scene(direct), 8)
+        ).all()
+
+    def test_unknown_shape_rejected(self) -> None:
+        """GIVEN a <use> of a missing id WHEN parsed THEN ValueError."""
+        from assets.generate.raster import parse_svg_scene
+
+        svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 8">'
+            '<use href="#missing"/></svg>'
+        )
+
+        with pytest.raises(ValueError, match="unknown shape"):
+            parse_svg_scene(svg)
@@ -0,0 +1,97 @@
+"""
+Level 1 Unit Tests: Single-layer, CSS-themed wordmark.
+
+Tests verify that:
+- Every glyph is emitted exactly once, without opacity-hidden copies
+- Role fills come from --wordmark-* custom properties with palette fallbacks
+- prefers-color-scheme rules only cover roles whose color changes
+- The adaptive wordmark is the dark palette, switched to the light one
+"""
+
+import re
+
+# Constants
+CUSTOM_PALETTE = {
+    "bg": "#000000",
+    "icon_ag": "#111111",
+    "prompt": "#222222",
+    "accent": "#333333",
+}
+
+
+class TestRenderThemedWordmark:
+    """Level 1: Verify the single-layer renderer."""
+
+    def test_each_glyph_once(self) -> None:
+        """GIVEN the adaptive wordmark WHEN rendered THEN one path per glyph."""
+        from assets.generate.generate_logos import render_wordmark, wordmark_layout
+
+        layout = wordmark_layout()
+
+        svg = render_wordmark("adaptive", layout)
+
+        body = svg.split("</defs>")[-1]
+        assert body.count("<path") + body.count("<use") == len(layout.paths)
+        assert svg.count("<rect") == 1
+        assert "opacity" not in svg
+
+    def test_fills_from_custom_properties(self) -> None:
+        """GIVEN a palette WHEN rendered THEN each role reads its custom property."""
+        from assets.generate.generate_logos import (
+            render_themed_wordmark,
+            wordmark_layout,
+        )
+
+        svg = render_themed_wordmark(wordmark_layout(), CUSTOM_PALETTE)
+
+        assert ".icon-ag { fill: var(--wordmark-icon-ag, #111111); }" in svg
+        assert len(re.findall(r"fill: var\(--wordmark-", svg)) == 4
+        assert "@media" not in svg
+
+    def test_dark_scheme_rules_only_for_changed_roles(self) -> None:
+        """GIVEN a dark palette changing one role WHEN rendered THEN one rule."""
+        from assets.generate.generate_logos import (
+            render_themed_wordmark,
+            wordmark_layout,
+        )
+
+        dark = {**CUSTOM_PALETTE, "bg": "#ffffff"}
+
+        svg = render_themed_wordmark(wordmark_layout(), CUSTOM_PALETTE, dark)
+
+        media = svg[svg.index("@media (prefers-color-scheme: dark)") :]
+        assert media.count("fill:") == 1
+        assert ".bg { fill: var(--wordmark-bg, #ffffff); }" in media
+
+
+class TestAdaptiveWordmark:
+    """Level 1: Verify the adaptive wordmark colors."""
+
+    def test_dark_palette_switched_to_light(self) -> None:
+        """GIVEN the adaptive wordmark WHEN rendered THEN dark, then light colors."""
+        from assets.generate.generate_logos import (
+            WORDMARK_ROLES,
+            render_wordmark,
+            wordmark_layout,
+            wordmark_palette,
+        )
+
+        svg = render_wordmark("adaptive", wordmark_layout(tight=True))
+
+        default, dark_scheme = svg.split("@media")
+        dark, light = wordmark_palette("dark"), wordmark_palette("light")
+        for role in WORDMARK_ROLES:
+            name = role.replace("_", "-")
+            prefix = f".{name} {{ fill: var(--wordmark-{name}, "
+            assert f"{prefix}{dark[role]}); }}" in default
+            if light[role] != dark[role]:
+                assert f"{prefix}{light[role]}); }}" in dark_scheme
+
+    def test_smaller_than_fixed_variants_combined(self) -> None:
+        """GIVEN the tight layout WHEN rendered THEN adaptive ~ one fixed variant."""
+        from assets.generate.generate_logos import generate_wordmark
+
+        adaptive = generate_wordmark("adaptive", tight=True)
+        dark = generate_wordmark("dark", tight=True)
+
+        assert len(adaptive) < 1.1 * len(dark)
@@ -0,0 +1,133 @@
+"""
+Level 1 Unit Tests: Two-level transform cache.
+
+Tests verify that TransformCache:
+- Counts memory hits, disk hits and misses
+- Evicts least recently used entries past its capacity
+- Persists entries across instances and trims the directory to its budget
+- Leaves the directory untouched when read-only
+"""
+
+import os
+from pathlib import Path
+
+# Constants
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+SHIFT = (1.0, 0.0, 0.0, 1.0, 5.0, 5.0)
+SQUARE_PATH = "M 0 0 L 10 0 L 10 10 L 0 10 Z"
+
+
+class TestTransformKey:
+    """Level 1: Verify keys capture every input of a transform."""
+
+    def test_key_differs_by_matrix_and_precision(self) -> None:
+        """GIVEN one path WHEN keyed with other params THEN keys differ."""
+        from assets.generate.cache import transform_key
+
+        base = transform_key(SQUARE_PATH, IDENTITY)
+
+        assert transform_key(SQUARE_PATH, IDENTITY) == base
+        assert transform_key(SQUARE_PATH, SHIFT) != base
+        assert transform_key(SQUARE_PATH, IDENTITY, precision=2) != base
+
+
+class TestInProcessLru:
+    """Level 1: Verify the bounded in-memory layer."""
+
+    def test_counts_hits_and_misses(self) -> None:
+        """GIVEN an empty cache WHEN get, put, get THEN one miss and one hit."""
+        from assets.generate.cache import TransformCache
+
+        cache = TransformCache()
+
+        assert cache.get("k") is None
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """GIVEN a full cache WHEN a new key is added THEN the LRU key is dropped."""
+        from assets.generate.cache import TransformCache
+
+        cache = TransformCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+
+class TestPersistentStore:
+    """Level 1: Verify the content-addressed cache directory."""
+
+    def test_entries_survive_new_instance(self, tmp_path: Path) -> None:
+        """GIVEN a value stored on disk WHEN a new cache reads it THEN disk hit."""
+        from assets.generate.cache import TransformCache, transform_key
+
+        key = transform_key(SQUARE_PATH, SHIFT)
+        TransformCache(cache_dir=tmp_path).put(key, "M 5.0,5.0")
+
+        fresh = TransformCache(cache_dir=tmp_path)
+
+        assert fresh.get(key) == "M 5.0,5.0"
+        assert fresh.stats.disk_hits == 1
+
+    def test_directory_trimmed_to_budget(self, tmp_path: Path) -> None:
+        """GIVEN a small byte budget WHEN many entries written THEN size stays bounded."""
+        from assets.generate.cache import TransformCache, transform_key
+
+        cache = TransformCache(cache_dir=tmp_path, max_disk_bytes=1000)
+
+        for i in range(50):
+            cache.put(transform_key(f"M {i} 0", IDENTITY), "x" * 100)
+
+        total = sum(p.stat().st_size for p in tmp_path.rglob("*.d"))
+        assert total <= 1000
+
+    def test_read_only_cache_leaves_directory_alone(self, tmp_path: Path) -> None:
+        """GIVEN a read-only cache WHEN read and stored THEN nothing on disk changes."""
+        from assets.generate.cache import TransformCache, transform_key
+
+        key = transform_key(SQUARE_PATH, SHIFT)
+        TransformCache(cache_dir=tmp_path).put(key, "M 5.0,5.0")
+        (entry,) = tmp_path.rglob("*.d")
+        os.utime(entry, (0, 0))
+        cache = TransformCache(cache_dir=tmp_path, read_only=True)
+
+        assert cache.get(key) == "M 5.0,5.0"
+        cache.put(transform_key(SQUARE_PATH, IDENTITY), "M 0.0,0.0")
+
+        assert list(tmp_path.rglob("*.d")) == [entry]
+        assert entry.stat().st_mtime == 0
+
+    def test_unusable_directory_skips_disk(self, tmp_path: Path) -> None:
+        """GIVEN a cache dir that cannot be created WHEN stored THEN memory only."""
+        from assets.generate.cache import TransformCache, transform_key
+
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+        cache = TransformCache(cache_dir=blocker / "cache")
+        key = transform_key(SQUARE_PATH, SHIFT)
+
+        cache.put(key, "M 5.0,5.0")
+
+        assert cache.get(key) == "M 5.0,5.0"
+        assert blocker.is_file()
+
+
+class TestGeneratorUsesCache:
+    """Level 1: Verify repeated generator transforms hit the cache."""
+
+    def test_second_tight_wordmark_is_all_hits(self) -> None:
+        """GIVEN a tight wordmark generated once WHEN generated again THEN no misses."""
+        from assets.generate.generate_logos import TRANSFORM_CACHE, generate_wordmark
+
+        generate_wordmark("dark", tight=True)
+        misses = TRANSFORM_CACHE.stats.misses
+
+        generate_wordmark("light", tight=True)
+
+        assert TRANSFORM_CACHE.stats.misses == misses
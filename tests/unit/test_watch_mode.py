@@ -0,0 +1,133 @@
+"""
+Level 1 Unit Tests: --watch mode.
+
+Tests verify that:
+- File watchers report modified and atomically replaced files
+- Bursts of changes are reported once
+- Data-only edits of the generator are told apart from code edits
+"""
+
+import copy
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Constants
+TIMEOUT_SECONDS = 2.0
+SOURCE = """
+CONFIG = {"wordmark": {"tight": {"horizontal_padding": 14}}}
+
+
+def render():
+    return CONFIG
+"""
+
+
+def replace_atomically(path: Path, text: str) -> None:
+    """Save like an editor that writes a new file and renames it over the old."""
+    tmp = path.with_name(path.name + ".swp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+class TestWatchers:
+    """Level 1: Verify change detection."""
+
+    def test_polling_watcher_sees_modification(self, tmp_path: Path) -> None:
+        """GIVEN a polled file WHEN it is rewritten THEN it is reported."""
+        from assets.generate.watch import PollingWatcher
+
+        path = tmp_path / "mappings.yaml"
+        path.write_text("a: 1\n")
+        watcher = PollingWatcher([path], interval=0.01)
+
+        replace_atomically(path, "a: 2\n")
+
+        assert watcher.wait(TIMEOUT_SECONDS) == {path.resolve()}
+        assert watcher.wait(0.05) == set()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+    def test_inotify_watcher_sees_atomic_replace(self, tmp_path: Path) -> None:
+        """GIVEN a watched file WHEN replaced by rename THEN only it is reported."""
+        from assets.generate.watch import InotifyWatcher
+
+        path = tmp_path / "generate_logos.py"
+        path.write_text(SOURCE)
+        watcher = InotifyWatcher([path])
+        try:
+            (tmp_path / "unrelated.txt").write_text("x")
+            replace_atomically(path, SOURCE + "\n")
+
+            assert watcher.wait(TIMEOUT_SECONDS) == {path.resolve()}
+        finally:
+            watcher.close()
+
+    def test_burst_is_reported_once(self) -> None:
+        """GIVEN three quick changes WHEN debounced THEN one merged set is yielded."""
+        from assets.generate.watch import debounced_changes
+
+        class ScriptedWatcher:
+            def __init__(self) -> None:
+                self.events = [{Path("a")}, {Path("b")}, {Path("a")}, set()]
+
+            def wait(self, timeout: float | None = None) -> set[Path]:
+                return self.events.pop(0)
+
+        changes = debounced_changes(ScriptedWatcher(), quiet=0)
+
+        assert next(changes) == {Path("a"), Path("b")}
+
+
+class TestModuleData:
+    """Level 1: Verify data-only edits are applied without a restart."""
+
+    def test_data_edit_keeps_code_dump(self) -> None:
+        """GIVEN a padding edit WHEN read THEN code is unchanged and data is new."""
+        from assets.generate.generate_logos import read_module_data
+
+        data, code = read_module_data(SOURCE)
+        edited, edited_code = read_module_data(SOURCE.replace("14", "15"))
+
+        assert edited_code == code
+        assert data["CONFIG"]["wordmark"]["tight"]["horizontal_padding"] == 14
+        assert edited["CONFIG"]["wordmark"]["tight"]["horizontal_padding"] == 15
+
+    def test_code_edit_changes_code_dump(self) -> None:
+        """GIVEN a function edit WHEN read THEN the code dump differs."""
+        from assets.generate.generate_logos import read_module_data
+
+        _, code = read_module_data(SOURCE)
+        _, edited_code = read_module_data(SOURCE.replace("return CONFIG", "return 1"))
+
+        assert edited_code != code
+
+    def test_generator_source_is_readable(self) -> None:
+        """GIVEN the real generator WHEN read THEN every watched literal is found."""
+        from assets.generate import generate_logos
+        from assets.generate.generate_logos import WATCHED_DATA, read_module_data
+
+        data, _ = read_module_data(Path(generate_logos.__file__).read_text())
+
+        assert set(data) == set(WATCHED_DATA)
+        assert data["CONFIG"] == generate_logos.CONFIG
+
+    def test_apply_replaces_only_changed_globals(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GIVEN an edited CONFIG WHEN applied THEN only CONFIG is replaced."""
+        from assets.generate import generate_logos
+
+        monkeypatch.setattr(
+            generate_logos, "CONFIG", copy.deepcopy(generate_logos.CONFIG)
+        )
+        edited = copy.deepcopy(generate_logos.CONFIG)
+        edited["wordmark"]["tight"]["horizontal_padding"] += 1
+
+        changed = generate_logos.apply_module_data(
+            {"CONFIG": edited, "ICON_PATHS": generate_logos.ICON_PATHS}
+        )
+
+        assert changed == ["CONFIG"]
+        assert generate_logos.CONFIG == edited
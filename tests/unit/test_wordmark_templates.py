@@ -0,0 +1,130 @@
+"""
+Level 1 Unit Tests: Compiled wordmark templates and batch theming.
+
+Tests verify that:
+- A compiled template fills to exactly what render_wordmark() produces
+- Missing slots and missing theme colors raise
+- generate_themes() renders lazily, one theme at a time, from any iterable
+"""
+
+import itertools
+from pathlib import Path
+
+import pytest
+
+# Constants
+FIXED_VARIANTS = ["dark", "light", "white"]
+THEME = {
+    "name": "acme",
+    "bg": "#101010",
+    "icon_ag": "#abcdef",
+    "prompt": "#fedcba",
+    "accent": "#ff0000",
+}
+
+
+class TestSvgTemplate:
+    """Level 1: Verify slot compilation and filling."""
+
+    def test_fill_substitutes_every_occurrence(self) -> None:
+        """GIVEN a slot used twice WHEN filled THEN both occurrences replaced."""
+        from assets.generate.templates import SvgTemplate
+
+        template = SvgTemplate.compile(
+            lambda v: f'<a fill="{v["c"]}"/><b fill="{v["c"]}" width="50%"/>',
+            ["c"],
+        )
+
+        assert template.fill({"c": "red"}) == (
+            '<a fill="red"/><b fill="red" width="50%"/>'
+        )
+
+    def test_unused_slot_rejected(self) -> None:
+        """GIVEN a renderer ignoring a slot WHEN compiled THEN ValueError."""
+        from assets.generate.templates import SvgTemplate
+
+        with pytest.raises(ValueError, match="'unused'"):
+            SvgTemplate.compile(lambda v: f"<a {v['c']}/>", ["c", "unused"])
+
+    def test_missing_value_raises(self) -> None:
+        """GIVEN a template WHEN filled without a slot value THEN KeyError."""
+        from assets.generate.templates import SvgTemplate
+
+        template = SvgTemplate.compile(lambda v: f"<a {v['c']}/>", ["c"])
+
+        with pytest.raises(KeyError):
+            template.fill({})
+
+
+class TestWordmarkTemplate:
+    """Level 1: Verify templates reproduce the rendered wordmarks."""
+
+    @pytest.mark.parametrize("tight", [False, True])
+    @pytest.mark.parametrize("variant", FIXED_VARIANTS)
+    def test_template_matches_render(self, variant: str, tight: bool) -> None:
+        """GIVEN a fixed variant WHEN filled from the template THEN identical SVG."""
+        from assets.generate.generate_logos import (
+            compile_wordmark_template,
+            render_wordmark,
+            wordmark_layout,
+            wordmark_palette,
+        )
+
+        layout = wordmark_layout(tight)
+        template = compile_wordmark_template(layout)
+
+        result = template.fill(wordmark_palette(variant))
+
+        assert result == render_wordmark(variant, layout)
+
+
+class TestGenerateThemes:
+    """Level 1: Verify batch theming."""
+
+    def test_theme_colors_applied(self) -> None:
+        """GIVEN a theme WHEN rendered THEN its colors appear, extra keys ignored."""
+        from assets.generate.generate_logos import generate_themes
+
+        (svg,) = generate_themes([THEME])
+
+        assert 'fill="#101010"' in svg
+        assert 'fill="#ff0000"' in svg
+        assert "acme" not in svg
+
+    def test_themes_consumed_lazily(self) -> None:
+        """GIVEN an endless stream of themes WHEN two taken THEN only two rendered."""
+        from assets.generate.generate_logos import generate_themes
+
+        svgs = list(itertools.islice(generate_themes(itertools.repeat(THEME)), 2))
+
+        assert len(svgs) == 2
+        assert svgs[0] == svgs[1]
+
+    def test_themes_streamed_from_yaml(self, tmp_path: Path) -> None:
+        """GIVEN a multi-document YAML file WHEN streamed THEN one SVG per document."""
+        from assets.generate.generate_logos import generate_themes
+        from assets.generate.yamlcache import iter_yaml_documents
+
+        themes_file = tmp_path / "themes.yaml"
+        themes_file.write_text(
+            "".join(
+                f"---\nname: c{i}\nbg: '#00000{i}'\nicon_ag: '#fff'\n"
+                "prompt: '#eee'\naccent: '#f90'\n"
+                for i in range(3)
+            )
+        )
+
+        svgs = list(generate_themes(iter_yaml_documents(themes_file), tight=True))
+
+        assert len(svgs) == 3
+        for i, svg in enumerate(svgs):
+            assert f'fill="#00000{i}"' in svg
+
+    def test_missing_role_raises(self) -> None:
+        """GIVEN a theme without an accent color WHEN rendered THEN KeyError."""
+        from assets.generate.generate_logos import generate_themes
+
+        theme = {k: v for k, v in THEME.items() if k != "accent"}
+
+        with pytest.raises(KeyError, match="accent"):
+            list(generate_themes([theme]))